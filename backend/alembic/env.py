@@ -30,6 +30,13 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """마이그레이션으로 직접 관리하는 FTS5 가상 테이블(및 내부 shadow 테이블)은 autogenerate에서 제외."""
+    if type_ == "table" and name.startswith("policies_fts"):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -40,6 +47,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=settings.DATABASE_URL,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -51,7 +59,9 @@ def run_migrations_offline() -> None:
 def do_run_migrations(connection):
     # compare_type=False: SQLite는 타입 어피니티만 가지므로 TEXT vs String 등의
     # 타입 차이를 autogenerate 드리프트로 감지하지 않도록 함
-    context.configure(connection=connection, target_metadata=target_metadata, compare_type=False)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object, compare_type=False
+    )
 
     with context.begin_transaction():
         context.run_migrations()
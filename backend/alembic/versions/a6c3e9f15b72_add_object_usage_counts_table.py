@@ -0,0 +1,114 @@
+"""add object_usage_counts table
+
+객체 사용 횟수 API가 요청마다 정책 전체를 집계하지 않도록 장비별 이름 참조 횟수
+(직접 참조 policy_count, 그룹 경유 group_policy_count)를 저장한다. 기존 장비는
+policy_tokens와 현재 그룹 구성으로 업그레이드 시 채우고, 이후에는 동기화·인덱싱이
+변경된 정책과 그룹에 관련된 이름만 갱신한다.
+
+Revision ID: a6c3e9f15b72
+Revises: f3b8d1e6a457
+Create Date: 2026-10-17 20:14:37.902145
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3e9f15b72'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d1e6a457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# member_type → (참조 정책 필드, 그룹 테이블)
+_KINDS = {
+    "address": (("source", "destination"), "network_groups"),
+    "service": (("service",), "service_groups"),
+}
+
+
+def _backfill_rows(bind, device_id, member_type):
+    """app.services.object_usage.refresh_object_usage의 전체 계산과 같은 규칙으로 집계 행을 만든다."""
+    fields, group_table = _KINDS[member_type]
+    refs = defaultdict(list)
+    result = bind.execute(
+        sa.text(
+            "SELECT token, policy_id FROM policy_tokens "
+            f"WHERE device_id = :device_id AND field IN ({', '.join(repr(f) for f in fields)})"
+        ),
+        {"device_id": device_id},
+    )
+    for token, policy_id in result:
+        refs[token].append(policy_id)
+
+    group_map = {}
+    parents = defaultdict(set)
+    result = bind.execute(
+        sa.text(f"SELECT name, members FROM {group_table} WHERE device_id = :device_id"),
+        {"device_id": device_id},
+    )
+    for name, members in result:
+        group_map[name] = [m.strip() for m in (members or "").split(',') if m.strip()]
+        for member in group_map[name]:
+            parents[member].add(name)
+
+    # 참조된 이름과 그 하위 멤버 전체
+    targets, stack = set(), list(refs)
+    while stack:
+        name = stack.pop()
+        if name not in targets:
+            targets.add(name)
+            stack.extend(group_map.get(name, ()))
+
+    rows = []
+    for name in targets:
+        ancestors, stack = set(), list(parents.get(name, ()))
+        while stack:
+            parent = stack.pop()
+            if parent not in ancestors:
+                ancestors.add(parent)
+                stack.extend(parents.get(parent, ()))
+        ancestors.discard(name)
+        via_group = set()
+        for group_name in ancestors:
+            via_group.update(refs.get(group_name, ()))
+        direct = len(refs.get(name, ()))
+        if direct or via_group:
+            rows.append({
+                "device_id": device_id, "member_type": member_type, "name": name,
+                "policy_count": direct, "group_policy_count": len(via_group),
+            })
+    return rows
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    object_usage_counts = op.create_table(
+        'object_usage_counts',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('device_id', sa.Integer(), sa.ForeignKey('devices.id'), nullable=False),
+        sa.Column('member_type', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('policy_count', sa.Integer(), nullable=False),
+        sa.Column('group_policy_count', sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        'ix_object_usage_counts_lookup', 'object_usage_counts', ['device_id', 'member_type', 'name']
+    )
+
+    bind = op.get_bind()
+    device_ids = [row[0] for row in bind.execute(sa.text("SELECT DISTINCT device_id FROM policy_tokens"))]
+    for device_id in device_ids:
+        for member_type in _KINDS:
+            rows = _backfill_rows(bind, device_id, member_type)
+            if rows:
+                op.bulk_insert(object_usage_counts, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_object_usage_counts_lookup', table_name='object_usage_counts')
+    op.drop_table('object_usage_counts')
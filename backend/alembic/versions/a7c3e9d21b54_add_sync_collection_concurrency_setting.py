@@ -0,0 +1,34 @@
+"""add sync_collection_concurrency setting
+
+장비 1대의 동기화 수집 단계에서 동시에 실행할 export 수(fan-out)를 설정으로
+관리한다. Collector가 동시 호출을 지원하지 않는 벤더는 이 값과 무관하게 순차 수집한다.
+
+Revision ID: a7c3e9d21b54
+Revises: e4a1c7b93f20
+Create Date: 2026-10-17 14:05:12.371846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9d21b54'
+down_revision: Union[str, Sequence[str], None] = 'e4a1c7b93f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        INSERT INTO settings (key, value, description)
+        SELECT 'sync_collection_concurrency', '3', '장비별 수집 병렬 개수 (한 장비의 객체/정책 수집을 동시에 실행할 개수, 1이면 순차)'
+        WHERE NOT EXISTS (SELECT 1 FROM settings WHERE key = 'sync_collection_concurrency')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM settings WHERE key = 'sync_collection_concurrency'")
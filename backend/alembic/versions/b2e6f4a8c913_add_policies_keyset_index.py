@@ -0,0 +1,31 @@
+"""add policies keyset index (ix_policies_keyset)
+
+정책 검색/목록의 키셋(커서) 페이지네이션 정렬 키 (device_id, vsys, seq, id)를
+인덱스 순서로 읽고 커서 위치로 바로 탐색할 수 있도록 복합 인덱스를 추가한다.
+id는 rowid로 인덱스에 포함된다.
+
+Revision ID: b2e6f4a8c913
+Revises: c5d8f1a3e702
+Create Date: 2026-10-17 16:40:27.519304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6f4a8c913'
+down_revision: Union[str, Sequence[str], None] = 'c5d8f1a3e702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_policies_keyset', 'policies', ['device_id', 'is_active', 'vsys', 'seq'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_policies_keyset', table_name='policies')
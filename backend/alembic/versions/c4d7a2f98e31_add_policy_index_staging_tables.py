@@ -0,0 +1,87 @@
+"""add policy index staging tables
+
+정책 인덱스 재구축이 본 인덱스(policy_address_members, policy_service_members,
+policy_tokens)를 긴 트랜잭션 동안 지운 채로 두지 않도록, 새 행을 먼저 쌓아 두는
+스테이징 테이블과 처리한 정책 ID 테이블을 추가한다. 재구축 마지막에 짧은 트랜잭션
+하나로 본 테이블의 해당 정책 행을 교체(DELETE + INSERT … SELECT)한다.
+
+Revision ID: c4d7a2f98e31
+Revises: a6c3e9f15b72
+Create Date: 2026-10-17 21:02:53.614270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a2f98e31'
+down_revision: Union[str, Sequence[str], None] = 'a6c3e9f15b72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'policy_address_members_staging',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('policy_id', sa.Integer(), nullable=False),
+        sa.Column('direction', sa.String(), nullable=False),
+        sa.Column('token', sa.String(), nullable=True),
+        sa.Column('token_type', sa.String(), nullable=True),
+        sa.Column('ip_start', sa.BigInteger(), nullable=True),
+        sa.Column('ip_end', sa.BigInteger(), nullable=True),
+        sa.Column('ip6_start_hi', sa.BigInteger(), nullable=True),
+        sa.Column('ip6_start_lo', sa.BigInteger(), nullable=True),
+        sa.Column('ip6_end_hi', sa.BigInteger(), nullable=True),
+        sa.Column('ip6_end_lo', sa.BigInteger(), nullable=True),
+    )
+    op.create_index(
+        'ix_policy_address_members_staging_device', 'policy_address_members_staging', ['device_id']
+    )
+
+    op.create_table(
+        'policy_service_members_staging',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('policy_id', sa.Integer(), nullable=False),
+        sa.Column('token', sa.String(), nullable=False),
+        sa.Column('token_type', sa.String(), nullable=True),
+        sa.Column('protocol', sa.String(), nullable=True),
+        sa.Column('port_start', sa.Integer(), nullable=True),
+        sa.Column('port_end', sa.Integer(), nullable=True),
+    )
+    op.create_index(
+        'ix_policy_service_members_staging_device', 'policy_service_members_staging', ['device_id']
+    )
+
+    op.create_table(
+        'policy_tokens_staging',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('policy_id', sa.Integer(), nullable=False),
+        sa.Column('field', sa.String(), nullable=False),
+        sa.Column('token', sa.String(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+    )
+    op.create_index('ix_policy_tokens_staging_device', 'policy_tokens_staging', ['device_id'])
+
+    op.create_table(
+        'policy_index_staging_ids',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('policy_id', sa.Integer(), nullable=False),
+    )
+    op.create_index('ix_policy_index_staging_ids_device', 'policy_index_staging_ids', ['device_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_policy_index_staging_ids_device', table_name='policy_index_staging_ids')
+    op.drop_table('policy_index_staging_ids')
+    op.drop_index('ix_policy_tokens_staging_device', table_name='policy_tokens_staging')
+    op.drop_table('policy_tokens_staging')
+    op.drop_index('ix_policy_service_members_staging_device', table_name='policy_service_members_staging')
+    op.drop_table('policy_service_members_staging')
+    op.drop_index('ix_policy_address_members_staging_device', table_name='policy_address_members_staging')
+    op.drop_table('policy_address_members_staging')
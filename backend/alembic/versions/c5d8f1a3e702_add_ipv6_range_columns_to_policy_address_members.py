@@ -0,0 +1,55 @@
+"""add ipv6 range columns to policy_address_members
+
+IPv6 주소 멤버도 인덱스 검색이 가능하도록 128비트 범위를 상/하위 64비트로 나눈
+ip6_start_hi/lo, ip6_end_hi/lo 컬럼과 복합 인덱스를 추가한다. 기존에는 IPv6 멤버가
+인덱싱되지 않았으므로 IPv6 값을 가진 장비/정책은 is_indexed를 False로 돌려
+다음 동기화 때 다시 인덱싱되게 한다.
+
+Revision ID: c5d8f1a3e702
+Revises: a7c3e9d21b54
+Create Date: 2026-10-17 15:21:47.905163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8f1a3e702'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9d21b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('policy_address_members', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('ip6_start_hi', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('ip6_start_lo', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('ip6_end_hi', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('ip6_end_lo', sa.BigInteger(), nullable=True))
+    op.create_index(
+        'ix_policy_addr_members_lookup6',
+        'policy_address_members',
+        ['device_id', 'direction', 'ip6_start_hi', 'ip6_start_lo', 'ip6_end_hi', 'ip6_end_lo'],
+    )
+
+    op.execute("""
+        UPDATE policies SET is_indexed = 0
+        WHERE source LIKE '%:%'
+           OR destination LIKE '%:%'
+           OR device_id IN (SELECT DISTINCT device_id FROM network_objects WHERE ip_address LIKE '%:%')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_policy_addr_members_lookup6', table_name='policy_address_members')
+    op.execute("DELETE FROM policy_address_members WHERE token_type = 'ipv6_range'")
+    with op.batch_alter_table('policy_address_members', schema=None) as batch_op:
+        batch_op.drop_column('ip6_end_lo')
+        batch_op.drop_column('ip6_end_hi')
+        batch_op.drop_column('ip6_start_lo')
+        batch_op.drop_column('ip6_start_hi')
@@ -0,0 +1,46 @@
+"""reindex predefined service members
+
+서비스 필터가 모두 (device_id, protocol, port_start, port_end) 인덱스로 조회되도록
+정책 인덱서가 벤더 기본 제공 서비스(PAN-OS service-http/service-https)를 포트 범위로
+펼치고, application-default는 센티넬 행으로, 포트 없는 프로토콜 서비스 객체(ICMP 등)는
+해당 프로토콜 전체 범위로 저장하게 되었다. 스키마 변경은 없으며, 이 값들을 참조할 수 있는
+정책만 is_indexed를 False로 돌려 다음 동기화 때 다시 인덱싱되게 한다.
+
+Revision ID: d8e1b5c27a94
+Revises: c4d7a2f98e31
+Create Date: 2026-10-17 21:48:12.337904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e1b5c27a94'
+down_revision: Union[str, Sequence[str], None] = 'c4d7a2f98e31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        UPDATE policies SET is_indexed = 0
+        WHERE lower(service) LIKE '%application-default%'
+           OR lower(service) LIKE '%service-http%'
+           OR device_id IN (
+               SELECT DISTINCT device_id FROM service_groups WHERE lower(members) LIKE '%service-http%'
+           )
+           OR device_id IN (
+               SELECT DISTINCT device_id FROM services
+               WHERE (port IS NULL OR port = '' OR lower(port) = 'none')
+                 AND lower(coalesce(protocol, '')) NOT IN ('', 'none', 'tcp', 'udp')
+           )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM policy_service_members WHERE token_type = 'application_default'")
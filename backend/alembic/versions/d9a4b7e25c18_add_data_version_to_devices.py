@@ -0,0 +1,34 @@
+"""add data_version to devices
+
+정책 검색 결과 캐시의 키로 쓰는 장비별 데이터 버전 컬럼을 추가한다.
+동기화와 정책 재인덱싱이 데이터 변경과 같은 트랜잭션에서 값을 1씩 올려,
+변경이 커밋된 뒤에는 이전 검색 결과가 조회되지 않게 한다.
+
+Revision ID: d9a4b7e25c18
+Revises: b2e6f4a8c913
+Create Date: 2026-10-17 17:32:08.264517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a4b7e25c18'
+down_revision: Union[str, Sequence[str], None] = 'b2e6f4a8c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('devices', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('devices', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
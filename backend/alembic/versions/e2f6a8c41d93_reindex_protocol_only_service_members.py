@@ -0,0 +1,43 @@
+"""reindex protocol-only service members
+
+포트가 없는 프로토콜 서비스 객체(ICMP 등)를 '{protocol}/any'(0-65535) 행 대신
+token_type = 'protocol', 포트 NULL 센티넬 행으로 인덱싱하도록 바뀌었다. 스키마 변경은 없으며,
+이전 방식으로 인덱싱된 행을 가진 정책만 is_indexed를 False로 돌려 다음 동기화 때 다시 인덱싱되게 한다.
+
+Revision ID: e2f6a8c41d93
+Revises: d8e1b5c27a94
+Create Date: 2026-10-17 23:12:40.518273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f6a8c41d93'
+down_revision: Union[str, Sequence[str], None] = 'd8e1b5c27a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        UPDATE policies SET is_indexed = 0
+        WHERE id IN (
+            SELECT DISTINCT policy_id FROM policy_service_members
+            WHERE token_type = 'proto_port' AND lower(token) LIKE '%/any'
+              AND lower(coalesce(protocol, '')) NOT IN ('', 'any', 'tcp', 'udp')
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        UPDATE policies SET is_indexed = 0
+        WHERE id IN (SELECT DISTINCT policy_id FROM policy_service_members WHERE token_type = 'protocol')
+    """)
+    op.execute("DELETE FROM policy_service_members WHERE token_type = 'protocol'")
@@ -0,0 +1,56 @@
+"""add group closure tables (network_group_closures, service_group_closures)
+
+정책 인덱싱 때마다 중첩 그룹을 DFS로 다시 펼치지 않도록, 그룹별로 펼쳐진
+최하위 멤버를 (group_name, member_name) 행으로 영속 저장한다. 기존 장비의
+폐포 행은 비워 둔 채로 두며, 다음 인덱싱 시 누락 그룹을 계산해 채운다.
+
+Revision ID: e4a1c7b93f20
+Revises: 58ee57742835
+Create Date: 2026-10-17 10:12:31.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a1c7b93f20'
+down_revision: Union[str, Sequence[str], None] = '58ee57742835'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'network_group_closures',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('device_id', sa.Integer(), sa.ForeignKey('devices.id'), nullable=False),
+        sa.Column('group_name', sa.String(), nullable=False),
+        sa.Column('member_name', sa.String(), nullable=False),
+    )
+    op.create_index('ix_net_group_closures_group', 'network_group_closures', ['device_id', 'group_name'])
+    op.create_index('ix_net_group_closures_member', 'network_group_closures', ['device_id', 'member_name'])
+
+    op.create_table(
+        'service_group_closures',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('device_id', sa.Integer(), sa.ForeignKey('devices.id'), nullable=False),
+        sa.Column('group_name', sa.String(), nullable=False),
+        sa.Column('member_name', sa.String(), nullable=False),
+    )
+    op.create_index('ix_svc_group_closures_group', 'service_group_closures', ['device_id', 'group_name'])
+    op.create_index('ix_svc_group_closures_member', 'service_group_closures', ['device_id', 'member_name'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_svc_group_closures_member', table_name='service_group_closures')
+    op.drop_index('ix_svc_group_closures_group', table_name='service_group_closures')
+    op.drop_table('service_group_closures')
+
+    op.drop_index('ix_net_group_closures_member', table_name='network_group_closures')
+    op.drop_index('ix_net_group_closures_group', table_name='network_group_closures')
+    op.drop_table('network_group_closures')
@@ -0,0 +1,65 @@
+"""add policies_fts full-text index (FTS5 trigram)
+
+정책 텍스트 필드(rule_name, description, user, application, security_profile)의
+부분 일치 검색이 전체 스캔(ILIKE '%x%') 대신 인덱스를 타도록 policies를 원본으로
+하는 external content FTS5 가상 테이블(trigram 토크나이저)을 만든다.
+policies의 INSERT/UPDATE/DELETE 트리거로 내용을 동기화하고, 기존 정책은 rebuild로 채운다.
+
+Revision ID: e7f2c9a41d36
+Revises: d9a4b7e25c18
+Create Date: 2026-10-17 18:26:44.107391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f2c9a41d36'
+down_revision: Union[str, Sequence[str], None] = 'd9a4b7e25c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = "rule_name, description, user, application, security_profile"
+_NEW_VALUES = "new.id, new.rule_name, new.description, new.user, new.application, new.security_profile"
+_OLD_VALUES = "old.id, old.rule_name, old.description, old.user, old.application, old.security_profile"
+# 동기화의 bulk update는 값이 같아도 컬럼을 SET하므로 실제로 바뀐 경우에만 FTS를 갱신
+_CHANGED = " OR ".join(
+    f"old.{c} IS NOT new.{c}" for c in ("rule_name", "description", "user", "application", "security_profile")
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"""
+        CREATE VIRTUAL TABLE policies_fts USING fts5(
+            {_COLUMNS},
+            content='policies', content_rowid='id', tokenize='trigram'
+        )
+    """)
+    op.execute(f"""
+        CREATE TRIGGER policies_fts_ai AFTER INSERT ON policies BEGIN
+            INSERT INTO policies_fts(rowid, {_COLUMNS}) VALUES ({_NEW_VALUES});
+        END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER policies_fts_ad AFTER DELETE ON policies BEGIN
+            INSERT INTO policies_fts(policies_fts, rowid, {_COLUMNS}) VALUES ('delete', {_OLD_VALUES});
+        END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER policies_fts_au AFTER UPDATE OF {_COLUMNS} ON policies WHEN {_CHANGED} BEGIN
+            INSERT INTO policies_fts(policies_fts, rowid, {_COLUMNS}) VALUES ('delete', {_OLD_VALUES});
+            INSERT INTO policies_fts(rowid, {_COLUMNS}) VALUES ({_NEW_VALUES});
+        END
+    """)
+    op.execute("INSERT INTO policies_fts(policies_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS policies_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS policies_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS policies_fts_ai")
+    op.execute("DROP TABLE IF EXISTS policies_fts")
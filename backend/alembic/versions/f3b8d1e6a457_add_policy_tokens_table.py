@@ -0,0 +1,70 @@
+"""add policy_tokens table
+
+정책의 쉼표 구분 이름 필드(source, destination, service, application, user,
+from_zone, to_zone)를 (policy_id, field, token, position) 행으로 정규화해
+(device_id, field, token COLLATE NOCASE) 인덱스로 이름 일치 조회를 한다.
+기존 정책의 토큰은 업그레이드 시 현재 필드 값으로 채운다.
+
+Revision ID: f3b8d1e6a457
+Revises: e7f2c9a41d36
+Create Date: 2026-10-17 19:05:12.530816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d1e6a457'
+down_revision: Union[str, Sequence[str], None] = 'e7f2c9a41d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FIELDS = ("source", "destination", "service", "application", "user", "from_zone", "to_zone")
+_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    policy_tokens = op.create_table(
+        'policy_tokens',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('device_id', sa.Integer(), sa.ForeignKey('devices.id'), nullable=False),
+        sa.Column('policy_id', sa.Integer(), sa.ForeignKey('policies.id'), nullable=False),
+        sa.Column('field', sa.String(), nullable=False),
+        sa.Column('token', sa.String(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        'ix_policy_tokens_lookup', 'policy_tokens',
+        ['device_id', 'field', sa.text('token COLLATE NOCASE')],
+    )
+    op.create_index('ix_policy_tokens_policy', 'policy_tokens', ['policy_id'])
+
+    # 기존 정책 백필 (group_closure.parse_group_members와 같은 분리 규칙)
+    bind = op.get_bind()
+    columns = ", ".join(f'"{f}"' for f in _FIELDS)
+    result = bind.execute(sa.text(f"SELECT id, device_id, {columns} FROM policies"))
+    rows = []
+    for policy_id, device_id, *values in result:
+        for field, value in zip(_FIELDS, values):
+            names = [m.strip() for m in (value or "").split(',') if m.strip()]
+            for position, token in enumerate(names):
+                rows.append({
+                    "device_id": device_id, "policy_id": policy_id,
+                    "field": field, "token": token, "position": position,
+                })
+        if len(rows) >= _BATCH_SIZE:
+            op.bulk_insert(policy_tokens, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(policy_tokens, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_policy_tokens_policy', table_name='policy_tokens')
+    op.drop_index('ix_policy_tokens_lookup', table_name='policy_tokens')
+    op.drop_table('policy_tokens')
@@ -22,6 +22,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
+from app.core.executors import WORKFLOW_EXECUTOR
 from app.db.session import get_db
 from app.models.user import User
 from app import crud
@@ -129,7 +130,7 @@ async def execute_task(
     runner = WorkspaceRunner(config_dict=config_dict)
     try:
         output_files = await loop.run_in_executor(
-            None,
+            WORKFLOW_EXECUTOR,
             lambda: runner.run_task(task_id, contents, filenames, **extra_kwargs)
         )
     except ValueError as e:
@@ -492,7 +493,7 @@ async def run_project_task(
 
         try:
             output_files = await loop.run_in_executor(
-                None,
+                WORKFLOW_EXECUTOR,
                 lambda: runner.run_task(effective_task_id, contents, filenames, **extra_kwargs)
             )
         except (ValueError, RuntimeError) as e:
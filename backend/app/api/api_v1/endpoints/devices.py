@@ -22,6 +22,7 @@ from app.core.auth import get_current_user
 from app.models.user import User
 from app.services.audit_log import log_activity
 from app.services.export.tasks import run_export_task
+from app.services.policy_search_cache import policy_search_cache
 
 
 class DirectExportRequest(BaseModel):
@@ -235,6 +236,8 @@ async def delete_device(
     db_device = await crud.device.remove_device(db, id=device_id)
     if db_device is None:
         raise HTTPException(status_code=404, detail="Device not found")
+    # 같은 ID가 새 장비에 재사용될 수 있으므로 버전과 무관하게 캐시 항목 제거
+    policy_search_cache.invalidate_device(device_id)
     await log_activity(
         db,
         title="장비 삭제",
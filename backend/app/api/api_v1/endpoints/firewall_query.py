@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from app import crud, schemas, models
 from app.db.session import get_db
 from sqlalchemy.future import select
 from sqlalchemy import desc
 from app.services.policy_indexer import rebuild_policy_indices
+from app.services.flow_lookup import MAX_FLOWS_PER_REQUEST, get_device_flow_index, lookup_flows
 from app.services.live_policy_diff import get_live_running_candidate_diff, LivePolicyDiffError
+from app.services.policy_search_cache import make_search_cache_key, policy_search_cache
 from app.models.change_log import ChangeLog
 from app.models.sync_history import SyncHistory
 
@@ -24,20 +28,37 @@ async def parse_index(device_id: int, db: AsyncSession = Depends(get_db)):
     device = await crud.device.get_device(db=db, device_id=device_id)
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
+    # 재구축은 장비별 잠금으로 동기화 재인덱싱과 직렬화되며, 스테이징·교체를 스스로 커밋함
+    # (실패 시 본 인덱스는 이전 상태 그대로이고 남은 스테이징 행은 다음 재구축이 정리)
     try:
-        result = await db.execute(select(models.Policy).where(models.Policy.device_id == device_id))
-        policies = result.scalars().all()
-        await rebuild_policy_indices(db=db, device_id=device_id, policies=policies)
-        await db.commit()
+        await rebuild_policy_indices(db=db, device_id=device_id)
         return {"msg": "Policy indices rebuilt."}
     except Exception as e:
-        await db.rollback()
         raise HTTPException(status_code=500, detail=f"parse-index failed: {e}")
 
 
 @router.get("/{device_id}/policies", response_model=List[schemas.Policy])
-async def read_db_device_policies(device_id: int, db: AsyncSession = Depends(get_db)):
-    return await crud.policy.get_policies_by_device(db=db, device_id=device_id)
+async def read_db_device_policies(
+    device_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    장비의 활성 정책 목록을 반환합니다.
+
+    limit을 지정하면 (device_id, vsys, seq, id) 순으로 페이지 단위 조회하며, 다음 페이지가 있으면
+    X-Next-Cursor 응답 헤더의 값을 cursor로 넘겨 이어서 조회합니다.
+    """
+    try:
+        policies = await crud.policy.get_policies_by_device(db=db, device_id=device_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    next_cursor = crud.policy.next_policy_cursor(policies, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return policies
 
 
 @router.get("/{device_id}/policies/count", response_model=schemas.PolicyCountResponse)
@@ -62,29 +83,65 @@ async def count_device_objects(device_id: int, db: AsyncSession = Depends(get_db
     )
 
 
+async def _get_valid_object_names(db: AsyncSession, device_ids: List[int]) -> Set[str]:
+    """장비들의 활성 주소/서비스 객체·그룹 이름 집합 (이름 컬럼만 조회)."""
+    names: Set[str] = set()
+    names |= await crud.network_object.get_network_object_names_by_devices(db, device_ids)
+    names |= await crud.network_group.get_network_group_names_by_devices(db, device_ids)
+    names |= await crud.service.get_service_names_by_devices(db, device_ids)
+    names |= await crud.service_group.get_service_group_names_by_devices(db, device_ids)
+    return names
+
+
 @router.post("/policies/search", response_model=schemas.PolicySearchResponse)
 async def search_policies(req: schemas.PolicySearchRequest, db: AsyncSession = Depends(get_db)):
+    """
+    정책을 검색합니다.
+
+    같은 조건의 반복 검색은 장비별 데이터 버전으로 키를 만든 결과 캐시(JSON 바이트)에서 바로 응답하며,
+    동기화/재인덱싱으로 버전이 바뀌면 다시 조회합니다.
+    """
     if not req.device_ids:
         return schemas.PolicySearchResponse(policies=[], valid_object_names=[])
 
-    policies = await crud.policy.search_policies(db=db, req=req)
+    versions = await crud.device.get_data_versions(db, req.device_ids)
+    cache_key = make_search_cache_key(req, versions)
+    cached = policy_search_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    # Fetch all valid object names for the given devices
-    valid_object_names = set()
-    for device_id in req.device_ids:
-        net_objs = await crud.network_object.get_network_objects_by_device(db=db, device_id=device_id)
-        valid_object_names.update(obj.name for obj in net_objs)
+    try:
+        policies = await crud.policy.search_policies(db=db, req=req)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    valid_object_names = await _get_valid_object_names(db, req.device_ids)
+
+    body = schemas.PolicySearchResponse(
+        policies=policies,
+        valid_object_names=list(valid_object_names),
+        next_cursor=crud.policy.next_policy_cursor(policies, req.limit),
+    ).model_dump_json().encode()
+    policy_search_cache.put(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
-        net_groups = await crud.network_group.get_network_groups_by_device(db=db, device_id=device_id)
-        valid_object_names.update(group.name for group in net_groups)
 
-        services = await crud.service.get_services_by_device(db=db, device_id=device_id)
-        valid_object_names.update(svc.name for svc in services)
+@router.post("/{device_id}/flow-lookup", response_model=schemas.FlowLookupResponse)
+async def flow_lookup(device_id: int, req: schemas.FlowLookupRequest, db: AsyncSession = Depends(get_db)):
+    """
+    흐름(출발지 IP, 목적지 IP, 프로토콜, 포트[, 존, vsys]) 목록마다 처음으로 일치하는 활성 정책을 찾습니다.
 
-        service_groups = await crud.service_group.get_service_groups_by_device(db=db, device_id=device_id)
-        valid_object_names.update(group.name for group in service_groups)
+    정책 멤버 인덱스로 만든 장비별 구간 구조(데이터 버전 기준 캐시)에서 조회하며,
+    정책 순서는 (vsys, seq)입니다. 결과는 요청 flows 순서대로 반환합니다.
+    """
+    device = await crud.device.get_device(db=db, device_id=device_id)
+    if not device:
+        raise HTTPException(status_code=404, detail="Device not found")
+    if len(req.flows) > MAX_FLOWS_PER_REQUEST:
+        raise HTTPException(status_code=400, detail=f"Too many flows (max {MAX_FLOWS_PER_REQUEST})")
 
-    return schemas.PolicySearchResponse(policies=policies, valid_object_names=list(valid_object_names))
+    index = await get_device_flow_index(db, device_id)
+    return schemas.FlowLookupResponse(device_id=device_id, results=lookup_flows(index, req.flows))
 
 
 @router.get("/{device_id}/network-objects", response_model=List[schemas.NetworkObject])
@@ -312,41 +369,20 @@ async def get_object_usage_counts(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    각 오브젝트가 몇 개의 정책에서 직접 참조되는지 반환합니다.
-    Policy.source, destination, service 필드의 쉼표 구분 이름을 집계합니다.
-    결과: [{"device_id": 1, "name": "obj1", "member_type": "address"|"service", "policy_count": 5}]
+    각 오브젝트가 몇 개의 정책에서 참조되는지 반환합니다.
+    동기화·인덱싱 시 갱신되는 object_usage_counts 집계를 그대로 조회합니다.
+    - policy_count: Policy.source, destination, service 필드에 이름이 직접 나열된 횟수
+    - group_policy_count: 이름을 (중첩 포함) 멤버로 가진 그룹을 참조하는 정책 수
+    결과: [{"device_id": 1, "name": "obj1", "member_type": "address"|"service", "policy_count": 5, "group_policy_count": 2}]
     """
+    usage = models.ObjectUsageCount
     result = await db.execute(
-        select(
-            models.Policy.device_id,
-            models.Policy.source,
-            models.Policy.destination,
-            models.Policy.service,
-        ).where(models.Policy.device_id.in_(device_ids))
+        select(usage.device_id, usage.name, usage.member_type, usage.policy_count, usage.group_policy_count)
+        .where(usage.device_id.in_(device_ids))
     )
-    policies = result.all()
-
-    addr_counts: dict[tuple, int] = {}
-    svc_counts: dict[tuple, int] = {}
-
-    for row in policies:
-        for field in (row.source, row.destination):
-            if field:
-                for name in (n.strip() for n in field.split(',') if n.strip()):
-                    key = (row.device_id, name)
-                    addr_counts[key] = addr_counts.get(key, 0) + 1
-        if row.service:
-            for name in (n.strip() for n in row.service.split(',') if n.strip()):
-                key = (row.device_id, name)
-                svc_counts[key] = svc_counts.get(key, 0) + 1
-
-    return [
-        {"device_id": k[0], "name": k[1], "member_type": "address", "policy_count": v}
-        for k, v in addr_counts.items()
-    ] + [
-        {"device_id": k[0], "name": k[1], "member_type": "service", "policy_count": v}
-        for k, v in svc_counts.items()
-    ]
+    # 객체 수만큼 행이 많으므로 jsonable_encoder를 거치지 않고 바로 직렬화
+    body = json.dumps([row._asdict() for row in result.all()], ensure_ascii=False).encode()
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/policy-history")
@@ -72,6 +72,13 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 480  # 8 hours
+    # CPU 바운드 분석 실행 백엔드: "thread"(기본, CPU_EXECUTOR) | "process"(멀티코어 프로세스 풀)
+    ANALYSIS_BACKEND: str = "thread"
+    ANALYSIS_PROCESSES: int = 0  # 0이면 min(4, CPU 코어 수)
+    # 네트워크 I/O 스레드 풀 크기 (0이면 기본 동기화 병렬도 기준 자동 산정, app/core/executors.py 참고)
+    IO_WORKERS: int = 0
+    # 정책 검색 결과 캐시 용량 상한 (응답 JSON 바이트 합계, 0이면 캐시 미사용)
+    SEARCH_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
 
     class Config:
         env_file = str(ENV_PATH)
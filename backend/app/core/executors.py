@@ -1,14 +1,105 @@
-"""용도별 전용 스레드 풀.
+"""용도별 전용 스레드/프로세스 풀.
 
 기본 executor(None)를 동기화 네트워크 I/O와 분석 CPU 연산이 공유하면
 대량 동시 실행 시 서로를 굶길 수 있어 풀을 분리한다.
 
-- IO_EXECUTOR: 장비 수집(SSH/API) 등 네트워크 대기 위주 작업.
-  동기화 병렬 세마포어(기본 4) × 장비당 HA 포함 2연결을 감안해 8.
+- IO_EXECUTOR: 장비 수집(SSH/API), 엑셀 내보내기 조회, 실시간 정책 비교 등 네트워크 대기 위주 작업.
+  동기화 1건은 수집 단계에서 sync_collection_concurrency(기본 3)개 작업(export,
+  Palo Alto 리소스 한도·시스템 정보)을 동시에 돌리고, 정책 작업은 HA 피어 히트 정보를
+  추가 스레드 1개로 함께 수집하므로 장비당 최대 3 + 1개 스레드를 쓴다.
+  기본값은 sync_parallel_limit(기본 4) × (3 + 1) = 16에 내보내기·정책 비교 여유 4를 더한 20.
+  두 값은 실행 중 DB 설정으로 바뀌지만 풀 크기는 기동 시 고정되므로, 설정을 올리면
+  IO_WORKERS(.env)도 같은 식으로 올려야 한다. 모자라면 초과 작업은 풀 대기열에서 기다린다.
 - CPU_EXECUTOR: 분석 비교 연산 등 CPU 바운드 작업.
   GIL 특성상 스레드를 늘려도 이득이 없고, 다른 작업을 굶기지 않도록 2로 제한.
+- WORKFLOW_EXECUTOR: 정책 삭제 워크플로우 단계 실행(엑셀 읽기/쓰기 + pandas 처리).
+  한 번 실행이 길게 점유하므로 분석·엑셀 내보내기와 풀을 공유하지 않도록 분리하고,
+  동시 실행 4건까지 처리(초과 요청은 대기열에서 순서대로 실행).
+- 분석 프로세스 풀 (선택): ANALYSIS_BACKEND=process 설정 시 run_cpu_bound()가
+  작업을 별도 프로세스로 보내 여러 장비 분석을 실제 멀티코어로 병렬 처리한다.
+  프로세스 경계를 넘으므로 함수는 모듈 최상위 함수여야 하고, 인자/반환값은
+  ORM 객체가 아닌 숫자 범위·문자열 튜플 같은 picklable 페이로드여야 한다.
 """
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
 
-IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fat-io")
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_SYNC_PARALLEL_LIMIT = 4
+_DEFAULT_COLLECTION_FAN_OUT = 3
+_HA_PEER_THREADS = 1
+_IO_HEADROOM = 4
+
+
+def _io_workers() -> int:
+    """IO_EXECUTOR 크기: IO_WORKERS 설정 또는 기본 동기화 병렬도 × 장비당 수집 스레드 + 여유."""
+    if settings.IO_WORKERS > 0:
+        return settings.IO_WORKERS
+    return _DEFAULT_SYNC_PARALLEL_LIMIT * (_DEFAULT_COLLECTION_FAN_OUT + _HA_PEER_THREADS) + _IO_HEADROOM
+
+
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=_io_workers(), thread_name_prefix="fat-io")
 CPU_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fat-cpu")
+WORKFLOW_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fat-workflow")
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def use_process_backend() -> bool:
+    """분석 작업을 프로세스 풀로 보낼지 여부 (ANALYSIS_BACKEND 설정)."""
+    return settings.ANALYSIS_BACKEND.strip().lower() == "process"
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """분석용 프로세스 풀을 지연 생성해 반환합니다.
+
+    이벤트 루프와 여러 스레드가 떠 있는 프로세스를 fork하면 잠금 상태가 복제되어
+    교착될 수 있으므로 spawn 컨텍스트를 사용합니다.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            workers = settings.ANALYSIS_PROCESSES or min(4, os.cpu_count() or 1)
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"분석 프로세스 풀 생성 (workers={workers})")
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """프로세스 풀을 정리합니다 (애플리케이션 종료 시, 또는 풀 손상 시 폐기)."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any) -> T:
+    """CPU 바운드 함수를 설정된 분석 백엔드(스레드 또는 프로세스 풀)에서 실행합니다.
+
+    프로세스 풀이 워커 비정상 종료 등으로 깨지면 풀을 폐기하고 이번 작업은
+    CPU_EXECUTOR 스레드에서 다시 실행합니다 (다음 호출 시 풀 재생성).
+    """
+    loop = asyncio.get_running_loop()
+    if use_process_backend():
+        try:
+            return await loop.run_in_executor(get_process_pool(), func, *args)
+        except BrokenProcessPool:
+            logger.warning("분석 프로세스 풀이 손상되어 스레드 실행으로 대체합니다.")
+            shutdown_process_pool()
+    return await loop.run_in_executor(CPU_EXECUTOR, func, *args)
+
@@ -22,6 +22,14 @@ async def get_by_id(db: AsyncSession, model, obj_id: int):
     return result.scalars().first()
 
 
+async def get_active_names_by_devices(db: AsyncSession, model, device_ids: list[int]) -> set[str]:
+    """여러 장비의 활성 객체 이름 집합을 이름 컬럼만 조회해 반환합니다."""
+    result = await db.execute(
+        select(model.name).filter(model.device_id.in_(device_ids), model.is_active == True).distinct()
+    )
+    return set(result.scalars().all())
+
+
 async def get_by_device(db: AsyncSession, model, device_id: int, skip: int = 0, limit: int | None = None):
     """특정 장비의 활성 객체 목록을 페이징하여 조회합니다."""
     stmt = select(model).filter(model.device_id == device_id, model.is_active == True).offset(skip)
@@ -1,9 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, delete
+from sqlalchemy import func, delete, update
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import List
+from typing import Dict, List
 
 from app.core.security import encrypt
 from app.models.device import Device
@@ -12,7 +12,10 @@ from app.models.network_object import NetworkObject
 from app.models.network_group import NetworkGroup
 from app.models.service import Service
 from app.models.service_group import ServiceGroup
-from app.models.policy_members import PolicyAddressMember, PolicyServiceMember
+from app.models.policy_members import PolicyAddressMember, PolicyServiceMember, PolicyToken
+from app.models.group_closure import NetworkGroupClosure, ServiceGroupClosure
+from app.models.object_usage import ObjectUsageCount
+from app.models.policy_index_staging import POLICY_INDEX_STAGING_TABLES, policy_index_staging_ids
 from app.models.analysis import AnalysisTask, AnalysisResult
 from app.models.change_log import ChangeLog
 from app.models.notification_log import NotificationLog
@@ -26,6 +29,15 @@ async def get_device_by_name(db: AsyncSession, name: str):
     result = await db.execute(select(Device).filter(Device.name == name))
     return result.scalars().first()
 
+async def get_data_versions(db: AsyncSession, device_ids: List[int]) -> Dict[int, int]:
+    """장비별 데이터 버전(검색 결과 캐시 키)을 조회합니다."""
+    result = await db.execute(select(Device.id, Device.data_version).where(Device.id.in_(device_ids)))
+    return {device_id: version for device_id, version in result.all()}
+
+async def bump_data_version(db: AsyncSession, device_id: int) -> None:
+    """장비 데이터 버전을 올립니다. 데이터 변경과 같은 트랜잭션에서 호출해야 합니다 (커밋은 호출자 책임)."""
+    await db.execute(update(Device).where(Device.id == device_id).values(data_version=Device.data_version + 1))
+
 async def get_devices(db: AsyncSession, skip: int = 0, limit: int | None = None):
     """장비 목록 조회 (limit이 None이면 모든 장비 조회)"""
     stmt = select(Device).offset(skip)
@@ -71,6 +83,13 @@ async def remove_device(db: AsyncSession, id: int):
         # 외래키 제약조건 때문에 관련 데이터를 먼저 삭제
         await db.execute(delete(PolicyAddressMember).where(PolicyAddressMember.device_id == id))
         await db.execute(delete(PolicyServiceMember).where(PolicyServiceMember.device_id == id))
+        await db.execute(delete(PolicyToken).where(PolicyToken.device_id == id))
+        await db.execute(delete(NetworkGroupClosure).where(NetworkGroupClosure.device_id == id))
+        await db.execute(delete(ServiceGroupClosure).where(ServiceGroupClosure.device_id == id))
+        await db.execute(delete(ObjectUsageCount).where(ObjectUsageCount.device_id == id))
+        for _, staging in POLICY_INDEX_STAGING_TABLES:
+            await db.execute(delete(staging).where(staging.c.device_id == id))
+        await db.execute(delete(policy_index_staging_ids).where(policy_index_staging_ids.c.device_id == id))
         await db.execute(delete(Policy).where(Policy.device_id == id))
         await db.execute(delete(AnalysisTask).where(AnalysisTask.device_id == id))
         await db.execute(delete(AnalysisResult).where(AnalysisResult.device_id == id))
@@ -20,6 +20,9 @@ async def get_network_groups_by_device(db: AsyncSession, device_id: int, skip: i
 async def get_all_active_network_groups_by_device(db: AsyncSession, device_id: int):
     return await base.get_all_active_by_device(db, NetworkGroup, device_id)
 
+async def get_network_group_names_by_devices(db: AsyncSession, device_ids: list[int]) -> set[str]:
+    return await base.get_active_names_by_devices(db, NetworkGroup, device_ids)
+
 async def create_network_groups(db: AsyncSession, network_groups: list[NetworkGroupCreate]):
     return await base.create_many(db, NetworkGroup, network_groups)
 
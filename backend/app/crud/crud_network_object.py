@@ -23,6 +23,9 @@ async def get_network_objects_by_device(db: AsyncSession, device_id: int, skip:
 async def get_all_active_network_objects_by_device(db: AsyncSession, device_id: int):
     return await base.get_all_active_by_device(db, NetworkObject, device_id)
 
+async def get_network_object_names_by_devices(db: AsyncSession, device_ids: list[int]) -> set[str]:
+    return await base.get_active_names_by_devices(db, NetworkObject, device_ids)
+
 async def create_network_objects(db: AsyncSession, network_objects: list[NetworkObjectCreate]):
     return await base.create_many(db, NetworkObject, network_objects)
 
@@ -1,32 +1,154 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete, update, func, or_, and_
-from sqlalchemy.sql import exists
+from sqlalchemy import delete, update, func, or_, and_, false, tuple_, union
+from sqlalchemy.sql import CompoundSelect, Select, exists
 from sqlalchemy.sql.elements import ClauseElement
 
 from app.models.policy import Policy
 from app.schemas.policy import PolicyCreate, FilterLeafNode, FilterGroupNode, FilterExprNode
+import base64
+import json
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Sequence
 
 from app import models, schemas
-from app.services.normalize import parse_ipv4_numeric, parse_port_numeric
+from app.services.normalize import parse_ipv4_numeric, parse_ipv6_numeric, parse_port_numeric, split_ipv6_numeric
+from app.services.predefined_services import ANY_SERVICE, APPLICATION_DEFAULT, PROTOCOL_NAMES, lookup_predefined_service
 
 def _escape_like(value: str) -> str:
     """ILIKE 패턴에서 %, _, \\ 를 리터럴로 취급하도록 이스케이프 (SQLite에서 _ 는 단일문자 와일드카드)."""
     return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
 
+def _text_contains_clause(col, values: List[str], negate: bool = False) -> ClauseElement:
+    """
+    values 중 하나라도 컬럼에 부분 일치(대소문자 무시)하는 조건 (negate면 어느 것도 포함하지 않는 조건).
+
+    FTS 대상 컬럼(POLICY_FTS_COLUMNS)의 3글자 이상 검색어는 policies_fts 트라이그램 인덱스의 구문 검색
+    (`컬럼 MATCH '"검색어"'`)으로 정책 ID를 찾고, 그 외에는 ILIKE로 비교합니다.
+    부정 조건은 ILIKE와 같게 컬럼이 NULL인 정책을 제외합니다.
+    """
+    clauses = []
+    for value in values:
+        if col.key in models.POLICY_FTS_COLUMNS and len(value) >= models.POLICY_FTS_MIN_QUERY_LENGTH:
+            phrase = '"' + value.replace('"', '""') + '"'
+            fts_col = models.policies_fts.c[col.key]
+            clauses.append(Policy.id.in_(select(models.policies_fts.c.rowid).where(fts_col.op('MATCH')(phrase))))
+        else:
+            clauses.append(col.ilike(f'%{_escape_like(value)}%', escape='\\'))
+    combined = or_(*clauses) if len(clauses) > 1 else clauses[0]
+    if negate:
+        return and_(col.is_not(None), ~combined)
+    return combined
+
+
 async def get_policy(db: AsyncSession, policy_id: int):
     result = await db.execute(select(Policy).filter(Policy.id == policy_id))
     return result.scalars().first()
 
-async def get_policies_by_device(db: AsyncSession, device_id: int, skip: int = 0, limit: int | None = None):
-    stmt = select(Policy).filter(Policy.device_id == device_id, Policy.is_active == True).offset(skip)
+# ─── 키셋(커서) 페이지네이션 ────────────────────────────────────────────────────
+# 정렬 키는 (device_id, vsys, seq, id)이며 ix_policies_keyset 인덱스 순서와 같다.
+# 커서는 마지막 행의 정렬 키이고, 다음 페이지는 offset 대신 "키가 커서보다 큰 행"을 인덱스에서 바로 찾아
+# 읽으므로 몇 번째 페이지든 조회 비용이 같다.
+_POLICY_ORDER_BY = (Policy.device_id.asc(), Policy.vsys.asc(), Policy.seq.asc(), Policy.id.asc())
+
+
+def encode_policy_cursor(policy: Policy) -> str:
+    """정책의 정렬 키를 다음 페이지 요청용 불투명 커서 문자열로 인코딩합니다."""
+    key = [policy.device_id, policy.vsys, policy.seq, policy.id]
+    return base64.urlsafe_b64encode(json.dumps(key, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_policy_cursor(cursor: str) -> tuple:
+    """커서 문자열을 정렬 키 튜플로 복원합니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        device_id, vsys, seq, policy_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not (
+        isinstance(device_id, int) and isinstance(policy_id, int)
+        and (vsys is None or isinstance(vsys, str)) and (seq is None or isinstance(seq, int))
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return device_id, vsys, seq, policy_id
+
+
+def next_policy_cursor(policies: Sequence[Policy], limit: Optional[int]) -> Optional[str]:
+    """페이지가 가득 찼으면 마지막 정책 기준의 다음 커서를, 마지막 페이지면 None을 반환합니다."""
+    if not limit or len(policies) < limit:
+        return None
+    return encode_policy_cursor(policies[-1])
+
+
+def _after_cursor_clause(vsys: Optional[str], seq: Optional[int], policy_id: int) -> ClauseElement:
+    """같은 장비 안에서 (vsys, seq, id)가 커서보다 뒤인 행 조건 (SQLite 정렬에서 NULL은 가장 앞).
+
+    커서 값에 NULL이 없으면 행 값 비교 하나로 표현해 인덱스 범위 탐색을 타게 하고,
+    NULL이 있으면 NULL 그룹의 나머지와 NOT NULL 그룹 전체를 OR로 잇는다.
+    """
+    if seq is None:
+        seq_after = or_(Policy.seq.is_not(None), Policy.id > policy_id)
+    else:
+        seq_after = tuple_(Policy.seq, Policy.id) > tuple_(seq, policy_id)
+
+    if vsys is None:
+        return or_(Policy.vsys.is_not(None), and_(Policy.vsys.is_(None), seq_after))
+    if seq is not None:
+        return tuple_(Policy.vsys, Policy.seq, Policy.id) > tuple_(vsys, seq, policy_id)
+    return or_(Policy.vsys > vsys, and_(Policy.vsys == vsys, seq_after))
+
+
+async def _fetch_policy_page(
+    db: AsyncSession,
+    stmt,
+    device_ids: List[int],
+    skip: Optional[int],
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> List[Policy]:
+    """
+    정렬 키 순서로 한 페이지를 조회합니다. 커서가 있으면 skip보다 우선합니다.
+
+    커서가 가리키는 장비는 (device_id = ? AND 키 > 커서) 조건으로 인덱스에서 바로 이어 읽고,
+    그 장비에서 페이지가 다 차지 않았을 때만 뒤 순서 장비들을 처음부터 이어서 읽습니다
+    (여러 장비를 OR 조건 하나로 묶으면 SQLite가 커서 위치로 탐색하지 못하기 때문).
+    """
+    if not cursor:
+        stmt = stmt.order_by(*_POLICY_ORDER_BY)
+        if skip:
+            stmt = stmt.offset(skip)
+        if limit:
+            stmt = stmt.limit(limit)
+        result = await db.execute(stmt)
+        return result.scalars().all()
+
+    device_id, vsys, seq, policy_id = decode_policy_cursor(cursor)
+    page_stmt = stmt.where(Policy.device_id == device_id, _after_cursor_clause(vsys, seq, policy_id))
+    page_stmt = page_stmt.order_by(*_POLICY_ORDER_BY)
     if limit:
-        stmt = stmt.limit(limit)
-    result = await db.execute(stmt)
+        page_stmt = page_stmt.limit(limit)
+    result = await db.execute(page_stmt)
+    policies = list(result.scalars().all())
+
+    remaining = [d for d in device_ids if d > device_id]
+    if remaining and (not limit or len(policies) < limit):
+        rest_stmt = stmt.where(Policy.device_id.in_(remaining)).order_by(*_POLICY_ORDER_BY)
+        if limit:
+            rest_stmt = rest_stmt.limit(limit - len(policies))
+        result = await db.execute(rest_stmt)
+        policies.extend(result.scalars().all())
+    return policies
+
+
+async def get_policies_by_device(
+    db: AsyncSession, device_id: int, skip: int = 0, limit: int | None = None, cursor: str | None = None
+):
+    stmt = select(Policy).filter(Policy.device_id == device_id, Policy.is_active == True)
+    if limit or cursor:
+        return await _fetch_policy_page(db, stmt, [device_id], skip, limit, cursor)
+    result = await db.execute(stmt.offset(skip))
     return result.scalars().all()
 
 async def get_all_active_policies_by_device(db: AsyncSession, device_id: int):
@@ -73,145 +195,183 @@ async def count_policies_by_device(db: AsyncSession, device_id: int) -> dict:
     return {"total": total, "disabled": disabled}
 
 
-# SQLite 기본 바인딩 변수 한도(999)를 넘지 않도록 IN 절을 청킹 (policy_indexer와 동일 기준)
-_SQLITE_IN_CHUNK = 800
+# ─── 검색 플래너 ───────────────────────────────────────────────────────────────
+# 인덱스 테이블(PolicyAddressMember/PolicyServiceMember) 조건은 정책 ID를 파이썬으로 가져오지 않고
+# `SELECT policy_id ...` 서브쿼리(필요하면 INTERSECT/UNION/EXCEPT 복합 쿼리)로 만들어
+# 최종 정책 쿼리의 WHERE 절에 `Policy.id IN (...)` 형태로 합친다.
+# 따라서 필터가 몇 개든 검색은 SQL 한 문장으로 실행되고 집합 연산은 SQLite가 수행한다.
 
 
-def _id_in_clause(ids: set) -> ClauseElement:
-    """Policy.id IN (...) 절. ID가 많으면 청크별 IN을 OR로 결합."""
-    id_list = list(ids)
-    if len(id_list) <= _SQLITE_IN_CHUNK:
-        return Policy.id.in_(id_list)
-    chunks = [id_list[i:i + _SQLITE_IN_CHUNK] for i in range(0, len(id_list), _SQLITE_IN_CHUNK)]
-    return or_(*[Policy.id.in_(c) for c in chunks])
+def _policy_ids_subquery(queries: List[Select]) -> Union[Select, CompoundSelect]:
+    """정책 ID 서브쿼리들의 합집합 (하나면 그대로)."""
+    return queries[0] if len(queries) == 1 else union(*queries)
 
 
-def _id_notin_clause(ids: set) -> ClauseElement:
-    """Policy.id NOT IN (...) 절. ID가 많으면 청크별 NOT IN을 AND로 결합."""
-    id_list = list(ids)
-    if len(id_list) <= _SQLITE_IN_CHUNK:
-        return Policy.id.notin_(id_list)
-    chunks = [id_list[i:i + _SQLITE_IN_CHUNK] for i in range(0, len(id_list), _SQLITE_IN_CHUNK)]
-    return and_(*[Policy.id.notin_(c) for c in chunks])
+def _addr_range_bounds(ip_str: str):
+    """
+    검색 IP 토큰을 (판별_컬럼, 멤버_시작, 멤버_끝, 검색_시작, 검색_끝)으로 변환합니다.
+
+    IPv4는 ip_start/ip_end 정수 비교, IPv6는 (hi, lo) 64비트 쌍의 row-value 비교를 사용하므로
+    두 경우 모두 호출자는 같은 부등식(<=, >=, ==)으로 조건을 만들 수 있습니다.
+    판별 컬럼이 NULL인 멤버는 해당 주소 체계의 범위가 없는 행(다른 체계 또는 미해석)입니다.
+    파싱할 수 없는 토큰이면 None을 반환합니다.
+    """
+    member = models.PolicyAddressMember
+    _, start, end = parse_ipv4_numeric(ip_str)
+    if start is not None and end is not None:
+        return member.ip_start, member.ip_start, member.ip_end, start, end
+    _, start, end = parse_ipv6_numeric(ip_str)
+    if start is not None and end is not None:
+        return (
+            member.ip6_start_hi,
+            tuple_(member.ip6_start_hi, member.ip6_start_lo),
+            tuple_(member.ip6_end_hi, member.ip6_end_lo),
+            tuple_(*split_ipv6_numeric(start)),
+            tuple_(*split_ipv6_numeric(end)),
+        )
+    return None
 
 
-async def _addr_policy_ids(
-    db: AsyncSession, device_ids: List[int], direction: str, ip_list: list, exact: bool = False
-) -> set:
-    """IP 토큰 목록과 겹치는(exact=True면 정확 일치하는) 정책 ID 집합.
+def _addr_policy_ids_query(
+    device_ids: List[int], direction: str, ip_list: list, exact: bool = False
+) -> Optional[Select]:
+    """IP 토큰 목록과 겹치는(exact=True면 정확 일치하는) 정책 ID 서브쿼리.
 
-    토큰별 범위 조건을 OR로 묶어 단일 쿼리로 조회한다 (토큰 수만큼 쿼리 반복 방지).
-    파싱 가능한 토큰이 하나도 없으면 빈 집합을 반환한다.
+    토큰별 범위 조건을 OR로 묶은 단일 SELECT를 만든다.
+    IPv4/IPv6 토큰을 섞어 넘길 수 있으며, 파싱 가능한 토큰이 하나도 없으면 None을 반환한다
+    (일치하는 정책이 없다는 의미).
     """
     conds = []
     for ip_str in ip_list:
-        _, start, end = parse_ipv4_numeric(ip_str)
-        if start is None or end is None:
+        bounds = _addr_range_bounds(ip_str)
+        if bounds is None:
             continue
+        _, member_start, member_end, start, end = bounds
         if exact:
-            conds.append(and_(
-                models.PolicyAddressMember.ip_start == start,
-                models.PolicyAddressMember.ip_end == end,
-            ))
+            conds.append(and_(member_start == start, member_end == end))
         else:
-            conds.append(and_(
-                models.PolicyAddressMember.ip_start <= end,
-                models.PolicyAddressMember.ip_end >= start,
-            ))
+            conds.append(and_(member_start <= end, member_end >= start))
     if not conds:
-        return set()
-    q = select(models.PolicyAddressMember.policy_id).where(
+        return None
+    return select(models.PolicyAddressMember.policy_id).where(
         models.PolicyAddressMember.device_id.in_(device_ids),
         models.PolicyAddressMember.direction == direction,
         or_(*conds),
-    ).distinct()
-    r = await db.execute(q)
-    return set(r.scalars().all())
+    )
 
 
-async def _addr_only_within_ids(
-    db: AsyncSession, device_ids: List[int], direction: str, ip_list: list
-) -> set:
-    """모든 멤버가 주어진 범위 안에 있는 정책 ID 집합 (토큰별 결과의 합집합).
+def _addr_only_within_query(
+    device_ids: List[int], direction: str, ip_list: list
+) -> Optional[Union[Select, CompoundSelect]]:
+    """모든 멤버가 주어진 범위 안에 있는 정책 ID 서브쿼리 (토큰별 결과의 합집합).
 
-    토큰마다 '범위 내 멤버 보유' - '범위 밖(또는 미해석) 멤버 보유' 차집합이 필요하므로
-    토큰 단위 쿼리를 유지한다.
+    토큰마다 '범위 내 멤버 보유' EXCEPT '범위 밖(또는 미해석) 멤버 보유'를 만들고 UNION으로 합친다.
+    다른 주소 체계(IPv4 범위 검색 시 IPv6 멤버 등)의 멤버는 범위 밖으로 취급한다.
+    파싱 가능한 토큰이 없으면 None을 반환한다.
     """
-    ids: set = set()
+    per_token = []
     for ip_str in ip_list:
-        _, range_start, range_end = parse_ipv4_numeric(ip_str)
-        if range_start is None or range_end is None:
+        bounds = _addr_range_bounds(ip_str)
+        if bounds is None:
             continue
+        key_column, member_start, member_end, range_start, range_end = bounds
         q_has = select(models.PolicyAddressMember.policy_id).where(
             models.PolicyAddressMember.device_id.in_(device_ids),
             models.PolicyAddressMember.direction == direction,
-            models.PolicyAddressMember.ip_start >= range_start,
-            models.PolicyAddressMember.ip_end <= range_end,
-        ).distinct()
-        r_has = await db.execute(q_has)
-        has_ids = set(r_has.scalars().all())
+            member_start >= range_start,
+            member_end <= range_end,
+        )
         q_out = select(models.PolicyAddressMember.policy_id).where(
             models.PolicyAddressMember.device_id.in_(device_ids),
             models.PolicyAddressMember.direction == direction,
             or_(
-                models.PolicyAddressMember.ip_start.is_(None),
-                models.PolicyAddressMember.ip_end.is_(None),
-                models.PolicyAddressMember.ip_start < range_start,
-                models.PolicyAddressMember.ip_end > range_end,
+                key_column.is_(None),
+                member_start < range_start,
+                member_end > range_end,
             )
-        ).distinct()
-        r_out = await db.execute(q_out)
-        ids.update(has_ids - set(r_out.scalars().all()))
-    return ids
+        )
+        # SQLite는 괄호로 묶인 복합 쿼리를 허용하지 않으므로 EXCEPT 결과를 서브쿼리로 감싼 뒤 UNION
+        within = q_has.except_(q_out).subquery()
+        per_token.append(select(within.c.policy_id))
+    if not per_token:
+        return None
+    return _policy_ids_subquery(per_token)
 
 
-async def _svc_policy_ids(db: AsyncSession, device_ids: List[int], token_list: list) -> Optional[set]:
-    """서비스 토큰 목록과 겹치는 정책 ID 집합.
+def _svc_policy_ids_query(device_ids: List[int], token_list: list) -> Optional[Select]:
+    """서비스 토큰 목록과 겹치는 정책 ID 서브쿼리.
 
-    포트로 파싱되는 토큰은 프로토콜/포트 범위 조건으로, 파싱 불가 토큰은 객체명 ILIKE로
-    변환한 뒤 전부 OR로 묶어 단일 쿼리로 조회한다.
-    유효 토큰이 없으면 None을 반환한다 (필터 미적용 의미 — 빈 set과 구분).
+    포트로 파싱되는 토큰(벤더 기본 제공 서비스 이름은 카탈로그 값으로 펼침)은 프로토콜/포트 범위
+    조건으로, 예약어(application-default)와 프로토콜 이름만 있는 토큰은 프로토콜 조건으로 변환해
+    (device_id, protocol, port_start, port_end) 인덱스로 조회한다. 그 밖의 토큰(범위로 해소되지
+    않은 그룹명)만 ILIKE로 폴백하며, 전부 OR로 묶은 단일 SELECT를 만든다.
+    유효 토큰이 없으면 None을 반환한다 (필터 미적용 의미).
     """
+    member = models.PolicyServiceMember
     conds = []
     for token in token_list:
         token = token.strip()
         if not token:
             continue
-        proto = None
-        ports_str = token
-        if '/' in token:
-            p, ports_str = token.split('/', 1)
-            proto = p.strip().lower()
-            ports_str = ports_str.strip()
-        pstart, pend = parse_port_numeric(ports_str)
-        if pstart is not None and pend is not None:
-            port_cond = and_(
-                models.PolicyServiceMember.port_start <= pend,
-                models.PolicyServiceMember.port_end >= pstart,
-            )
-            if proto and proto != 'any':
-                conds.append(and_(port_cond, func.lower(models.PolicyServiceMember.protocol) == proto))
+        lowered = token.lower()
+        if lowered == APPLICATION_DEFAULT:
+            conds.append(member.protocol == lowered)
+            continue
+        if lowered in PROTOCOL_NAMES:
+            # 포트만 쓴 검색어와 마찬가지로 'any' 서비스 정책도 해당 프로토콜을 허용하므로 포함
+            conds.append(member.protocol.in_([lowered, ANY_SERVICE]))
+            continue
+        for value in lookup_predefined_service(token) or (token,):
+            proto = None
+            ports_str = value
+            if '/' in value:
+                p, ports_str = value.split('/', 1)
+                proto = p.strip().lower()
+                ports_str = ports_str.strip()
+            pstart, pend = parse_port_numeric(ports_str)
+            if pstart is not None and pend is not None:
+                # 인덱서가 프로토콜을 소문자로 저장하므로 컬럼을 그대로 비교해 인덱스를 탄다
+                port_cond = and_(member.port_start <= pend, member.port_end >= pstart)
+                if proto and proto != 'any':
+                    conds.append(and_(member.protocol == proto, port_cond))
+                else:
+                    conds.append(and_(member.protocol.in_(['tcp', 'udp', 'any']), port_cond))
             else:
-                conds.append(and_(port_cond, func.lower(models.PolicyServiceMember.protocol).in_(['tcp', 'udp', 'any'])))
-        else:
-            # 포트로 파싱 불가 → 서비스 객체명 ILIKE로 폴백
-            conds.append(models.PolicyServiceMember.token.ilike(f'%{_escape_like(token)}%', escape='\\'))
+                # 범위로 해소되지 않은 토큰(빈 그룹 등) → 원본 토큰 ILIKE로 폴백
+                conds.append(member.token.ilike(f'%{_escape_like(value)}%', escape='\\'))
     if not conds:
         return None
-    q = select(models.PolicyServiceMember.policy_id).where(
+    return select(models.PolicyServiceMember.policy_id).where(
         models.PolicyServiceMember.device_id.in_(device_ids),
         or_(*conds),
-    ).distinct()
-    r = await db.execute(q)
-    return set(r.scalars().all())
+    )
 
 
-async def _evaluate_leaf(
-    db: AsyncSession,
+def _token_policy_ids_query(device_ids: List[int], field: str, names: List[str]) -> Select:
+    """정책 필드(field)에 이름이 정확히 일치(대소문자 무시)하는 멤버가 있는 정책 ID 서브쿼리 (policy_tokens 인덱스 조회)."""
+    return select(models.PolicyToken.policy_id).where(
+        models.PolicyToken.device_id.in_(device_ids),
+        models.PolicyToken.field == field,
+        models.PolicyToken.token.collate('NOCASE').in_(names),
+    )
+
+
+def _member_filter_clause(query: Optional[Union[Select, CompoundSelect]], negate: bool) -> Optional[ClauseElement]:
+    """
+    인덱스 서브쿼리를 Policy.id IN / NOT IN 절로 변환합니다.
+
+    query가 None(일치 정책 없음)이면 긍정 조건은 항상 거짓, 부정 조건은 필터 없음(None)입니다.
+    """
+    if query is None:
+        return None if negate else false()
+    return Policy.id.notin_(query) if negate else Policy.id.in_(query)
+
+
+def _evaluate_leaf(
     device_ids: List[int],
     node: FilterLeafNode,
 ) -> Optional[ClauseElement]:
-    """LEAF 노드를 SQLAlchemy ColumnElement로 변환. 인덱스 테이블 조회 결과는 Policy.id.in_() 형태로 반환."""
+    """LEAF 노드를 SQLAlchemy ColumnElement로 변환. 인덱스 테이블 조건은 Policy.id.in_(서브쿼리) 형태로 반환."""
     field, op, value = node.field, node.operator, node.value.strip()
     if not value:
         return None
@@ -233,6 +393,14 @@ async def _evaluate_leaf(
         'service_name': Policy.service,
     }
 
+    # 쉼표 구분 목록 필드의 equals는 필드 전체가 아니라 멤버 이름 일치로 비교 (policy_tokens 인덱스)
+    if is_exact and (field in ILIKE_NAME_COLS or field in ('user', 'application')):
+        col = ILIKE_NAME_COLS.get(field) or ILIKE_COLS[field]
+        vals = [v.strip() for v in value.split(',') if v.strip()]
+        if not vals:
+            return None
+        return _member_filter_clause(_token_policy_ids_query(device_ids, col.key, vals), is_not)
+
     if field in ILIKE_COLS:
         col = ILIKE_COLS[field]
         vals = [v.strip() for v in value.split(',') if v.strip()]
@@ -243,23 +411,17 @@ async def _evaluate_leaf(
             combined = or_(*clauses) if len(clauses) > 1 else clauses[0]
             return ~combined if is_not else combined
         else:
-            clauses = [col.ilike(f'%{_escape_like(v)}%', escape='\\') for v in vals]
-            combined = or_(*clauses) if len(clauses) > 1 else clauses[0]
-            return ~combined if is_not else combined
+            return _text_contains_clause(col, vals, negate=is_not)
 
     if field in ILIKE_NAME_COLS:
         col = ILIKE_NAME_COLS[field]
         vals = [v.strip() for v in value.split(',') if v.strip()]
         if not vals:
             return None
-        if is_exact:
-            clauses = [func.lower(col) == v.lower() for v in vals]
-            combined = or_(*clauses) if len(clauses) > 1 else clauses[0]
-            return ~combined if is_not else combined
-        else:
-            clauses = [col.ilike(f'%{_escape_like(v)}%', escape='\\') for v in vals]
-            combined = or_(*clauses) if len(clauses) > 1 else clauses[0]
-            return ~combined if is_not else combined
+        # equals는 위에서 policy_tokens 조회로 처리되므로 여기는 부분 일치(contains)만 해당
+        clauses = [col.ilike(f'%{_escape_like(v)}%', escape='\\') for v in vals]
+        combined = or_(*clauses) if len(clauses) > 1 else clauses[0]
+        return ~combined if is_not else combined
 
     if field == 'action':
         clause = func.lower(Policy.action) == value.lower()
@@ -282,39 +444,33 @@ async def _evaluate_leaf(
         if not ip_tokens:
             return None
         if op == 'only_within':
-            ids = await _addr_only_within_ids(db, device_ids, direction, ip_tokens)
+            query = _addr_only_within_query(device_ids, direction, ip_tokens)
         else:
-            ids = await _addr_policy_ids(db, device_ids, direction, ip_tokens, exact=is_exact)
-        if is_not:
-            return _id_notin_clause(ids) if ids else None
-        return _id_in_clause(ids)
+            query = _addr_policy_ids_query(device_ids, direction, ip_tokens, exact=is_exact)
+        return _member_filter_clause(query, is_not)
 
     # ─── 인덱스 기반 필드 (PolicyServiceMember) ──────────────────────────────
     if field == 'service':
         svc_tokens = [v.strip() for v in value.split(',') if v.strip()]
         if not svc_tokens:
             return None
-        svc_ids = await _svc_policy_ids(db, device_ids, svc_tokens) or set()
-        if is_not:
-            return _id_notin_clause(svc_ids) if svc_ids else None
-        return _id_in_clause(svc_ids)
+        return _member_filter_clause(_svc_policy_ids_query(device_ids, svc_tokens), is_not)
 
     return None
 
 
-async def _evaluate_expr_tree(
-    db: AsyncSession,
+def _evaluate_expr_tree(
     device_ids: List[int],
     node: FilterExprNode,
 ) -> Optional[ClauseElement]:
-    """필터 표현식 트리를 재귀적으로 SQLAlchemy WHERE 절로 변환."""
+    """필터 표현식 트리를 재귀적으로 SQLAlchemy WHERE 절로 변환 (DB 조회 없이 단일 문장으로 컴파일)."""
     if node.type == 'LEAF':
-        return await _evaluate_leaf(db, device_ids, node)
+        return _evaluate_leaf(device_ids, node)
 
     # AND / OR 노드
     child_clauses = []
     for child in node.children:
-        result = await _evaluate_expr_tree(db, device_ids, child)
+        result = _evaluate_expr_tree(device_ids, child)
         if result is not None:
             child_clauses.append(result)
 
@@ -337,38 +493,28 @@ async def search_policies(db: AsyncSession, req: schemas.PolicySearchRequest) ->
 
     # filter_expression 트리가 있으면 새 경로로 처리
     if req.filter_expression is not None:
-        expr_clause = await _evaluate_expr_tree(db, req.device_ids, req.filter_expression)
+        expr_clause = _evaluate_expr_tree(req.device_ids, req.filter_expression)
         if expr_clause is not None:
             stmt = stmt.where(expr_clause)
-        stmt = stmt.order_by(Policy.device_id.asc(), Policy.vsys.asc(), Policy.seq.asc(), Policy.rule_name.asc())
-        if req.skip:
-            stmt = stmt.offset(req.skip)
-        if req.limit:
-            stmt = stmt.limit(req.limit)
-        result = await db.execute(stmt)
-        return result.scalars().all()
+        return await _fetch_policy_page(db, stmt, req.device_ids, req.skip, req.limit, req.cursor)
 
-    # Text filters (ILIKE contains, with optional negation)
+    # Text filters (contains, with optional negation) — FTS 대상 컬럼은 policies_fts 인덱스로 조회
     def _text_filter(col, val: str, negate: bool = False):
-        cond = col.ilike(f"%{_escape_like(val.strip())}%", escape='\\')
-        return ~cond if negate else cond
+        return _text_contains_clause(col, [val.strip()], negate)
 
     if req.vsys:
         stmt = stmt.where(_text_filter(Policy.vsys, req.vsys, req.vsys_negate))
     if req.rule_name:
         names = [n.strip() for n in req.rule_name.split(',') if n.strip()]
         if names:
-            if req.rule_name_negate:
-                # NOT (A OR B) = NOT A AND NOT B
-                stmt = stmt.where(and_(*[~Policy.rule_name.ilike(f'%{_escape_like(n)}%', escape='\\') for n in names]))
-            else:
-                stmt = stmt.where(or_(*[Policy.rule_name.ilike(f'%{_escape_like(n)}%', escape='\\') for n in names]))
+            # negate: NOT (A OR B) = NOT A AND NOT B
+            stmt = stmt.where(_text_contains_clause(Policy.rule_name, names, req.rule_name_negate))
     if req.user:
         stmt = stmt.where(_text_filter(Policy.user, req.user, req.user_negate))
     if req.application:
         stmt = stmt.where(_text_filter(Policy.application, req.application, req.application_negate))
     if req.security_profile:
-        stmt = stmt.where(Policy.security_profile.ilike(f"%{_escape_like(req.security_profile.strip())}%", escape='\\'))
+        stmt = stmt.where(_text_contains_clause(Policy.security_profile, [req.security_profile.strip()]))
     if req.category:
         stmt = stmt.where(Policy.category.ilike(f"%{_escape_like(req.category.strip())}%", escape='\\'))
     if req.description:
@@ -403,88 +549,76 @@ async def search_policies(db: AsyncSession, req: schemas.PolicySearchRequest) ->
         stmt = stmt.where(Policy.last_hit_date <= to)
 
     # --- Member-index 기반 복합 필터링 ---
-    # 각 필터 유형(출발지 IP, 목적지 IP, 서비스/포트)별로 일치하는 정책 ID들을 수집합니다.
-    # 동일 필터 내의 여러 값은 'OR(합집합)'으로 처리하며, 서로 다른 필터(IP vs 서비스) 간에는 'AND(교집합)'로 처리합니다.
-
-    list_of_policy_id_sets = []
-
-    # 출발지/목적지 IP 필터 — overlap(포함) / exact(일치): 토큰 조건을 OR로 묶은 단일 쿼리
-    if req.src_ips:
-        list_of_policy_id_sets.append(await _addr_policy_ids(db, req.device_ids, 'source', req.src_ips))
-    if req.src_ips_exact:
-        list_of_policy_id_sets.append(await _addr_policy_ids(db, req.device_ids, 'source', req.src_ips_exact, exact=True))
-    if req.dst_ips:
-        list_of_policy_id_sets.append(await _addr_policy_ids(db, req.device_ids, 'destination', req.dst_ips))
-    if req.dst_ips_exact:
-        list_of_policy_id_sets.append(await _addr_policy_ids(db, req.device_ids, 'destination', req.dst_ips_exact, exact=True))
+    # 각 필터 유형(출발지 IP, 목적지 IP, 서비스/포트)별로 일치하는 정책 ID 서브쿼리를 만듭니다.
+    # 동일 필터 내의 여러 값은 'OR(합집합)'으로 처리하며, 서로 다른 필터(IP vs 서비스) 간에는
+    # 각 서브쿼리의 `Policy.id IN (...)` 조건을 AND로 결합해 교집합을 DB에서 계산합니다.
+
+    member_queries = []
+
+    # 출발지/목적지 IP 필터 — overlap(포함) / exact(일치) / only_within(모든 멤버가 범위 안)
+    # 파싱 가능한 토큰이 없으면(None) 일치하는 정책이 없으므로 바로 빈 결과를 반환
+    addr_filters = [
+        (req.src_ips, 'source', 'overlap'),
+        (req.src_ips_exact, 'source', 'exact'),
+        (req.dst_ips, 'destination', 'overlap'),
+        (req.dst_ips_exact, 'destination', 'exact'),
+        # 주의: 과거에는 교집합 계산 이후에 수집되어 필터가 무시되는 버그가 있었음 — 교집합 이전으로 이동
+        (req.src_ips_only_within, 'source', 'only_within'),
+        (req.dst_ips_only_within, 'destination', 'only_within'),
+    ]
+    for ip_list, direction, mode in addr_filters:
+        if not ip_list:
+            continue
+        if mode == 'only_within':
+            query = _addr_only_within_query(req.device_ids, direction, ip_list)
+        else:
+            query = _addr_policy_ids_query(req.device_ids, direction, ip_list, exact=(mode == 'exact'))
+        if query is None:
+            return []
+        member_queries.append(query)
 
     # 서비스 필터 (Service/Port Index 활용 + 이름 폴백)
     if req.services:
-        svc_policy_ids = await _svc_policy_ids(db, req.device_ids, req.services)
-        # 실제 검색이 수행된 경우에만 교집합에 추가 (빈 set이 모든 결과를 지우는 버그 방지)
-        if svc_policy_ids is not None:
-            list_of_policy_id_sets.append(svc_policy_ids)
-
-    # 출발지/목적지 IP 필터 — only_within (모든 멤버가 범위 안에 있는 정책)
-    # 주의: 과거에는 교집합 계산 이후에 수집되어 필터가 무시되는 버그가 있었음 — 교집합 이전으로 이동
-    if req.src_ips_only_within:
-        list_of_policy_id_sets.append(await _addr_only_within_ids(db, req.device_ids, 'source', req.src_ips_only_within))
-    if req.dst_ips_only_within:
-        list_of_policy_id_sets.append(await _addr_only_within_ids(db, req.device_ids, 'destination', req.dst_ips_only_within))
-
-    # 출발지 객체명 필터 — Policy.source ILIKE (인덱서가 원본 객체명을 token으로 저장하지 않으므로)
+        svc_query = _svc_policy_ids_query(req.device_ids, req.services)
+        # 실제 검색 조건이 있는 경우에만 교집합에 추가 (유효 토큰이 없으면 필터 미적용)
+        if svc_query is not None:
+            member_queries.append(svc_query)
+
+    # 출발지 객체명 필터 — 부분 일치 검색이므로 Policy.source ILIKE
+    # (policy_tokens에는 원본 멤버 이름이 있지만 완전 일치 조회용이라 부분 일치에는 쓸 수 없음)
     if req.src_names:
         valid_src_names = [n.strip() for n in req.src_names if n.strip()]
         if valid_src_names:
             stmt = stmt.where(or_(*[Policy.source.ilike(f'%{_escape_like(n)}%', escape='\\') for n in valid_src_names]))
 
-    # 목적지 객체명 필터 — Policy.destination ILIKE
+    # 목적지 객체명 필터 — 부분 일치 검색이므로 Policy.destination ILIKE
     if req.dst_names:
         valid_dst_names = [n.strip() for n in req.dst_names if n.strip()]
         if valid_dst_names:
             stmt = stmt.where(or_(*[Policy.destination.ilike(f'%{_escape_like(n)}%', escape='\\') for n in valid_dst_names]))
 
-    # 서비스 객체명 필터 — Policy.service ILIKE (인덱서가 원본 서비스 객체명을 보존하지 않으므로)
+    # 서비스 객체명 필터 — 부분 일치 검색이므로 Policy.service ILIKE
     if req.service_names:
         valid_svc_names = [n.strip() for n in req.service_names if n.strip()]
         if valid_svc_names:
             stmt = stmt.where(or_(*[Policy.service.ilike(f'%{_escape_like(n)}%', escape='\\') for n in valid_svc_names]))
 
-    # 모든 개별 인덱스 필터(IP, Service) 결과의 교집합(Intersection)을 최종 정책 ID 목록으로 확정
-    if list_of_policy_id_sets:
-        final_policy_ids = set.intersection(*list_of_policy_id_sets)
-
-        if not final_policy_ids:
-            return []
-
-        stmt = stmt.where(_id_in_clause(final_policy_ids))
+    # 모든 개별 인덱스 필터(IP, Service) 조건의 교집합(Intersection)
+    for query in member_queries:
+        stmt = stmt.where(Policy.id.in_(query))
 
     # ─── 제외 필터 (NOT IN) ───────────────────────────────────────────────────
 
-    if req.src_ips_exclude:
-        excluded = await _addr_policy_ids(db, req.device_ids, 'source', req.src_ips_exclude)
-        if excluded:
-            stmt = stmt.where(_id_notin_clause(excluded))
-
-    if req.src_ips_exact_exclude:
-        excluded = await _addr_policy_ids(db, req.device_ids, 'source', req.src_ips_exact_exclude, exact=True)
-        if excluded:
-            stmt = stmt.where(_id_notin_clause(excluded))
-
-    if req.dst_ips_exclude:
-        excluded = await _addr_policy_ids(db, req.device_ids, 'destination', req.dst_ips_exclude)
-        if excluded:
-            stmt = stmt.where(_id_notin_clause(excluded))
-
-    if req.dst_ips_exact_exclude:
-        excluded = await _addr_policy_ids(db, req.device_ids, 'destination', req.dst_ips_exact_exclude, exact=True)
-        if excluded:
-            stmt = stmt.where(_id_notin_clause(excluded))
-
-    if req.services_exclude:
-        excluded = await _svc_policy_ids(db, req.device_ids, req.services_exclude) or set()
-        if excluded:
-            stmt = stmt.where(_id_notin_clause(excluded))
+    exclude_queries = [
+        _addr_policy_ids_query(req.device_ids, 'source', req.src_ips_exclude) if req.src_ips_exclude else None,
+        _addr_policy_ids_query(req.device_ids, 'source', req.src_ips_exact_exclude, exact=True) if req.src_ips_exact_exclude else None,
+        _addr_policy_ids_query(req.device_ids, 'destination', req.dst_ips_exclude) if req.dst_ips_exclude else None,
+        _addr_policy_ids_query(req.device_ids, 'destination', req.dst_ips_exact_exclude, exact=True) if req.dst_ips_exact_exclude else None,
+        _svc_policy_ids_query(req.device_ids, req.services_exclude) if req.services_exclude else None,
+    ]
+    for query in exclude_queries:
+        if query is not None:
+            stmt = stmt.where(Policy.id.notin_(query))
 
     if req.src_names_exclude:
         valid = [n.strip() for n in req.src_names_exclude if n.strip()]
@@ -501,14 +635,5 @@ async def search_policies(db: AsyncSession, req: schemas.PolicySearchRequest) ->
         if valid:
             stmt = stmt.where(~or_(*[Policy.service.ilike(f'%{_escape_like(n)}%', escape='\\') for n in valid]))
 
-    # Ordering: device -> vsys -> seq -> rule_name
-    stmt = stmt.order_by(Policy.device_id.asc(), Policy.vsys.asc(), Policy.seq.asc(), Policy.rule_name.asc())
-
-    # Slice optionally
-    if req.skip:
-        stmt = stmt.offset(req.skip)
-    if req.limit:
-        stmt = stmt.limit(req.limit)
-
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    # Ordering: device -> vsys -> seq -> id, 커서가 있으면 키셋으로 이어서 조회
+    return await _fetch_policy_page(db, stmt, req.device_ids, req.skip, req.limit, req.cursor)
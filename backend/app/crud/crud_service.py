@@ -23,6 +23,9 @@ async def get_services_by_device(db: AsyncSession, device_id: int, skip: int = 0
 async def get_all_active_services_by_device(db: AsyncSession, device_id: int):
     return await base.get_all_active_by_device(db, Service, device_id)
 
+async def get_service_names_by_devices(db: AsyncSession, device_ids: list[int]) -> set[str]:
+    return await base.get_active_names_by_devices(db, Service, device_ids)
+
 async def create_services(db: AsyncSession, services: list[ServiceCreate]):
     return await base.create_many(db, Service, services)
 
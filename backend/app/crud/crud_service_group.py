@@ -20,6 +20,9 @@ async def get_service_groups_by_device(db: AsyncSession, device_id: int, skip: i
 async def get_all_active_service_groups_by_device(db: AsyncSession, device_id: int):
     return await base.get_all_active_by_device(db, ServiceGroup, device_id)
 
+async def get_service_group_names_by_devices(db: AsyncSession, device_ids: list[int]) -> set[str]:
+    return await base.get_active_names_by_devices(db, ServiceGroup, device_ids)
+
 async def create_service_groups(db: AsyncSession, service_groups: list[ServiceGroupCreate]):
     return await base.create_many(db, ServiceGroup, service_groups)
 
@@ -15,6 +15,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.api_v1.api import api_router as api_v1_router
 from app.core.auth import decode_token
+from app.core.executors import shutdown_process_pool
 from app.services.scheduler import sync_scheduler
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,7 @@ async def lifespan(app: FastAPI):
     logger.info("Application started and scheduler initialized")
     yield
     sync_scheduler.stop()
+    shutdown_process_pool()
     logger.info("Application shutdown and scheduler stopped")
 
 
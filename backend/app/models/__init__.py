@@ -1,12 +1,19 @@
 from .user import User
 from .device import Device
 from .policy import Policy
+from .policy_fts import policies_fts, POLICY_FTS_COLUMNS, POLICY_FTS_MIN_QUERY_LENGTH
 from .network_object import NetworkObject
 from .network_group import NetworkGroup
 from .service import Service
 from .service_group import ServiceGroup
 from .change_log import ChangeLog
-from .policy_members import PolicyAddressMember, PolicyServiceMember
+from .policy_members import PolicyAddressMember, PolicyServiceMember, PolicyToken, POLICY_TOKEN_FIELDS
+from .policy_index_staging import (
+    policy_address_members_staging, policy_service_members_staging, policy_tokens_staging,
+    policy_index_staging_ids, POLICY_INDEX_STAGING_TABLES,
+)
+from .group_closure import NetworkGroupClosure, ServiceGroupClosure
+from .object_usage import ObjectUsageCount
 from .analysis import AnalysisTask, RedundancyPolicySet, AnalysisResult
 from .sync_schedule import SyncSchedule
 from .settings import Settings
@@ -54,6 +54,9 @@ class Device(Base):
     cached_services = Column(Integer, nullable=True, default=0)
     cached_service_groups = Column(Integer, nullable=True, default=0)
 
+    # 검색 결과 캐시 무효화용 데이터 버전 — 동기화/재인덱싱이 데이터와 같은 트랜잭션에서 1씩 올립니다.
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # 상세 정보 — manual=True면 수기 입력값 유지, False(기본값)면 동기화 시 자동 수집값으로 갱신 (Palo Alto: show system info)
     hostname = Column(String, nullable=True)
     hostname_manual = Column(Boolean, nullable=False, default=False)
@@ -0,0 +1,57 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app.db.session import Base
+
+
+class NetworkGroupClosure(Base):
+    """
+    주소 그룹(NetworkGroup)의 전이 폐포(transitive closure)를 저장하는 모델입니다.
+
+    중첩 그룹을 끝까지 펼친 결과를 (그룹명, 최하위 멤버명) 행으로 보관하여,
+    정책 인덱싱 시 매번 DFS로 그룹을 확장하지 않고 조회만으로 멤버 집합을 얻습니다.
+    동기화 시 멤버 구성이 바뀐 그룹과 그 상위 그룹만 갱신됩니다.
+
+    Relations:
+        - Device (N:1): 폐포 엔트리가 특정 장비에 속합니다.
+    """
+    __tablename__ = "network_group_closures"
+
+    id = Column(Integer, primary_key=True)
+    device_id = Column(Integer, ForeignKey("devices.id"), nullable=False)
+
+    # 확장 대상 그룹명
+    group_name = Column(String, nullable=False)
+
+    # 펼쳐진 최하위 멤버명 (객체명, 미해석 이름, 또는 빈 그룹 마커 '__GROUP__:이름')
+    member_name = Column(String, nullable=False)
+
+    device = relationship("Device")
+
+    __table_args__ = (
+        Index("ix_net_group_closures_group", "device_id", "group_name"),
+        Index("ix_net_group_closures_member", "device_id", "member_name"),
+    )
+
+
+class ServiceGroupClosure(Base):
+    """
+    서비스 그룹(ServiceGroup)의 전이 폐포를 저장하는 모델입니다.
+
+    구조와 갱신 방식은 NetworkGroupClosure와 동일합니다.
+
+    Relations:
+        - Device (N:1): 폐포 엔트리가 특정 장비에 속합니다.
+    """
+    __tablename__ = "service_group_closures"
+
+    id = Column(Integer, primary_key=True)
+    device_id = Column(Integer, ForeignKey("devices.id"), nullable=False)
+    group_name = Column(String, nullable=False)
+    member_name = Column(String, nullable=False)
+
+    device = relationship("Device")
+
+    __table_args__ = (
+        Index("ix_svc_group_closures_group", "device_id", "group_name"),
+        Index("ix_svc_group_closures_member", "device_id", "member_name"),
+    )
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app.db.session import Base
+
+
+class ObjectUsageCount(Base):
+    """
+    장비별 객체/그룹 이름이 정책에서 참조되는 횟수를 미리 집계해 두는 모델입니다.
+
+    객체 목록의 '사용 정책' 컬럼이 요청마다 정책 전체를 집계하지 않도록, 동기화와 정책 인덱싱 시
+    변경된 정책·그룹과 관련된 이름만 다시 계산합니다. 참조가 없는 이름은 행을 두지 않습니다.
+
+    Relations:
+        - Device (N:1): 집계 행이 특정 장비에 속합니다.
+    """
+    __tablename__ = "object_usage_counts"
+
+    id = Column(Integer, primary_key=True)
+    device_id = Column(Integer, ForeignKey("devices.id"), nullable=False)
+
+    # 'address' (source/destination 참조) 또는 'service' (service 참조)
+    member_type = Column(String, nullable=False)
+    name = Column(String, nullable=False)
+
+    # 정책 필드에 이름이 직접 나열된 횟수 (source와 destination에 모두 있으면 2)
+    policy_count = Column(Integer, nullable=False, default=0)
+
+    # 이름을 (중첩 포함) 멤버로 가진 그룹을 통해 참조하는 정책 수 (중복 제거)
+    group_policy_count = Column(Integer, nullable=False, default=0)
+
+    device = relationship("Device")
+
+    __table_args__ = (
+        Index("ix_object_usage_counts_lookup", "device_id", "member_type", "name"),
+    )
@@ -20,8 +20,10 @@ class Policy(Base):
     __tablename__ = "policies"
 
     # 대부분의 정책 조회가 WHERE device_id = ? AND is_active = ? 형태이므로 복합 인덱스 필수
+    # ix_policies_keyset: 검색/목록의 키셋 페이지네이션 정렬 키 (device_id, vsys, seq, id — id는 rowid로 포함)
     __table_args__ = (
         Index("ix_policies_device_active", "device_id", "is_active"),
+        Index("ix_policies_keyset", "device_id", "is_active", "vsys", "seq"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+# 정책 텍스트 필드 전문 검색용 SQLite FTS5 가상 테이블 (external content = policies, tokenize = trigram).
+#
+# policies 테이블의 INSERT/UPDATE/DELETE 트리거가 내용을 동기화하므로 동기화 파이프라인은
+# 별도 작업 없이 그대로 반영됩니다. 가상 테이블은 Alembic 마이그레이션으로만 생성하며,
+# autogenerate 대상이 되지 않도록 Base.metadata와 분리된 MetaData에 조회용으로만 선언합니다.
+POLICY_FTS_TABLE = "policies_fts"
+
+# 인덱싱하는 Policy 컬럼 (가상 테이블 컬럼명 = Policy 컬럼명)
+POLICY_FTS_COLUMNS = ("rule_name", "description", "user", "application", "security_profile")
+
+# trigram 토크나이저는 3글자 미만 검색어를 인덱스로 찾을 수 없음
+POLICY_FTS_MIN_QUERY_LENGTH = 3
+
+policies_fts = Table(
+    POLICY_FTS_TABLE,
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    *[Column(name, String) for name in POLICY_FTS_COLUMNS],
+)
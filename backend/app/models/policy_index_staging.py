@@ -0,0 +1,48 @@
+"""
+정책 인덱스 재구축용 스테이징 테이블.
+
+`rebuild_policy_indices`는 새 멤버/토큰 행을 먼저 이 테이블들에 청크 단위로 커밋한 뒤,
+마지막에 짧은 트랜잭션 하나로 본 인덱스 테이블의 해당 정책 행을 교체합니다
+(DELETE + INSERT … SELECT). 재구축 중에도 검색은 이전 인덱스를 온전히 봅니다.
+
+스테이징 행은 장비(device_id) 단위로 구분되며 교체 후 비워집니다. 같은 장비의 재구축은 장비별
+잠금으로 직렬화되고, 중간에 실패해 남은 행은 같은 장비의 다음 재구축 시작 시 지워집니다. 본 테이블과 같은 컬럼(id 제외)을 가지며
+외래키는 두지 않습니다.
+"""
+
+from sqlalchemy import Column, Index, Integer, Table
+
+from app.db.session import Base
+from app.models.policy_members import PolicyAddressMember, PolicyServiceMember, PolicyToken
+
+
+def _staging_table(model) -> Table:
+    source = model.__table__
+    name = f"{source.name}_staging"
+    return Table(
+        name,
+        Base.metadata,
+        *(Column(c.name, c.type, nullable=c.nullable) for c in source.columns if c.name != "id"),
+        Index(f"ix_{name}_device", "device_id"),
+    )
+
+
+policy_address_members_staging = _staging_table(PolicyAddressMember)
+policy_service_members_staging = _staging_table(PolicyServiceMember)
+policy_tokens_staging = _staging_table(PolicyToken)
+
+# 이번 재구축에서 처리한 정책 ID (멤버 행이 없는 정책도 교체·인덱싱 완료 표시 대상에 포함)
+policy_index_staging_ids = Table(
+    "policy_index_staging_ids",
+    Base.metadata,
+    Column("device_id", Integer, nullable=False),
+    Column("policy_id", Integer, nullable=False),
+    Index("ix_policy_index_staging_ids_device", "device_id"),
+)
+
+# (본 테이블, 스테이징 테이블) 쌍
+POLICY_INDEX_STAGING_TABLES = (
+    (PolicyAddressMember.__table__, policy_address_members_staging),
+    (PolicyServiceMember.__table__, policy_service_members_staging),
+    (PolicyToken.__table__, policy_tokens_staging),
+)
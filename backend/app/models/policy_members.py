@@ -25,19 +25,31 @@ class PolicyAddressMember(Base):
     
     # 원본 토큰 (객체 이름 또는 IP)
     token = Column(String, nullable=True)  # original token (for empty groups)
-    token_type = Column(String, nullable=True)  # 'ipv4_range' | 'unknown'
+    token_type = Column(String, nullable=True)  # 'ipv4_range' | 'ipv6_range' | 'unknown'
     
     # IP 범위 (검색 성능을 위해 정수형으로 변환)
     # IPv4의 경우 BigInteger에 담아 비교 검색을 수행합니다.
     ip_start = Column(BigInteger, nullable=True)
     ip_end = Column(BigInteger, nullable=True)
 
+    # IPv6 범위 (ipv6_range 행만 사용)
+    # 128비트 주소를 상/하위 64비트로 나눠 2^63 편향을 준 부호 있는 정수로 저장하며,
+    # (hi, lo) 사전순 비교가 원래 주소 순서와 같습니다 (normalize.split_ipv6_numeric 참고).
+    ip6_start_hi = Column(BigInteger, nullable=True)
+    ip6_start_lo = Column(BigInteger, nullable=True)
+    ip6_end_hi = Column(BigInteger, nullable=True)
+    ip6_end_lo = Column(BigInteger, nullable=True)
+
     policy = relationship("Policy", back_populates="address_members")
     device = relationship("Device")
 
     # 검색 최적화를 위한 복합 인덱스 구성
     __table_args__ = (
         Index("ix_policy_addr_members_lookup", "device_id", "direction", "ip_start", "ip_end"),
+        Index(
+            "ix_policy_addr_members_lookup6",
+            "device_id", "direction", "ip6_start_hi", "ip6_start_lo", "ip6_end_hi", "ip6_end_lo",
+        ),
         Index("ix_policy_addr_members_policy", "policy_id"),
     )
 
@@ -61,9 +73,11 @@ class PolicyServiceMember(Base):
     
     # 원본 토큰 (예: 'tcp/80', 'any')
     token = Column(String, nullable=False)  # original token string
-    token_type = Column(String, nullable=True)  # any | proto_port | unknown
+    token_type = Column(String, nullable=True)  # any | proto_port | protocol | application_default | unknown
     
-    # 프로토콜 및 포트 범위 (검색 최적화용)
+    # 프로토콜 및 포트 범위 (검색 최적화용). 프로토콜은 소문자로 저장하며,
+    # application-default 센티넬 행은 protocol = 'application-default', 포트 NULL.
+    # 포트 없는 프로토콜 서비스(ICMP 등)는 token_type = 'protocol', protocol = 해당 프로토콜, 포트 NULL
     protocol = Column(String, nullable=True)
     port_start = Column(Integer, nullable=True)
     port_end = Column(Integer, nullable=True)
@@ -76,3 +90,40 @@ class PolicyServiceMember(Base):
         Index("ix_policy_svc_members_lookup", "device_id", "protocol", "port_start", "port_end"),
         Index("ix_policy_svc_members_policy", "policy_id"),
     )
+
+
+# 이름 토큰으로 정규화하는 Policy 필드 (policy_tokens.field 값 = Policy 컬럼명)
+POLICY_TOKEN_FIELDS = ("source", "destination", "service", "application", "user", "from_zone", "to_zone")
+
+
+class PolicyToken(Base):
+    """
+    정책의 쉼표 구분 이름 필드를 (필드, 토큰, 위치) 행으로 정규화한 모델입니다.
+
+    "목적지에 객체 X를 쓰는 정책"처럼 이름이 정확히 일치하는 멤버를 찾을 때 문자열 패턴 검색 대신
+    (device_id, field, token) 인덱스 동등 조회를 사용합니다. 주소/서비스 인덱스와 함께 정책 인덱싱 시
+    다시 생성되며, 이름 비교는 기존 검색과 같이 대소문자를 구분하지 않습니다 (NOCASE 인덱스).
+
+    Relations:
+        - Policy (N:1): 여러 토큰 행이 하나의 정책에 속합니다.
+        - Device (N:1): 토큰 행이 특정 장비에 속합니다.
+    """
+    __tablename__ = "policy_tokens"
+
+    id = Column(Integer, primary_key=True)
+    device_id = Column(Integer, ForeignKey("devices.id"), nullable=False)
+    policy_id = Column(Integer, ForeignKey("policies.id"), nullable=False)
+
+    # Policy 컬럼명 (POLICY_TOKEN_FIELDS)
+    field = Column(String, nullable=False)
+
+    # 공백을 제거한 멤버 이름과 필드 내 순서 (0부터)
+    token = Column(String, nullable=False)
+    position = Column(Integer, nullable=False)
+
+    device = relationship("Device")
+
+    __table_args__ = (
+        Index("ix_policy_tokens_lookup", device_id, field, token.collate("NOCASE")),
+        Index("ix_policy_tokens_policy", policy_id),
+    )
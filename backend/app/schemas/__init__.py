@@ -5,6 +5,7 @@ from .network_group import NetworkGroup, NetworkGroupCreate
 from .service import Service, ServiceCreate
 from .service_group import ServiceGroup, ServiceGroupCreate
 from .object_search import ObjectSearchRequest, ObjectSearchResponse
+from .flow_lookup import FlowTuple, FlowLookupRequest, FlowCandidate, FlowMatch, FlowLookupResponse
 from .msg import Msg
 from .change_log import ChangeLog, ChangeLogCreate
 from .analysis import (
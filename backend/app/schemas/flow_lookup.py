@@ -0,0 +1,53 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class FlowTuple(BaseModel):
+    """조회할 흐름 1건 (존/vsys는 지정한 경우에만 비교)."""
+    src_ip: str
+    dst_ip: str
+    protocol: str = "tcp"  # tcp | udp | icmp ... 또는 프로토콜 번호 ('6', '17')
+    port: Optional[int] = None  # 목적지 포트 (ICMP 등 포트가 없으면 생략)
+    from_zone: Optional[str] = None
+    to_zone: Optional[str] = None
+    vsys: Optional[str] = None
+
+
+class FlowLookupRequest(BaseModel):
+    flows: List[FlowTuple]
+
+
+class FlowCandidate(BaseModel):
+    """포트 조건을 알 수 없어(application-default) 흐름과 일치할 수도 있는 정책."""
+    policy_id: int
+    rule_name: Optional[str] = None
+    vsys: Optional[str] = None
+    seq: Optional[int] = None
+    action: Optional[str] = None
+    application: Optional[str] = None
+
+
+class FlowMatch(BaseModel):
+    """
+    흐름 1건의 조회 결과. index는 요청 flows에서의 위치입니다.
+
+    possible_matches는 일치 정책(없으면 끝까지)보다 앞서 평가되는 application-default 정책 중
+    서비스 외 조건이 모두 일치하는 정책입니다 (평가 순서). 비어 있지 않으면 실제 첫 일치 정책은
+    이 중 하나일 수 있습니다.
+    """
+    index: int
+    matched: bool
+    policy_id: Optional[int] = None
+    rule_name: Optional[str] = None
+    vsys: Optional[str] = None
+    seq: Optional[int] = None
+    action: Optional[str] = None
+    application: Optional[str] = None
+    possible_matches: List[FlowCandidate] = []
+    error: Optional[str] = None
+
+
+class FlowLookupResponse(BaseModel):
+    device_id: int
+    results: List[FlowMatch]
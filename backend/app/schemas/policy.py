@@ -113,6 +113,8 @@ class PolicySearchRequest(BaseModel):
     # Paging (optional; AG-Grid usually client-side). If provided, backend slices.
     skip: Optional[int] = None
     limit: Optional[int] = None
+    # 키셋 페이지네이션: 이전 응답의 next_cursor를 넘기면 그 다음 정책부터 조회 (skip보다 우선)
+    cursor: Optional[str] = None
 
     # 필터 표현식 트리 (존재하면 flat 필드 대신 이걸 우선 사용)
     filter_expression: Optional[FilterExprNode] = None
@@ -121,6 +123,8 @@ class PolicySearchRequest(BaseModel):
 class PolicySearchResponse(BaseModel):
     policies: List[Policy]
     valid_object_names: List[str]
+    # limit만큼 가득 찬 페이지일 때 다음 페이지 요청용 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
 
 
 # Response schema for policy count
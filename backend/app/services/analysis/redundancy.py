@@ -1,23 +1,275 @@
 
-import asyncio
 import csv
 import io
 import logging
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app import crud
-from app.core.executors import CPU_EXECUTOR
-from app.models import Policy, Device, AnalysisTask, PolicyAddressMember, PolicyServiceMember
+from app.core.executors import run_cpu_bound
+from app.models import Policy, Device, AnalysisTask
 from app.schemas.analysis import RedundancyPolicySetCreate
 from app.models.analysis import RedundancyPolicySetType
 
 logger = logging.getLogger(__name__)
 
+AddrRange = Tuple[int, int]
+SvcRange = Tuple[Optional[str], int, int]
+# (set_number, UPPER/LOWER, policy_id) — 워커가 반환하는 결과 단위
+SetEntry = Tuple[int, RedundancyPolicySetType, int]
+
+
+class PolicyPayload(NamedTuple):
+    """
+    중복 분석에 필요한 정책 정보만 추린 picklable 페이로드입니다.
+
+    ORM 객체(세션/관계 로딩 상태 포함) 대신 숫자 범위와 문자열 튜플만 담아
+    프로세스 풀 워커로 저렴하게 전달할 수 있습니다.
+    """
+    id: int
+    action: Optional[str]
+    src: Tuple[AddrRange, ...]
+    dst: Tuple[AddrRange, ...]
+    svc: Tuple[SvcRange, ...]
+    # 범위로 해소되지 않은 토큰 (빈 그룹 등, token_type == 'unknown')
+    src_groups: Tuple[str, ...]
+    dst_groups: Tuple[str, ...]
+    svc_groups: Tuple[str, ...]
+    user: Optional[str]
+    application: Optional[str]
+    security_profile: Optional[str]
+    category: Optional[str]
+    vsys: Optional[str]
+
+
+def build_policy_payload(policy: Policy) -> PolicyPayload:
+    """정책과 로딩된 주소/서비스 멤버로 PolicyPayload를 만듭니다 (이벤트 루프에서 호출)."""
+    addr_ranges = {'source': [], 'destination': []}
+    addr_groups = {'source': [], 'destination': []}
+    for m in policy.address_members:
+        if m.direction not in addr_ranges:
+            continue
+        if m.ip_start is not None and m.ip_end is not None:
+            addr_ranges[m.direction].append((m.ip_start, m.ip_end))
+        elif m.token and m.token_type == 'unknown':
+            addr_groups[m.direction].append(m.token)
+
+    svc, svc_groups = [], []
+    for m in policy.service_members:
+        if m.port_start is not None and m.port_end is not None:
+            svc.append((m.protocol, m.port_start, m.port_end))
+        elif m.token and m.token_type == 'unknown':
+            svc_groups.append(m.token)
+
+    return PolicyPayload(
+        id=policy.id,
+        action=policy.action,
+        src=tuple(addr_ranges['source']),
+        dst=tuple(addr_ranges['destination']),
+        svc=tuple(svc),
+        src_groups=tuple(addr_groups['source']),
+        dst_groups=tuple(addr_groups['destination']),
+        svc_groups=tuple(svc_groups),
+        user=policy.user,
+        application=policy.application,
+        security_profile=policy.security_profile,
+        category=policy.category,
+        vsys=policy.vsys,
+    )
+
+
+def _normalize_text_field(value: Optional[str]) -> Tuple[str, ...]:
+    """콤마 구분 텍스트 필드를 정렬된 튜플로 정규화합니다.
+
+    'A,B' 와 'B,A' 를 동일하게 취급합니다.
+    LDAP DN처럼 값 내부에 콤마가 포함된 경우 따옴표로 감싼 CSV 형식("v1,v2","v3,v4")을 올바르게 처리합니다.
+    """
+    if not value:
+        return ()
+    try:
+        reader = csv.reader(io.StringIO(value))
+        tokens = [v.strip() for row in reader for v in row if v.strip()]
+    except Exception:
+        tokens = [v.strip() for v in value.split(',') if v.strip()]
+    return tuple(sorted(tokens))
+
+
+def _normalize_policy_key(payload: PolicyPayload, vendor: str) -> Tuple:
+    """
+    정책의 중복 여부를 판단하기 위한 정규화된 고유 키를 생성합니다.
+
+    비교 기준:
+    - 출발지/목적지 주소: 인덱서가 해소한 숫자형 IP 범위 (ip_start-ip_end) 집합의 정확한 일치.
+      예) Host_A(192.168.1.0/24)와 Host_C(192.168.1.0/24)는 같은 범위로 매칭,
+          Host_B(192.168.1.2)는 다른 범위이므로 미매칭.
+      범위로 해소되지 않은 빈 그룹 토큰도 키에 포함합니다.
+    - 서비스: 프로토콜 + 포트 범위 집합의 정확한 일치.
+    - 나머지 텍스트 필드(user, application 등): 콤마 기준 분리 후 정렬 비교.
+    """
+    key_fields = [
+        payload.action,
+        (tuple(sorted(payload.src)), tuple(sorted(payload.src_groups))),
+        _normalize_text_field(payload.user),
+        (tuple(sorted(payload.dst)), tuple(sorted(payload.dst_groups))),
+        (tuple(sorted(payload.svc, key=lambda s: (str(s[0]), s[1], s[2]))), tuple(sorted(payload.svc_groups))),
+        _normalize_text_field(payload.application),
+    ]
+
+    # 벤더 특화 필드 (Palo Alto)
+    if vendor == 'paloalto':
+        key_fields.extend([
+            _normalize_text_field(payload.security_profile),
+            _normalize_text_field(payload.category),
+            payload.vsys,  # vsys는 단일 값
+        ])
+
+    return tuple(key_fields)
+
+
+def find_duplicate_sets(payloads: List[PolicyPayload], vendor: str) -> List[SetEntry]:
+    """정규화 키 기반 중복 세트 그룹화 (순수 CPU 연산 — 스레드/프로세스 워커에서 호출)."""
+    policy_map: Dict[Tuple, int] = {}
+    lower_entries: List[SetEntry] = []
+    upper_entries: Dict[int, SetEntry] = {}
+    lower_rules_count: Dict[int, int] = defaultdict(int)
+    current_set_number = 1
+
+    for payload in payloads:
+        key = _normalize_policy_key(payload, vendor)
+
+        # 이미 동일한 키가 맵에 존재하는 경우 (중복 발견)
+        if key in policy_map:
+            set_number = policy_map[key]
+            lower_entries.append((set_number, RedundancyPolicySetType.LOWER, payload.id))
+            lower_rules_count[set_number] += 1
+        else:
+            # 새로운 정책 키 등록 (상위 정책 후보)
+            policy_map[key] = current_set_number
+            upper_entries[current_set_number] = (current_set_number, RedundancyPolicySetType.UPPER, payload.id)
+            current_set_number += 1
+
+    # 하위 정책이 있는 상위 정책만 결과에 포함한 뒤 모든 하위 정책 추가
+    final_entries = [entry for set_num, entry in upper_entries.items() if lower_rules_count[set_num] > 0]
+    final_entries.extend(lower_entries)
+    return final_entries
+
+
+# ------------------------------------------------------------------
+# 논리적 포함 관계 분석 (fpat RedundancyAnalyzer.analyze_logical() 이식)
+# DB에 저장된 정수형 IP/포트 범위를 사용하여 A ⊆ B 포함 여부를 판단합니다.
+# 완전 일치만 탐지하는 find_duplicate_sets()와 달리, 더 넓은 정책이
+# 좁은 정책을 포함하는 경우도 탐지합니다 (예: 10.0.0.0/8 ⊇ 10.1.0.0/16).
+# ------------------------------------------------------------------
+
+def _is_addr_subset(small: Tuple[AddrRange, ...], large: Tuple[AddrRange, ...]) -> bool:
+    """small의 모든 IP 범위가 large의 어느 하나에 포함되는지 확인합니다."""
+    if not large:
+        return True   # large는 'any' — 모든 주소 포함
+    if not small:
+        return False  # small은 'any'이지만 large는 구체적 — small이 더 넓음
+    for s_start, s_end in small:
+        if not any(l_start <= s_start and s_end <= l_end for l_start, l_end in large):
+            return False
+    return True
+
+
+def _is_svc_subset(small: Tuple[SvcRange, ...], large: Tuple[SvcRange, ...]) -> bool:
+    """small의 모든 서비스 범위가 large의 어느 하나에 포함되는지 확인합니다.
+
+    주의: 빈 리스트는 'any'가 아닌 "포트 정보 없음(예: ICMP)" 을 의미합니다.
+    'any' 서비스는 (protocol='any', port_start=0, port_end=65535)로 저장됩니다.
+    """
+    if not large:
+        # large가 비어있으면 ICMP 등 포트 없는 서비스만 허용하는 정책.
+        # small도 비어있을 때만 True (같은 non-port 서비스끼리).
+        return not small
+    if not small:
+        # small이 비어있는데 large가 포트 기반 서비스 → 포함 불가.
+        return False
+    for s_proto, s_start, s_end in small:
+        covered = False
+        for l_proto, l_start, l_end in large:
+            proto_ok = l_proto in (None, 'any') or s_proto in (None, 'any') or l_proto == s_proto
+            if proto_ok and l_start <= s_start and s_end <= l_end:
+                covered = True
+                break
+        if not covered:
+            return False
+    return True
+
+
+def _is_text_subset(small_val: Optional[str], large_val: Optional[str]) -> bool:
+    """텍스트 필드의 포함 관계를 확인합니다.
+
+    large_val이 any / all / None / 빈 문자열이면 모든 값을 포함 → True.
+    small_val이 any인데 large_val이 구체적이면 → False.
+    그 외에는 정확히 일치해야 → True.
+    """
+    def _is_any(v: Optional[str]) -> bool:
+        return not v or v.strip().lower() in ('any', 'all')
+
+    if _is_any(large_val):
+        return True
+    if _is_any(small_val):
+        return False
+    return (small_val or '').strip() == (large_val or '').strip()
+
+
+def _is_logically_contained(small: PolicyPayload, large: PolicyPayload, vendor: str) -> bool:
+    """small 정책이 large 정책에 논리적으로 포함되는지 확인합니다 (small ⊆ large)."""
+    # 1~3. 소스 주소 / 목적지 주소 / 서비스
+    if not _is_addr_subset(small.src, large.src):
+        return False
+    if not _is_addr_subset(small.dst, large.dst):
+        return False
+    if not _is_svc_subset(small.svc, large.svc):
+        return False
+
+    # 4~5. 사용자 / 애플리케이션: large가 any가 아니면 일치해야 함
+    if not _is_text_subset(small.user, large.user):
+        return False
+    if not _is_text_subset(small.application, large.application):
+        return False
+
+    # 6. 벤더 특화 필드 (Palo Alto)
+    if vendor == 'paloalto':
+        if not _is_text_subset(small.vsys, large.vsys):
+            return False
+        if not _is_text_subset(small.security_profile, large.security_profile):
+            return False
+        if not _is_text_subset(small.category, large.category):
+            return False
+
+    return True
+
+
+def find_logical_sets(payloads: List[PolicyPayload], vendor: str) -> List[SetEntry]:
+    """논리적 포함 관계 O(n²) 비교 (순수 CPU 연산 — 스레드/프로세스 워커에서 호출)."""
+    results: List[SetEntry] = []
+    policy_map: Dict[int, int] = {}   # 정책 index → set_number
+    current_set_number = 1
+
+    for i, target in enumerate(payloads):
+        for j in range(i):
+            base = payloads[j]
+            if _is_logically_contained(target, base, vendor):
+                group_no = policy_map.get(j)
+                if group_no is None:
+                    group_no = current_set_number
+                    policy_map[j] = group_no
+                    results.append((group_no, RedundancyPolicySetType.UPPER, base.id))
+                    current_set_number += 1
+                results.append((group_no, RedundancyPolicySetType.LOWER, target.id))
+                policy_map[i] = group_no
+                break  # 첫 번째 포함 관계가 확인되면 중단 (fpat 동일 방식)
+
+    return results
+
+
 class RedundancyAnalyzer:
     """
     중복 정책 분석을 수행하는 클래스입니다.
@@ -58,81 +310,22 @@ class RedundancyAnalyzer:
         logger.info(f"총 {len(policies)}개의 정책이 조회되었습니다.")
         return policies
 
-    @staticmethod
-    def _normalize_text_field(value: Optional[str]) -> Tuple[str, ...]:
-        """콤마 구분 텍스트 필드를 정렬된 튜플로 정규화합니다.
-
-        'A,B' 와 'B,A' 를 동일하게 취급합니다.
-        LDAP DN처럼 값 내부에 콤마가 포함된 경우 따옴표로 감싼 CSV 형식("v1,v2","v3,v4")을 올바르게 처리합니다.
-        """
-        if not value:
-            return ()
-        try:
-            reader = csv.reader(io.StringIO(value))
-            tokens = [v.strip() for row in reader for v in row if v.strip()]
-        except Exception:
-            tokens = [v.strip() for v in value.split(',') if v.strip()]
-        return tuple(sorted(tokens))
-
-    def _normalize_policy_key(self, policy: Policy) -> Tuple:
-        """
-        정책의 중복 여부를 판단하기 위한 정규화된 고유 키를 생성합니다.
-
-        비교 기준:
-        - 출발지/목적지 주소: 인덱서가 해소한 숫자형 IP 범위 (ip_start-ip_end) 집합의 정확한 일치.
-          예) Host_A(192.168.1.0/24)와 Host_C(192.168.1.0/24)는 같은 범위로 매칭,
-              Host_B(192.168.1.2)는 다른 범위이므로 미매칭.
-        - 서비스: 프로토콜 + 포트 범위 집합의 정확한 일치.
-        - 나머지 텍스트 필드(user, application 등): 콤마 기준 분리 후 정렬 비교.
-        """
-        # 출발지 주소: 해소된 IP 범위 집합 (빈 그룹 토큰 포함)
-        src_addrs = []
-        for m in policy.address_members:
-            if m.direction == 'source':
-                if m.ip_start is not None and m.ip_end is not None:
-                    src_addrs.append(f"{m.ip_start}-{m.ip_end}")
-                elif m.token and m.token_type == 'unknown':
-                    src_addrs.append(f"__GROUP__:{m.token}")
-        src_addrs = tuple(sorted(src_addrs))
-
-        # 목적지 주소
-        dst_addrs = []
-        for m in policy.address_members:
-            if m.direction == 'destination':
-                if m.ip_start is not None and m.ip_end is not None:
-                    dst_addrs.append(f"{m.ip_start}-{m.ip_end}")
-                elif m.token and m.token_type == 'unknown':
-                    dst_addrs.append(f"__GROUP__:{m.token}")
-        dst_addrs = tuple(sorted(dst_addrs))
-
-        # 서비스: 해소된 포트 범위 집합 (빈 그룹 토큰 포함)
-        services = []
-        for m in policy.service_members:
-            if m.port_start is not None and m.port_end is not None:
-                services.append(f"{m.protocol}/{m.port_start}-{m.port_end}")
-            elif m.token and m.token_type == 'unknown':
-                services.append(f"__GROUP__:{m.token}")
-        services = tuple(sorted(services))
-
-        # 텍스트 필드: 콤마 분리 후 정렬 비교
-        key_fields = [
-            policy.action,
-            src_addrs,
-            self._normalize_text_field(policy.user),
-            dst_addrs,
-            services,
-            self._normalize_text_field(policy.application),
+    def _to_set_creates(self, entries: List[SetEntry]) -> List[RedundancyPolicySetCreate]:
+        """워커가 반환한 (set_number, type, policy_id) 튜플을 저장용 스키마로 변환합니다."""
+        return [
+            RedundancyPolicySetCreate(task_id=self.task.id, set_number=set_number, type=set_type, policy_id=policy_id)
+            for set_number, set_type, policy_id in entries
         ]
 
-        # 벤더 특화 필드 (Palo Alto)
-        if self.vendor == 'paloalto':
-            key_fields.extend([
-                self._normalize_text_field(policy.security_profile),
-                self._normalize_text_field(policy.category),
-                policy.vsys,  # vsys는 단일 값
-            ])
+    async def _load_payloads(self) -> List[PolicyPayload]:
+        """장비 벤더를 확인하고 분석 대상 정책을 picklable 페이로드로 변환합니다."""
+        device = await crud.device.get_device(self.db, device_id=self.device_id)
+        if not device:
+            raise ValueError(f"Device ID {self.device_id}를 찾을 수 없습니다.")
+        self.vendor = device.vendor
 
-        return tuple(key_fields)
+        policies = await self._get_policies_with_members()
+        return [build_policy_payload(p) for p in policies]
 
     async def analyze(self) -> List[RedundancyPolicySetCreate]:
         """
@@ -146,18 +339,12 @@ class RedundancyAnalyzer:
         """
         logger.info(f"Task ID {self.task.id}에 대한 중복 정책 분석 시작.")
 
-        device = await crud.device.get_device(self.db, device_id=self.device_id)
-        if not device:
-            raise ValueError(f"Device ID {self.device_id}를 찾을 수 없습니다.")
-        self.vendor = device.vendor
-
-        policies = await self._get_policies_with_members()
+        payloads = await self._load_payloads()
 
         logger.info("정책 중복 여부 확인 중...")
-        # CPU 바운드 키 생성/그룹화가 이벤트 루프를 점유하지 않도록 executor에서 실행
-        final_results = await asyncio.get_running_loop().run_in_executor(
-            CPU_EXECUTOR, self._find_duplicate_sets, policies
-        )
+        # CPU 바운드 키 생성/그룹화가 이벤트 루프를 점유하지 않도록 분석 백엔드(스레드/프로세스)에서 실행
+        entries = await run_cpu_bound(find_duplicate_sets, payloads, self.vendor)
+        final_results = self._to_set_creates(entries)
 
         if not final_results:
             logger.info("중복 정책이 발견되지 않았습니다.")
@@ -166,179 +353,6 @@ class RedundancyAnalyzer:
         logger.info(f"{len(final_results)}개의 중복 분석 결과를 찾았습니다.")
         return final_results
 
-    def _find_duplicate_sets(self, policies: List[Policy]) -> List[RedundancyPolicySetCreate]:
-        """정규화 키 기반 중복 세트 그룹화 (순수 CPU 연산 — executor 스레드에서 호출)."""
-        policy_map: Dict[Tuple, int] = {}
-        temp_results: List[RedundancyPolicySetCreate] = []
-        upper_rules: Dict[int, RedundancyPolicySetCreate] = {}
-        lower_rules_count: Dict[int, int] = defaultdict(int)
-        current_set_number = 1
-
-        for policy in policies:
-            key = self._normalize_policy_key(policy)
-            
-            # 이미 동일한 키가 맵에 존재하는 경우 (중복 발견)
-            if key in policy_map:
-                set_number = policy_map[key]
-                result = RedundancyPolicySetCreate(
-                    task_id=self.task.id,
-                    set_number=set_number,
-                    type=RedundancyPolicySetType.LOWER,
-                    policy_id=policy.id
-                )
-                temp_results.append(result)
-                lower_rules_count[set_number] += 1
-            else:
-                # 새로운 정책 키 등록 (상위 정책 후보)
-                policy_map[key] = current_set_number
-                result = RedundancyPolicySetCreate(
-                    task_id=self.task.id,
-                    set_number=current_set_number,
-                    type=RedundancyPolicySetType.UPPER,
-                    policy_id=policy.id
-                )
-                upper_rules[current_set_number] = result
-                current_set_number += 1
-
-        final_results = []
-        # 하위 정책이 있는 상위 정책만 결과에 포함
-        for set_num, upper_rule in upper_rules.items():
-            if lower_rules_count[set_num] > 0:
-                final_results.append(upper_rule)
-
-        # 모든 하위 정책 추가
-        final_results.extend([
-            r for r in temp_results if r.type == RedundancyPolicySetType.LOWER
-        ])
-
-        return final_results
-
-    # ------------------------------------------------------------------
-    # 논리적 포함 관계 분석 (fpat RedundancyAnalyzer.analyze_logical() 이식)
-    # DB에 저장된 정수형 IP/포트 범위를 사용하여 A ⊆ B 포함 여부를 판단합니다.
-    # 기존 analyze()가 텍스트 완전 일치만 탐지하는 것과 달리, 더 넓은 정책이
-    # 좁은 정책을 포함하는 경우도 탐지합니다 (예: 10.0.0.0/8 ⊇ 10.1.0.0/16).
-    # ------------------------------------------------------------------
-
-    def _get_addr_ranges(
-        self, members: list, direction: str
-    ) -> List[Tuple[int, int]]:
-        """지정 방향(source/destination)의 정수형 IP 범위 목록을 반환합니다."""
-        return [
-            (m.ip_start, m.ip_end)
-            for m in members
-            if m.direction == direction and m.ip_start is not None and m.ip_end is not None
-        ]
-
-    def _get_svc_ranges(
-        self, members: list
-    ) -> List[Tuple[Optional[str], int, int]]:
-        """(protocol, port_start, port_end) 튜플 목록을 반환합니다."""
-        return [
-            (m.protocol, m.port_start, m.port_end)
-            for m in members
-            if m.port_start is not None and m.port_end is not None
-        ]
-
-    def _is_addr_subset(
-        self,
-        small: List[Tuple[int, int]],
-        large: List[Tuple[int, int]],
-    ) -> bool:
-        """small의 모든 IP 범위가 large의 어느 하나에 포함되는지 확인합니다."""
-        if not large:
-            return True   # large는 'any' — 모든 주소 포함
-        if not small:
-            return False  # small은 'any'이지만 large는 구체적 — small이 더 넓음
-        for s_start, s_end in small:
-            if not any(l_start <= s_start and s_end <= l_end for l_start, l_end in large):
-                return False
-        return True
-
-    def _is_svc_subset(
-        self,
-        small: List[Tuple[Optional[str], int, int]],
-        large: List[Tuple[Optional[str], int, int]],
-    ) -> bool:
-        """small의 모든 서비스 범위가 large의 어느 하나에 포함되는지 확인합니다.
-
-        주의: 빈 리스트는 'any'가 아닌 "포트 정보 없음(예: ICMP)" 을 의미합니다.
-        'any' 서비스는 (protocol='any', port_start=0, port_end=65535)로 저장됩니다.
-        """
-        if not large:
-            # large가 비어있으면 ICMP 등 포트 없는 서비스만 허용하는 정책.
-            # small도 비어있을 때만 True (같은 non-port 서비스끼리).
-            return not small
-        if not small:
-            # small이 비어있는데 large가 포트 기반 서비스 → 포함 불가.
-            return False
-        for s_proto, s_start, s_end in small:
-            covered = False
-            for l_proto, l_start, l_end in large:
-                proto_ok = l_proto in (None, 'any') or s_proto in (None, 'any') or l_proto == s_proto
-                if proto_ok and l_start <= s_start and s_end <= l_end:
-                    covered = True
-                    break
-            if not covered:
-                return False
-        return True
-
-    @staticmethod
-    def _is_text_subset(small_val: Optional[str], large_val: Optional[str]) -> bool:
-        """텍스트 필드의 포함 관계를 확인합니다.
-
-        large_val이 any / all / None / 빈 문자열이면 모든 값을 포함 → True.
-        small_val이 any인데 large_val이 구체적이면 → False.
-        그 외에는 정확히 일치해야 → True.
-        """
-        def _is_any(v: Optional[str]) -> bool:
-            return not v or v.strip().lower() in ('any', 'all')
-
-        if _is_any(large_val):
-            return True
-        if _is_any(small_val):
-            return False
-        return (small_val or '').strip() == (large_val or '').strip()
-
-    def _is_logically_contained(self, small: Policy, large: Policy) -> bool:
-        """small 정책이 large 정책에 논리적으로 포함되는지 확인합니다 (small ⊆ large)."""
-        # 1. 소스 주소
-        small_src = self._get_addr_ranges(small.address_members, 'source')
-        large_src = self._get_addr_ranges(large.address_members, 'source')
-        if not self._is_addr_subset(small_src, large_src):
-            return False
-
-        # 2. 목적지 주소
-        small_dst = self._get_addr_ranges(small.address_members, 'destination')
-        large_dst = self._get_addr_ranges(large.address_members, 'destination')
-        if not self._is_addr_subset(small_dst, large_dst):
-            return False
-
-        # 3. 서비스
-        small_svc = self._get_svc_ranges(small.service_members)
-        large_svc = self._get_svc_ranges(large.service_members)
-        if not self._is_svc_subset(small_svc, large_svc):
-            return False
-
-        # 4. 사용자: large가 any가 아니면 일치해야 함
-        if not self._is_text_subset(small.user, large.user):
-            return False
-
-        # 5. 애플리케이션
-        if not self._is_text_subset(small.application, large.application):
-            return False
-
-        # 6. 벤더 특화 필드 (Palo Alto)
-        if self.vendor == 'paloalto':
-            if not self._is_text_subset(small.vsys, large.vsys):
-                return False
-            if not self._is_text_subset(small.security_profile, large.security_profile):
-                return False
-            if not self._is_text_subset(small.category, large.category):
-                return False
-
-        return True
-
     async def analyze_logical(self) -> List[RedundancyPolicySetCreate]:
         """
         논리적 포함 관계 기반 중복 정책 분석.
@@ -350,52 +364,12 @@ class RedundancyAnalyzer:
         기존 analyze()의 텍스트 완전 일치 탐지를 포함하며,
         추가로 IP 서브넷 포함 관계(예: /8 ⊇ /16)까지 탐지합니다.
         """
-        device = await crud.device.get_device(self.db, device_id=self.device_id)
-        if not device:
-            raise ValueError(f"Device ID {self.device_id}를 찾을 수 없습니다.")
-        self.vendor = device.vendor
+        payloads = await self._load_payloads()
+        logger.info(f"논리적 포함 관계 분석 시작: {len(payloads)}개 정책")
 
-        policies = await self._get_policies_with_members()
-        logger.info(f"논리적 포함 관계 분석 시작: {len(policies)}개 정책")
-
-        # O(n²) 포함 관계 비교가 이벤트 루프를 점유하지 않도록 executor에서 실행
-        results = await asyncio.get_running_loop().run_in_executor(
-            CPU_EXECUTOR, self._find_logical_sets, policies
-        )
+        # O(n²) 포함 관계 비교가 이벤트 루프를 점유하지 않도록 분석 백엔드(스레드/프로세스)에서 실행
+        entries = await run_cpu_bound(find_logical_sets, payloads, self.vendor)
+        results = self._to_set_creates(entries)
 
         logger.info(f"논리적 중복 분석 완료: {len(results)}개 결과")
         return results
-
-    def _find_logical_sets(self, policies: List[Policy]) -> List[RedundancyPolicySetCreate]:
-        """논리적 포함 관계 O(n²) 비교 (순수 CPU 연산 — executor 스레드에서 호출)."""
-        total = len(policies)
-        results: List[RedundancyPolicySetCreate] = []
-        policy_map: Dict[int, int] = {}   # 정책 index → set_number
-        current_set_number = 1
-
-        for i in range(total):
-            target = policies[i]
-            for j in range(i):
-                base = policies[j]
-                if self._is_logically_contained(target, base):
-                    group_no = policy_map.get(j)
-                    if group_no is None:
-                        group_no = current_set_number
-                        policy_map[j] = group_no
-                        results.append(RedundancyPolicySetCreate(
-                            task_id=self.task.id,
-                            set_number=group_no,
-                            type=RedundancyPolicySetType.UPPER,
-                            policy_id=base.id,
-                        ))
-                        current_set_number += 1
-                    results.append(RedundancyPolicySetCreate(
-                        task_id=self.task.id,
-                        set_number=group_no,
-                        type=RedundancyPolicySetType.LOWER,
-                        policy_id=target.id,
-                    ))
-                    policy_map[i] = group_no
-                    break  # 첫 번째 포함 관계가 확인되면 중단 (fpat 동일 방식)
-
-        return results
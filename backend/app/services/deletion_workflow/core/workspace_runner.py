@@ -2,24 +2,20 @@
 """
 API 환경에서 파이프라인 프로세서를 실행하기 위한 워크스페이스 러너.
 
-CLI 프로세서들은 현재 작업 디렉토리(CWD) 기준으로 파일을 읽고 씁니다.
-API 환경에서는 요청별 임시 디렉토리를 CWD로 설정하여 격리합니다.
-동시 실행 시 chdir 충돌을 막기 위해 threading.Lock을 사용합니다.
+요청별 임시 디렉토리를 FileManager/ExcelManager의 base_dir로 넘겨 격리합니다.
+프로세서는 모든 경로를 base_dir 기준으로 해석하고 프로세스 CWD를 바꾸지 않으므로,
+서로 다른 작업이 잠금 없이 executor 스레드에서 동시에 실행될 수 있습니다.
 """
 
 import os
 import shutil
 import logging
 import tempfile
-import threading
 from datetime import date
 from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# 전역 lock: os.chdir은 프로세스 전역이므로 한 번에 하나의 작업만 실행
-_workspace_lock = threading.Lock()
-
 
 class WorkspaceRunner:
     """
@@ -95,56 +91,43 @@ class WorkspaceRunner:
         filenames: List[str],
         extra_kwargs: dict,
     ) -> List[str]:
-        """지정된 디렉토리를 CWD로 설정하고 프로세서를 실행합니다."""
+        """지정된 워크스페이스 디렉토리를 기준 경로로 프로세서를 실행합니다."""
         from .config_manager import ConfigManager
         from .pipeline import TaskRegistry
         from ..utils.file_manager import FileManager
         from ..utils.excel_manager import ExcelManager
 
-        with _workspace_lock:
-            # Lock 안에서 캡처해야 다른 스레드의 chdir과 레이스 없음
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(workspace)
-
-                config = ConfigManager(config_path=self.config_path, config_dict=self.config_dict, reference_date=self.reference_date)
-                file_manager = FileManager(config)
-                excel_manager = ExcelManager(config)
-                file_manager.set_forced_files(list(filenames))
-
-                info = TaskRegistry.get_processor_info(task_id)
-                if not info:
-                    raise ValueError(f"유효하지 않은 태스크 번호: {task_id}")
+        config = ConfigManager(config_path=self.config_path, config_dict=self.config_dict, reference_date=self.reference_date)
+        file_manager = FileManager(config, base_dir=workspace)
+        excel_manager = ExcelManager(config, base_dir=workspace)
+        file_manager.set_forced_files(list(filenames))
 
-                processor_class = info["class"]
-                kwargs = info["kwargs"].copy()
-                kwargs.update(extra_kwargs)
+        info = TaskRegistry.get_processor_info(task_id)
+        if not info:
+            raise ValueError(f"유효하지 않은 태스크 번호: {task_id}")
 
-                if processor_class.__name__ == 'NotificationClassifier':
-                    kwargs["excel_manager"] = excel_manager
+        processor_class = info["class"]
+        kwargs = info["kwargs"].copy()
+        kwargs.update(extra_kwargs)
 
-                processor = processor_class(config)
+        if processor_class.__name__ == 'NotificationClassifier':
+            kwargs["excel_manager"] = excel_manager
 
-                # 실행 전 파일 목록 스냅샷
-                before = set(os.listdir(workspace))
+        processor = processor_class(config)
 
-                success = processor.run(file_manager, **kwargs)
+        # 실행 전 파일 목록 스냅샷
+        before = set(os.listdir(workspace))
 
-                if not success:
-                    raise RuntimeError(f"Task {task_id} 실행 실패")
+        success = processor.run(file_manager, **kwargs)
 
-                # 새로 생성된 파일 탐지
-                after = set(os.listdir(workspace))
-                new_files = sorted(after - before)
-                output_paths = [os.path.join(workspace, f) for f in new_files
-                                if not f.startswith('.')]
+        if not success:
+            raise RuntimeError(f"Task {task_id} 실행 실패")
 
-                logger.info(f"Task {task_id} 완료 — 출력 파일: {new_files}")
-                return output_paths
+        # 새로 생성된 파일 탐지
+        after = set(os.listdir(workspace))
+        new_files = sorted(after - before)
+        output_paths = [os.path.join(workspace, f) for f in new_files
+                        if not f.startswith('.')]
 
-            finally:
-                try:
-                    os.chdir(original_cwd)
-                except OSError:
-                    # original_cwd가 삭제된 경우(이전 임시 디렉토리) 홈 디렉토리로 fallback
-                    os.chdir(os.path.expanduser('~'))
+        logger.info(f"Task {task_id} 완료 — 출력 파일: {new_files}")
+        return output_paths
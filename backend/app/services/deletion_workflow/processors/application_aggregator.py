@@ -93,7 +93,7 @@ class ApplicationAggregator(BaseProcessor):
             file_name = file_manager.select_files()
             if not file_name:
                 return False
-            self.process_applications(file_name, f"Conv_{file_name}")
+            self.process_applications(file_name, file_manager.with_prefix(file_name, "Conv_"))
             return True
         except Exception as e:
             logger.exception(f"신청 정보 취합 중 오류: {e}")
@@ -80,7 +80,9 @@ class AutoRenewalExceptionGenerator(BaseProcessor):
             exception_df = pd.DataFrame({'신청번호': final_ids})
 
             date_str = self.config.get_reference_date().strftime('%Y-%m-%d')
-            output_file = f"{date_str}_자동연장예외_{project_name}.xlsx" if project_name else "자동연장예외파일.xlsx"
+            output_file = file_manager.path(
+                f"{date_str}_자동연장예외_{project_name}.xlsx" if project_name else "자동연장예외파일.xlsx"
+            )
             with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
                 exception_df.to_excel(writer, sheet_name='자동연장예외', index=False)
                 long_unused_df.to_excel(writer, sheet_name='장기미사용 결과내용', index=False)
@@ -102,7 +102,7 @@ class DuplicatePolicyClassifier(BaseProcessor):
 
             if project_name:
                 date_str = self.config.get_reference_date().strftime('%Y-%m-%d')
-                filename = f"{date_str}_{project_name}"
+                filename = file_manager.path(f"{date_str}_{project_name}")
             else:
                 filename = file_manager.remove_extension(selected_file)
             output_path = f'{filename}_중복정책_정리.xlsx'
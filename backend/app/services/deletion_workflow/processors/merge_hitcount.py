@@ -53,7 +53,7 @@ class MergeHitcount(BaseProcessor):
                 lambda x: '미사용' if pd.isna(x) or x > unused_threshold else '사용'
             )
 
-            output_file = f"Merged_{first_file}"
+            output_file = file_manager.with_prefix(first_file, "Merged_")
             merged_df.to_excel(output_file, index=False)
             logger.info(f"히트카운트 병합 완료: '{output_file}'")
             return True
@@ -61,7 +61,7 @@ class NotificationClassifier(BaseProcessor):
             df = pd.read_excel(selected_file)
             if project_name:
                 date_str = self.config.get_reference_date().strftime('%Y-%m-%d')
-                base = f"{date_str}_{project_name}"
+                base = file_manager.path(f"{date_str}_{project_name}")
             else:
                 base = file_manager.remove_extension(selected_file)
 
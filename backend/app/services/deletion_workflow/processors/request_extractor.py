@@ -40,7 +40,7 @@ class RequestExtractor(BaseProcessor):
                 return False
 
             request_id_prefix = self.config.get('file_naming.request_id_prefix', 'request_id_')
-            output_file = f"{request_id_prefix}{file_name}"
+            output_file = file_manager.with_prefix(file_name, request_id_prefix)
 
             with pd.ExcelWriter(output_file) as writer:
                 for request_type, group in selected_data.groupby('Request Type'):
@@ -5,6 +5,9 @@ fpat/fpat/policy_deletion_processor/utils/excel_manager.py 이식.
 """
 
 import logging
+import os
+from typing import Optional
+
 from openpyxl import load_workbook
 from openpyxl.styles import Alignment, PatternFill, Font
 
@@ -14,8 +17,9 @@ logger = logging.getLogger(__name__)
 class ExcelManager:
     """Excel 파일 스타일 적용 및 저장을 담당하는 클래스"""
 
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, base_dir: Optional[str] = None):
         self.config = config_manager
+        self.base_dir = base_dir
 
     def save_to_excel(self, df, sheet_type: str, file_name: str):
         """
@@ -24,8 +28,10 @@ class ExcelManager:
         Args:
             df: 저장할 DataFrame
             sheet_type: 대상 시트 이름
-            file_name: Excel 파일 경로
+            file_name: Excel 파일 경로 (상대 경로는 base_dir 기준)
         """
+        if self.base_dir is not None and not os.path.isabs(file_name):
+            file_name = os.path.join(self.base_dir, file_name)
         try:
             wb = load_workbook(file_name)
             sheet = wb[sheet_type]
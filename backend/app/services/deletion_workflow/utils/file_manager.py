@@ -4,6 +4,9 @@
 fpat/fpat/policy_deletion_processor/utils/file_manager.py 이식.
 대화형 선택(input) 로직은 FAT 웹 환경에서는 사용되지 않으며,
 set_forced_files()를 통해 파일 경로를 주입합니다.
+
+base_dir을 지정하면 모든 입출력 경로가 해당 디렉토리 기준으로 해석됩니다.
+프로세스 CWD(os.chdir)에 의존하지 않으므로 여러 워크스페이스를 동시에 처리할 수 있습니다.
 """
 
 import os
@@ -17,18 +20,26 @@ logger = logging.getLogger(__name__)
 class FileManager:
     """파일 관리 기능을 제공하는 클래스"""
 
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, base_dir: Optional[str] = None):
         self.config = config_manager
+        self.base_dir = base_dir
         self._forced_files: List[str] = []
         self._forced_mode: bool = False
 
+    def path(self, filename: str) -> str:
+        """파일명을 작업 디렉토리(base_dir) 기준 경로로 변환합니다 (base_dir 미지정 시 CWD 상대 경로)."""
+        if self.base_dir is None or os.path.isabs(filename):
+            return filename
+        return os.path.join(self.base_dir, filename)
+
     def set_forced_files(self, files: List[str]):
         """API/웹 호출 시 파일 경로를 미리 지정합니다."""
         self._forced_files = list(files)
         self._forced_mode = True
 
     def update_version(self, filename: str, final_version: bool = False) -> str:
-        """파일 이름의 버전 접미사를 업데이트합니다."""
+        """파일 이름의 버전 접미사를 업데이트합니다 (디렉토리 부분은 유지)."""
+        dir_name, filename = os.path.split(filename)
         base_name, ext = filename.rsplit('.', 1)
 
         version_format = self.config.get('file_management.policy_version_format', '_v{version}')
@@ -36,7 +47,7 @@ class FileManager:
 
         final_match = re.search(r'_vf$', base_name)
         if final_match:
-            return filename
+            return os.path.join(dir_name, filename)
 
         match = re.search(r'_v(\d+)$', base_name)
         if final_version:
@@ -50,18 +61,25 @@ class FileManager:
 
         new_filename = f"{new_base_name}.{ext}"
         logger.info(f"파일 이름 업데이트: '{filename}' → '{new_filename}'")
-        return new_filename
+        return os.path.join(dir_name, new_filename)
+
+    def with_prefix(self, filename: str, prefix: str) -> str:
+        """파일 이름 앞에 접두어를 붙입니다 (디렉토리 부분은 유지)."""
+        dir_name, base_name = os.path.split(filename)
+        return os.path.join(dir_name, f"{prefix}{base_name}")
 
     def select_files(self, extension: Optional[str] = None) -> Optional[str]:
         """
         파일을 선택합니다.
         - forced_files가 설정된 경우 순차 반환 (웹 API 모드)
-        - 그 외에는 현재 디렉토리에서 대화형 선택 (CLI 모드)
+        - 그 외에는 작업 디렉토리에서 대화형 선택 (CLI 모드)
+
+        반환 경로는 base_dir 기준으로 해석된 경로입니다.
         """
         if self._forced_files:
             selected = self._forced_files.pop(0)
             logger.info(f"지정된 파일 사용: {selected}")
-            return selected
+            return self.path(selected)
 
         if self._forced_mode:
             # 웹 API 모드: 지정된 파일 목록이 소진되면 대화형 입력으로 빠지지 않고 None 반환
@@ -71,7 +89,7 @@ class FileManager:
         if extension is None:
             extension = self.config.get('file_management.default_extension', '.xlsx')
 
-        file_list = [f for f in os.listdir() if f.endswith(extension)]
+        file_list = [f for f in os.listdir(self.base_dir or '.') if f.endswith(extension)]
         if not file_list:
             logger.warning(f"'{extension}' 파일이 없습니다.")
             return None
@@ -89,7 +107,7 @@ class FileManager:
                     elif 1 <= choice <= len(file_list):
                         selected = file_list[choice - 1]
                         logger.info(f"파일 선택: '{selected}'")
-                        return selected
+                        return self.path(selected)
                 print('유효하지 않은 번호입니다.')
             except (KeyboardInterrupt, EOFError):
                 return None
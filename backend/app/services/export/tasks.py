@@ -7,18 +7,21 @@ websocket_manager를 통해 모든 클라이언트에 실시간 전파된다.
 """
 import asyncio
 import logging
+import os
 from datetime import date, datetime
-from io import BytesIO
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterable
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
 
 from app import crud, models
 from app.core.config import PROJECT_ROOT
-from app.core.executors import IO_EXECUTOR
+from app.core.executors import CPU_EXECUTOR, IO_EXECUTOR
 from app.db.session import SessionLocal
 from app.services.sync.collector import create_collector_from_device
 from app.services.websocket_manager import websocket_manager
@@ -31,6 +34,8 @@ EXPORT_DIR = PROJECT_ROOT / "exports"
 _HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
 _HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
 _HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+# 열 너비 추정에 사용할 최대 표본 행 수 (전체 셀 재방문 없이 너비 결정)
+_WIDTH_SAMPLE_ROWS = 1000
 
 _POLICY_COL_MAP = {
     "vsys": "VSYS",
@@ -54,39 +59,63 @@ def _now_kst() -> datetime:
     return datetime.now(ZoneInfo("Asia/Seoul")).replace(tzinfo=None)
 
 
+def _estimate_column_widths(df: pd.DataFrame) -> list[int]:
+    """헤더와 전체 구간에서 고르게 뽑은 표본 행(최대 _WIDTH_SAMPLE_ROWS)만 보고 열 너비를 추정한다 (최대 40)."""
+    step = max(1, -(-len(df) // _WIDTH_SAMPLE_ROWS))
+    sample = df.iloc[::step]
+    widths = []
+    for col_idx, col_name in enumerate(df.columns):
+        max_len = max(
+            (len(str(v or "")) for v in sample.iloc[:, col_idx]),
+            default=0,
+        )
+        widths.append(min(max(max_len, len(str(col_name))) + 2, 40))
+    return widths
+
+
 def _write_df_to_ws(ws, df: pd.DataFrame) -> None:
-    ws.append(list(df.columns))
-    for cell in ws[1]:
+    """write-only 시트에 DataFrame을 스트리밍 기록한다.
+
+    write-only 모드는 행을 append 즉시 임시 XML로 흘려보내므로 셀을 다시 방문할 수 없다.
+    따라서 열 너비는 행을 쓰기 전에 표본으로 미리 정한다.
+    """
+    for idx, width in enumerate(_estimate_column_widths(df), start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+    ws.row_dimensions[1].height = 20
+
+    header = []
+    for col_name in df.columns:
+        cell = WriteOnlyCell(ws, value=col_name)
         cell.fill = _HEADER_FILL
         cell.font = _HEADER_FONT
         cell.alignment = _HEADER_ALIGN
-    ws.row_dimensions[1].height = 20
+        header.append(cell)
+    ws.append(header)
+
     for row in df.itertuples(index=False):
         ws.append(list(row))
-    for col in ws.columns:
-        max_len = max((len(str(cell.value or "")) for cell in col), default=8)
-        ws.column_dimensions[col[0].column_letter].width = min(max_len + 2, 40)
 
 
-def _single_sheet_excel(df: pd.DataFrame, sheet_name: str) -> BytesIO:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet_name
-    _write_df_to_ws(ws, df)
-    buf = BytesIO()
-    wb.save(buf)
-    return buf
+def _write_sheets(wb: Workbook, sheets: Iterable[tuple[str, pd.DataFrame]]) -> None:
+    """write-only 워크북에 시트들을 이어서 기록한다.
+
+    기록된 행은 시트별 임시 XML로 흘러가므로, 호출이 끝나면 DataFrame을 바로 해제할 수 있다.
+    """
+    for sheet_name, df in sheets:
+        _write_df_to_ws(wb.create_sheet(title=sheet_name), df)
+
 
+def _save_workbook(wb: Workbook, file_path: Path) -> None:
+    """write-only 워크북을 대상 파일에 저장한다 (메모리 버퍼 없음).
 
-def _multi_sheet_excel(sheets: dict[str, pd.DataFrame]) -> BytesIO:
-    wb = Workbook()
-    wb.remove(wb.active)
-    for sheet_name, df in sheets.items():
-        ws = wb.create_sheet(title=sheet_name)
-        _write_df_to_ws(ws, df)
-    buf = BytesIO()
-    wb.save(buf)
-    return buf
+    임시 파일에 쓴 뒤 교체하므로 실패 시 반쪽짜리 파일이 남지 않는다.
+    """
+    tmp_path = file_path.with_suffix(".xlsx.tmp")
+    try:
+        wb.save(tmp_path)
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def _normalize_policy_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -284,8 +313,9 @@ async def run_export_task(task_id: int) -> None:
     ExportTask 1건을 처리하는 오케스트레이터.
 
     1. 대상 장비 목록 로드
-    2. 장비별 데이터 수집 (source='live'면 실시간 접속, 'db'면 동기화된 데이터 사용)
-    3. 엑셀 생성 및 디스크 저장 (병합 옵션 처리)
+    2. 장비별 데이터 수집 (source='live'면 실시간 접속, 'db'면 동기화된 데이터 사용) 후
+       바로 write-only 워크북에 시트 기록 (병합 옵션 처리)
+    3. 엑셀 디스크 저장
     4. 최종 상태 반영 (성공/실패)
     """
     async with SessionLocal() as db:
@@ -315,8 +345,10 @@ async def run_export_task(task_id: int) -> None:
     )
 
     loop = asyncio.get_running_loop()
-    per_device_data: dict[int, Any] = {}
     label = EXPORT_TYPE_LABEL[export_type]
+    merged = merge and len(devices) > 1
+    # 워크북을 먼저 열고 장비 1대씩 수집 → 시트 기록 → 해제하여 한 장비분 DataFrame만 메모리에 둔다
+    wb = Workbook(write_only=True)
 
     try:
         for idx, device in enumerate(devices, start=1):
@@ -324,39 +356,39 @@ async def run_export_task(task_id: int) -> None:
             if source == "db":
                 async with SessionLocal() as db:
                     if export_type == "policies":
-                        per_device_data[device.id] = _normalize_policy_df(await _collect_db_policies(db, device.id))
+                        data = _normalize_policy_df(await _collect_db_policies(db, device.id))
                     elif export_type == "objects":
-                        per_device_data[device.id] = await _collect_db_objects(db, device.id)
+                        data = await _collect_db_objects(db, device.id)
                     else:
-                        per_device_data[device.id] = await _collect_db_hit_dates(db, device.id)
+                        data = await _collect_db_hit_dates(db, device.id)
             else:
-                per_device_data[device.id] = await _collect_live_export(device, export_type, use_ssh, loop, timeout)
+                data = await _collect_live_export(device, export_type, use_ssh, loop, timeout)
+
+            if merged:
+                if isinstance(data, dict):
+                    sheets = [(f"{sheet_name}_{device.name}"[:31], df) for sheet_name, df in data.items()]
+                else:
+                    sheets = [(device.name[:31], data)]
+            elif idx == 1:
+                sheets = list(data.items()) if isinstance(data, dict) else [(label, data)]
+            else:
+                sheets = []
+            if sheets:
+                # 대용량 시트 직렬화가 이벤트 루프를 점유하지 않도록 executor에서 실행
+                await loop.run_in_executor(CPU_EXECUTOR, _write_sheets, wb, sheets)
+            del data, sheets
             await _update_export_task(task_id, progress_current=idx)
 
         await _update_export_task(task_id, step="엑셀 생성 중...")
         today = date.today().strftime("%Y-%m-%d")
-
-        if merge and len(devices) > 1:
-            merged_sheets: dict[str, pd.DataFrame] = {}
-            for device in devices:
-                data = per_device_data[device.id]
-                if isinstance(data, dict):
-                    for sheet_name, df in data.items():
-                        merged_sheets[f"{sheet_name}_{device.name}"[:31]] = df
-                else:
-                    merged_sheets[device.name[:31]] = data
-            output = _multi_sheet_excel(merged_sheets)
+        if merged:
             filename = f"{today}_통합_{label}.xlsx"
         else:
-            device = devices[0]
-            data = per_device_data[device.id]
-            output = _multi_sheet_excel(data) if isinstance(data, dict) else _single_sheet_excel(data, label)
-            filename = f"{today}_{device.name}_{label}.xlsx"
+            filename = f"{today}_{devices[0].name}_{label}.xlsx"
 
         EXPORT_DIR.mkdir(parents=True, exist_ok=True)
         file_path = EXPORT_DIR / f"{task_id}.xlsx"
-        output.seek(0)
-        file_path.write_bytes(output.read())
+        await loop.run_in_executor(CPU_EXECUTOR, _save_workbook, wb, file_path)
 
         await _update_export_task(
             task_id,
@@ -0,0 +1,67 @@
+# backend/app/services/firewall/http_session.py
+"""
+REST/XML API 수집기가 공유하는 장비별 HTTP 세션 생성기.
+
+수집기 인스턴스(장비 1대)마다 `requests.Session` 하나를 만들어 연결 수명 동안 재사용합니다.
+
+- Keep-Alive 연결 풀: 요청마다 TCP/TLS 핸드셰이크를 반복하지 않음 (VSYS별·엔드포인트별 연속 요청)
+- gzip 협상: `Accept-Encoding: gzip, deflate` 응답은 읽으면서 해제
+- 연결/읽기 타임아웃 분리: 연결은 짧게, 읽기는 장비가 큰 응답을 만드는 시간을 고려해 길게
+- 재시도: 연결 실패·일시적 게이트웨이 오류(502/503/504)는 지수 백오프로 재시도.
+  읽기 타임아웃은 긴 대기가 반복되지 않도록 한 번만 재시도하며, POST 등 멱등이 아닌 요청은
+  연결 단계 실패만 재시도합니다 (urllib3 Retry 기본 동작)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (연결, 읽기) 타임아웃 (초). 읽기 타임아웃은 소켓 수신 간격 기준이며 전체 응답 시간 제한이 아님
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 300
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+# 재시도 횟수와 백오프 (0.5s, 1s, 2s …)
+DEFAULT_RETRIES = 3
+DEFAULT_READ_RETRIES = 1
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# 한 장비에 동시에 유지할 최대 연결 수 (동시 export·VSYS별 병렬 조회 대비)
+DEFAULT_POOL_MAXSIZE = 8
+
+
+def create_device_session(
+    retries: int = DEFAULT_RETRIES,
+    read_retries: int = DEFAULT_READ_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    verify: bool = False,
+) -> requests.Session:
+    """
+    장비 1대용 HTTP 세션을 생성합니다 (https/http 모두 같은 어댑터 사용).
+
+    방화벽은 자체 서명 인증서를 쓰는 경우가 많아 기본값은 인증서 검증 비활성화입니다.
+    세션은 스레드 간에 공유할 수 있으며, 사용이 끝나면 호출자가 close()해야 합니다.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=read_retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        # 재시도 후에도 오류 상태면 예외 대신 마지막 응답을 돌려줘 호출자가 상태 코드로 처리
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.verify = verify
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
@@ -11,6 +11,10 @@ class FirewallInterface(ABC):
     데이터 수집 로직을 표준화된 방식으로 구현해야 합니다.
     """
 
+    # 같은 인스턴스의 export_* 메서드를 여러 스레드에서 동시에 호출해도 안전한지 여부.
+    # 동기화 오케스트레이터는 True인 벤더만 수집 단계를 병렬로 실행합니다.
+    supports_concurrent_export: bool = False
+
     def __init__(self, hostname: str, username: str, password: str):
         """방화벽 접속 정보 초기화
 
@@ -0,0 +1,234 @@
+# backend/app/services/firewall/ssh_session.py
+"""
+CLI 수집기가 공유하는 장비별 SSH 인터랙티브 세션 풀.
+
+SSH 키 교환·로그인·`invoke_shell`·pager 해제는 장비당 한 번만 하고, 인증된 쉘 채널을
+동기화 1회(연결~해제) 동안 또는 유휴 TTL 동안 재사용합니다.
+
+- 인터랙티브 채널은 한 번에 한 명령만 처리할 수 있으므로 세션은 대여(acquire) 단위로 독점합니다.
+  동시에 대여 중인 세션이 있으면 새 세션을 열고(miss), 반납된 세션은 다음 대여에 재사용합니다(hit).
+- 명령 실행 중 예외가 나면 채널 상태(남은 출력 등)를 알 수 없으므로 반납하지 않고 닫습니다.
+- 유휴 TTL이 지났거나 전송 계층이 끊긴 세션은 대여 시 폐기하고 새로 엽니다.
+
+출력은 채널이 읽기 가능해질 때까지 `select`로 기다렸다가 바로 읽으므로 명령 왕복이 폴링 간격에
+묶이지 않습니다. 수신 바이트는 `bytearray`에 모으고 프롬프트는 버퍼 끝만 보고 판단하며,
+줄 콜백(on_line)을 주면 완성된 줄을 수신 즉시 넘기고 버퍼에서 비웁니다 (대용량 출력 스트리밍 파싱).
+"""
+
+import logging
+import select
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+# 반납된 세션을 재사용할 최대 유휴 시간 (초)
+DEFAULT_IDLE_TTL = 300
+# 장비당 보관할 최대 유휴 세션 수 (동시에 실행되는 CLI export 수 기준)
+DEFAULT_MAX_IDLE = 3
+
+# 채널 읽기 대기 1회 최대 시간 (초) — 타임아웃 확인 주기이며 데이터가 오면 즉시 깨어남
+_READ_WAIT = 0.2
+_RECV_SIZE = 65535
+# 프롬프트 기호(>, #)와 그 뒤 공백
+_PROMPT_CHARS = b'>#'
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+
+
+def _ends_with_prompt(buffer: bytearray) -> bool:
+    """끝 공백을 제외한 마지막 바이트가 프롬프트 기호인지 확인합니다 (버퍼 복사 없이 끝에서부터 탐색)."""
+    index = len(buffer) - 1
+    while index >= 0 and buffer[index] in _WHITESPACE:
+        index -= 1
+    return index >= 0 and buffer[index] in _PROMPT_CHARS
+
+
+class SSHShellSession:
+    """로그인·pager 해제를 마친 PAN-OS 인터랙티브 쉘 세션 하나."""
+
+    def __init__(self, client: paramiko.SSHClient, channel: paramiko.Channel) -> None:
+        self.client = client
+        self.channel = channel
+        self.scripting_mode = False
+        self.last_used = time.monotonic()
+
+    @classmethod
+    def open(cls, hostname: str, username: str, password: str, port: int = 22) -> "SSHShellSession":
+        """SSH 접속 후 쉘을 열고 초기 프롬프트를 기다린 뒤 pager를 끕니다."""
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(
+                hostname, port=port,
+                username=username, password=password,
+                timeout=20, look_for_keys=False, allow_agent=False
+            )
+            # exec_command는 매 호출마다 새 세션이라 pager 설정이 적용되지 않아
+            # 출력이 길면 --More-- 에서 멈춰 타임아웃남. 인터랙티브 쉘로 pager를 먼저 끈다.
+            session = cls(client, client.invoke_shell())
+            session.read_until_prompt(timeout=20)  # 로그인 배너 및 초기 프롬프트 대기
+            session.run("set cli pager off")
+            return session
+        except Exception:
+            client.close()
+            raise
+
+    def is_alive(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active() and not self.channel.closed
+
+    def read_until_prompt(self, timeout: int = 10, on_line: Callable[[str], None] | None = None) -> str:
+        """
+        쉘 프롬프트가 나타날 때까지 데이터를 읽어들입니다 (timeout은 전체 대기 시간).
+
+        on_line이 없으면 프롬프트까지의 전체 출력을 반환합니다. on_line이 있으면 완성된 줄마다
+        (줄바꿈 제외, UTF-8 디코딩) 수신 즉시 호출하고 마지막 줄(프롬프트)까지 넘긴 뒤 빈 문자열을 반환합니다.
+        """
+        buffer = bytearray()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                output = buffer.decode('utf-8', errors='ignore')
+                raise TimeoutError(f"쉘 프롬프트 대기 시간 초과. 현재 출력:\n{output}")
+
+            if not self.channel.recv_ready():
+                select.select([self.channel], [], [], min(remaining, _READ_WAIT))
+                if not self.channel.recv_ready():
+                    if self.channel.closed or self.channel.eof_received:
+                        raise paramiko.SSHException("SSH 채널이 닫혔습니다")
+                    continue
+
+            chunk = self.channel.recv(_RECV_SIZE)
+            if not chunk:
+                raise paramiko.SSHException("SSH 채널이 닫혔습니다")
+            buffer += chunk
+            # 프롬프트 기호(>, #)로 끝나면 수신 완료로 판단
+            prompt_reached = _ends_with_prompt(buffer)
+
+            if on_line is not None:
+                end = buffer.rfind(b'\n')
+                if end >= 0:
+                    for line in buffer[:end].split(b'\n'):
+                        on_line(line.rstrip(b'\r').decode('utf-8', errors='ignore'))
+                    del buffer[:end + 1]
+                if prompt_reached:
+                    if buffer:
+                        on_line(buffer.decode('utf-8', errors='ignore'))
+                    return ""
+            elif prompt_reached:
+                return buffer.decode('utf-8', errors='ignore')
+
+    def run(
+        self,
+        command: str,
+        timeout: int = 10,
+        scripting_mode: bool | None = None,
+        on_line: Callable[[str], None] | None = None,
+    ) -> str:
+        """
+        명령을 실행하고 프롬프트까지의 출력을 반환합니다.
+
+        scripting_mode가 주어지면 세션의 CLI scripting-mode를 그 값으로 맞춘 뒤 실행합니다
+        (재사용 세션에 앞선 명령의 설정이 남아 있어도 명령마다 같은 출력 환경을 보장).
+        on_line은 read_until_prompt와 같습니다.
+        """
+        if scripting_mode is not None and scripting_mode != self.scripting_mode:
+            self.channel.send(f"set cli scripting-mode {'on' if scripting_mode else 'off'}\n")
+            self.read_until_prompt()
+            self.scripting_mode = scripting_mode
+        self.channel.send(f"{command}\n")
+        return self.read_until_prompt(timeout=timeout, on_line=on_line)
+
+    def close(self) -> None:
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+
+class SSHSessionPool:
+    """
+    장비 1대의 SSH 쉘 세션 풀. 수집기 인스턴스가 소유하며 disconnect 시 close()합니다.
+
+    hits/misses는 대여 시 유휴 세션 재사용/새 접속 횟수이며 stats()로 조회합니다.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        max_idle: int = DEFAULT_MAX_IDLE,
+    ) -> None:
+        self.hostname = hostname
+        self.username = username
+        self._password = password
+        self.idle_ttl = idle_ttl
+        self.max_idle = max_idle
+        self._idle: list[SSHShellSession] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def _take_idle(self) -> SSHShellSession | None:
+        """재사용 가능한 유휴 세션을 꺼냅니다. 만료·끊긴 세션은 닫습니다."""
+        stale: list[SSHShellSession] = []
+        session = None
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used <= self.idle_ttl and candidate.is_alive():
+                    session = candidate
+                    break
+                stale.append(candidate)
+            self.expired += len(stale)
+            if session is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        for candidate in stale:
+            candidate.close()
+        return session
+
+    def _release(self, session: SSHShellSession) -> None:
+        session.last_used = time.monotonic()
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(session)
+                return
+        session.close()
+
+    @contextmanager
+    def acquire(self) -> Iterator[SSHShellSession]:
+        """세션을 독점 대여합니다. 블록이 정상 종료되면 반납하고, 예외 시 닫습니다."""
+        session = self._take_idle()
+        if session is None:
+            logger.info(f"SSH 세션 생성: {self.hostname}")
+            session = SSHShellSession.open(self.hostname, self.username, self._password)
+        try:
+            yield session
+        except BaseException:
+            session.close()
+            raise
+        self._release(session)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "expired": self.expired, "idle": len(self._idle)}
+
+    def close(self) -> None:
+        """유휴 세션을 모두 닫습니다. 이후 반납되는 세션은 보관하지 않고 닫습니다."""
+        with self._lock:
+            self._closed = True
+            sessions, self._idle = self._idle, []
+        for session in sessions:
+            session.close()
@@ -431,6 +431,9 @@ class MF2Collector(FirewallInterface):
     SECUI MF2 방화벽 장비에 특화된 데이터 수집기 클래스입니다.
     모든 통신은 SSH 및 SCP를 기반으로 합니다.
     """
+    # export마다 같은 임시 파일 경로({hostname}_*.conf)로 내려받고 삭제하므로 동시 호출 불가
+    supports_concurrent_export = False
+
     def __init__(self, hostname: str, username: str, password: str):
         super().__init__(hostname, username, password)
         # 임시 파일 처리를 위한 디렉토리 생성
@@ -1,20 +1,53 @@
 # firewall/vendors/mock.py
 import pandas as pd
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 from datetime import datetime, timedelta
 import random
 import time
 
 from ..interface import FirewallInterface
 
+
+@dataclass
+class MockDatasetSpec:
+    """
+    합성(synthetic) 데이터셋 생성 파라미터.
+
+    벤치마크(backend/scripts/benchmark.py)나 부하 테스트에서 규모를 조절해 재현 가능한
+    데이터를 만들 때 사용합니다. 같은 spec(seed 포함)이면 항상 같은 데이터가 생성됩니다.
+    """
+    rules: int = 1000
+    network_objects: int = 500
+    network_groups: int = 100
+    group_depth: int = 2            # 그룹 중첩 깊이 (1이면 그룹은 객체만 포함)
+    group_fanout: int = 5           # 그룹당 직계 멤버 수
+    services: int = 100
+    service_groups: int = 20
+    vsys_count: int = 1             # 정책을 나눠 담을 vsys 수 (1이면 vsys 없음)
+    members_per_field: int = 2      # 정책 source/destination/service 필드당 최대 멤버 수
+    group_ref_ratio: float = 0.3    # 정책 필드 멤버가 객체 대신 그룹일 확률
+    any_ratio: float = 0.05         # 정책 필드가 any일 확률
+    subnet_ratio: float = 0.3       # 주소 객체 중 CIDR 비율
+    range_ratio: float = 0.1        # 주소 객체 중 IP 범위(a-b) 비율 (나머지는 host)
+    subnet_prefixes: List[int] = field(default_factory=lambda: [16, 20, 24, 28])
+    port_range_ratio: float = 0.2   # 서비스 객체 중 포트 범위 비율
+    deny_ratio: float = 0.3
+    disabled_ratio: float = 0.1
+    seed: int = 42
+
+
 class MockFirewall:
     """테스트용 가상 방화벽 클래스"""
 
-    def __init__(self, hostname: str, username: str, password: str):
+    def __init__(self, hostname: str, username: str, password: str, spec: Optional[MockDatasetSpec] = None):
         self.hostname = hostname
         self.username = username
         self.password = password
-        self._generate_sample_data()
+        if spec is None:
+            self._generate_sample_data()
+        else:
+            self._generate_synthetic_data(spec)
 
     def _generate_random_ip(self) -> str:
         network = random.choice(['192.168', '172.16', '10.0'])
@@ -162,6 +195,107 @@ class MockFirewall:
         ])
         self.rules = pd.concat([self.rules, test_rules], ignore_index=True)
 
+    def _generate_synthetic_data(self, spec: MockDatasetSpec):
+        """
+        MockDatasetSpec 규모대로 합성 데이터를 생성합니다.
+
+        전역 random 상태를 건드리지 않도록 spec.seed로 만든 독립 난수기를 사용합니다.
+        그룹은 깊이(group_depth)별 계층으로 만들고, 각 계층의 그룹은 바로 아래 계층의
+        그룹(최하위 계층은 객체)을 group_fanout개씩 멤버로 가집니다.
+        """
+        rng = random.Random(spec.seed)
+        reference_now = datetime(2026, 1, 1)
+
+        # 1. 주소 객체 (host / CIDR / 범위 분포)
+        net_rows = []
+        for i in range(1, spec.network_objects + 1):
+            roll = rng.random()
+            a, b, c = rng.randint(1, 223), rng.randint(0, 255), rng.randint(0, 255)
+            if roll < spec.subnet_ratio:
+                prefix = rng.choice(spec.subnet_prefixes)
+                value = f"{a}.{b}.{c}.0/{prefix}" if prefix >= 24 else f"{a}.{b}.0.0/{prefix}"
+                net_rows.append({'Name': f"Net_{i}", 'Type': 'network', 'Value': value})
+            elif roll < spec.subnet_ratio + spec.range_ratio:
+                start = rng.randint(1, 200)
+                end = min(254, start + rng.randint(1, 50))
+                net_rows.append({'Name': f"Range_{i}", 'Type': 'range', 'Value': f"{a}.{b}.{c}.{start}-{a}.{b}.{c}.{end}"})
+            else:
+                net_rows.append({'Name': f"Host_{i}", 'Type': 'host', 'Value': f"{a}.{b}.{c}.{rng.randint(1, 254)}"})
+        self.network_objects = pd.DataFrame(net_rows, columns=['Name', 'Type', 'Value'])
+
+        # 2. 서비스 객체 (단일 포트 / 포트 범위 분포)
+        common_ports = [22, 53, 80, 123, 443, 445, 1433, 3306, 3389, 8080, 8443]
+        svc_rows = []
+        for i in range(1, spec.services + 1):
+            protocol = rng.choice(['tcp', 'tcp', 'tcp', 'udp'])
+            if rng.random() < spec.port_range_ratio:
+                start = rng.randint(1024, 60000)
+                port = f"{start}-{min(65535, start + rng.randint(1, 2000))}"
+            elif rng.random() < 0.5:
+                port = str(rng.choice(common_ports))
+            else:
+                port = str(rng.randint(1, 65535))
+            svc_rows.append({'Name': f"Svc_{i}_{protocol}_{port.replace('-', '_')}", 'Protocol': protocol, 'Port': port})
+        self.service_objects = pd.DataFrame(svc_rows, columns=['Name', 'Protocol', 'Port'])
+
+        # 3. 그룹 (깊이별 계층 + fan-out)
+        def _layered_groups(prefix: str, total: int, leaf_names: List[str]) -> pd.DataFrame:
+            depth = max(1, spec.group_depth)
+            rows = []
+            lower_names = leaf_names
+            for level in range(1, depth + 1):
+                count = total // depth + (1 if level <= total % depth else 0)
+                names = [f"{prefix}_L{level}_{i}" for i in range(1, count + 1)]
+                for name in names:
+                    members = rng.sample(lower_names, min(spec.group_fanout, len(lower_names))) if lower_names else []
+                    rows.append({'Group Name': name, 'Entry': ','.join(members)})
+                if names:
+                    lower_names = names
+            return pd.DataFrame(rows, columns=['Group Name', 'Entry'])
+
+        self.network_groups = _layered_groups("NetGroup", spec.network_groups, self.network_objects['Name'].tolist())
+        self.service_groups = _layered_groups("SvcGroup", spec.service_groups, self.service_objects['Name'].tolist())
+
+        # 4. 정책
+        addr_objects = self.network_objects['Name'].tolist()
+        addr_groups = self.network_groups['Group Name'].tolist()
+        svc_objects = self.service_objects['Name'].tolist()
+        svc_groups = self.service_groups['Group Name'].tolist()
+        applications = ['web-browsing', 'ssl', 'ssh', 'dns', 'ms-rdp', 'mysql', 'any']
+
+        def _field(objects: List[str], groups: List[str]) -> str:
+            if rng.random() < spec.any_ratio or not (objects or groups):
+                return 'any'
+            members = set()
+            for _ in range(rng.randint(1, max(1, spec.members_per_field))):
+                pool = groups if groups and rng.random() < spec.group_ref_ratio else (objects or groups)
+                members.add(rng.choice(pool))
+            return ','.join(sorted(members))
+
+        vsys_names = [f"vsys{i}" for i in range(1, spec.vsys_count + 1)] if spec.vsys_count > 1 else [None]
+        rule_rows = []
+        for i in range(1, spec.rules + 1):
+            hit_roll = rng.random()
+            if hit_roll < 0.6:
+                last_hit = (reference_now - timedelta(days=rng.randint(0, 365))).strftime('%Y-%m-%d %H:%M:%S')
+            else:
+                last_hit = None
+            rule_rows.append({
+                'vsys': vsys_names[(i - 1) % len(vsys_names)],
+                'seq': i,
+                'rule_name': f"Rule_{i}",
+                'enable': 'N' if rng.random() < spec.disabled_ratio else 'Y',
+                'action': 'deny' if rng.random() < spec.deny_ratio else 'allow',
+                'source': _field(addr_objects, addr_groups),
+                'user': 'any',
+                'destination': _field(addr_objects, addr_groups),
+                'service': _field(svc_objects, svc_groups),
+                'application': rng.choice(applications),
+                'description': f"synthetic rule {i}",
+                'last_hit_date': last_hit,
+            })
+        self.rules = pd.DataFrame(rule_rows)
+
     def export_security_rules(self) -> pd.DataFrame:
         return self.rules.copy()
 
@@ -180,6 +314,8 @@ class MockFirewall:
 class MockCollector(FirewallInterface):
     """테스트용 가상 방화벽 Collector"""
 
+    supports_concurrent_export = True
+
     def __init__(self, hostname: str, username: str, password: str):
         super().__init__(hostname, username, password)
         self.client = MockFirewall(hostname, username, password)
@@ -9,6 +9,7 @@ from datetime import datetime
 
 from ..interface import FirewallInterface
 from ..exceptions import FirewallAuthenticationError
+from ..http_session import DEFAULT_CONNECT_TIMEOUT, create_device_session
 
 # SSL 인증서 경고 비활성화: 자체 서명된 인증서를 사용하는 방화벽 장비와의 통신을 위함입니다.
 requests.packages.urllib3.disable_warnings()
@@ -25,6 +26,9 @@ class NGFClient:
     - ID/Secret 기반의 토큰 인증 및 관리 (Login/Logout)
     - 정책 및 객체 데이터의 RESTful API 요청 처리
     - 복잡한 JSON 응답 구조의 평면화(Normalization) 및 표준화
+
+    모든 요청은 클라이언트가 소유한 HTTP 세션(Keep-Alive 풀, 재시도)을 공유하므로
+    로그인·엔드포인트별 조회·로그아웃이 같은 연결을 재사용합니다. 사용 후 close()로 닫습니다.
     """
     def __init__(self, hostname: str, username: str, password: str, timeout: int = 60):
         self.hostname = hostname
@@ -32,6 +36,7 @@ class NGFClient:
         self.ext_clnt_secret = password    # API Client Secret
         self.timeout = timeout
         self.token = None
+        self.http = create_device_session()
         # 브라우저 요청처럼 보이기 위한 User-Agent 설정
         self.user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -83,9 +88,9 @@ class NGFClient:
             "force": 1  # 기존 세션이 있더라도 강제 로그인
         }
         try:
-            response = requests.post(
+            response = self.http.post(
                 url, headers=self._get_headers(), data=json.dumps(data),
-                verify=False, timeout=5
+                timeout=(DEFAULT_CONNECT_TIMEOUT, 5)
             )
             if response.status_code == 200:
                 # 응답 JSON의 result.api_token 경로에서 토큰 추출
@@ -104,9 +109,9 @@ class NGFClient:
 
         url = f"https://{self.hostname}/api/au/external/logout"
         try:
-            response = requests.delete(
+            response = self.http.delete(
                 url, headers=self._get_headers(token=self.token),
-                verify=False, timeout=3
+                timeout=(DEFAULT_CONNECT_TIMEOUT, 3)
             )
             if response.status_code == 200:
                 self.token = None
@@ -115,13 +120,17 @@ class NGFClient:
             logging.error(f"NGF 로그아웃 중 예외 발생: {e}")
         return False
 
+    def close(self) -> None:
+        """HTTP 세션과 유지 중인 연결을 닫습니다."""
+        self.http.close()
+
     def _get(self, endpoint: str) -> dict:
         """인증된 토큰을 사용하여 GET API 요청을 수행합니다."""
         url = f"https://{self.hostname}{endpoint}"
         try:
-            response = requests.get(
+            response = self.http.get(
                 url, headers=self._get_headers(token=self.token),
-                verify=False, timeout=self.timeout
+                timeout=(DEFAULT_CONNECT_TIMEOUT, self.timeout)
             )
             if response.status_code == 200:
                 return response.json()
@@ -142,9 +151,9 @@ class NGFClient:
         """특정 서비스 그룹의 상세 멤버 정보를 조회합니다 (POST 요청 필요)."""
         url = f"https://{self.hostname}/api/op/service-group/get/objects"
         try:
-            response = requests.post(
+            response = self.http.post(
                 url, headers=self._get_headers(token=self.token),
-                verify=False, timeout=self.timeout, json={'name': service_group_name}
+                timeout=(DEFAULT_CONNECT_TIMEOUT, self.timeout), json={'name': service_group_name}
             )
             if response.status_code == 200:
                 return response.json()
@@ -310,6 +319,9 @@ class NGFCollector(FirewallInterface):
     """
     FirewallInterface를 구현한 TrusGuard NGF 연동 어댑터입니다.
     """
+    # export마다 session()으로 로그인/로그아웃하며 공유 토큰을 초기화하므로 동시 호출 불가
+    supports_concurrent_export = False
+
     def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str):
         super().__init__(hostname, ext_clnt_id, ext_clnt_secret)
         self.client = NGFClient(hostname, ext_clnt_id, ext_clnt_secret)
@@ -325,8 +337,9 @@ class NGFCollector(FirewallInterface):
         raise FirewallAuthenticationError("NGF 로그인 실패")
 
     def disconnect(self) -> bool:
-        """세션을 종료합니다."""
+        """세션을 종료하고 HTTP 연결을 닫습니다."""
         self.client.logout()
+        self.client.close()
         self._connected = False
         return True
 
@@ -1,16 +1,20 @@
 # backend/app/services/firewall/vendors/paloalto.py
-import time
 import datetime
+import io
 import logging
 import requests
 import xml.etree.ElementTree as ET
 import paramiko
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
 from ..interface import FirewallInterface
 from ..exceptions import FirewallAuthenticationError, FirewallConnectionError, FirewallAPIError
+from ..http_session import DEFAULT_TIMEOUT, create_device_session
+from ..ssh_session import SSHSessionPool
 
 # SSL 설정 (urllib3 버전 호환성 고려)
 # Palo Alto 장비와의 통신을 위해 레거시 암호화 스위트(DES-CBC3-SHA)를 허용하도록 설정합니다.
@@ -22,21 +26,207 @@ except AttributeError:
 requests.packages.urllib3.disable_warnings()
 
 
+class PaloAltoConfigSnapshot:
+    """
+    한 번 내려받은 `/config` XML에서 추출한 객체·그룹·서비스·정책 레코드를 보관하는 설정 스냅샷입니다.
+
+    동기화 1회 동안 export_network_objects / export_network_group_objects /
+    export_service_objects / export_service_group_objects / export_security_rules가
+    같은 스냅샷을 공유하므로, 전체 설정 다운로드·파싱이 5회에서 1회로 줄어듭니다.
+
+    응답 본문은 `iterparse`로 스트리밍 파싱합니다. VSYS 하위의 대상 항목(entry)이 닫힐 때마다
+    레코드(export_* DataFrame의 행 dict)를 만들고, 다 읽은 요소는 부모에서 바로 떼어 내므로
+    파싱 중 메모리에 남는 XML은 현재 경로와 읽고 있는 항목 하나뿐입니다 (전체 트리를 만들지 않음).
+    """
+    # /config/devices/entry/vsys/entry (루트 요소 아래 경로)
+    VSYS_PATH = ('result', 'config', 'devices', 'entry', 'vsys', 'entry')
+    # VSYS 항목 아래 상대 경로 → 레코드 종류
+    RECORD_PATHS = {
+        ('address', 'entry'): 'address',
+        ('address-group', 'entry'): 'address_group',
+        ('service', 'entry'): 'service',
+        ('service-group', 'entry'): 'service_group',
+        ('rulebase', 'security', 'rules', 'entry'): 'security_rule',
+    }
+    RECORD_KINDS = tuple(RECORD_PATHS.values())
+
+    def __init__(self, config_type: str, records: dict[str, list[dict]]) -> None:
+        self.config_type = config_type
+        self.records = records
+
+    @classmethod
+    def from_stream(cls, config_type: str, source) -> "PaloAltoConfigSnapshot":
+        """
+        API 응답 본문(바이너리 파일 객체)을 스트리밍 파싱하여 스냅샷을 생성합니다.
+
+        요소가 닫힐 때 대상 항목 안쪽이 아니면 부모에서 제거하고, 대상 항목은 레코드를 추출한 뒤 제거합니다.
+        """
+        records: dict[str, list[dict]] = {kind: [] for kind in cls.RECORD_KINDS}
+        vsys_depth = len(cls.VSYS_PATH) + 1
+        tags: list[str] = []
+        elements: list[ET.Element] = []
+        # 현재 읽고 있는 대상 항목의 (스택 깊이, 레코드 종류) — 그 안쪽 요소는 항목이 닫힐 때까지 유지
+        target: tuple[int, str] | None = None
+        vsys_name = None
+        rule_seq = 0
+        try:
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    tags.append(elem.tag)
+                    elements.append(elem)
+                    depth = len(tags)
+                    if target is not None or depth <= vsys_depth:
+                        if depth == vsys_depth and tuple(tags[1:vsys_depth]) == cls.VSYS_PATH:
+                            vsys_name = elem.attrib.get('name')
+                            rule_seq = 0
+                        continue
+                    if tuple(tags[1:vsys_depth]) == cls.VSYS_PATH:
+                        kind = cls.RECORD_PATHS.get(tuple(tags[vsys_depth:]))
+                        if kind is not None:
+                            target = (depth, kind)
+                    continue
+
+                depth = len(tags)
+                tags.pop()
+                elements.pop()
+                if target is not None:
+                    if depth > target[0]:
+                        continue
+                    kind = target[1]
+                    target = None
+                    if kind == 'security_rule':
+                        rule_seq += 1
+                        records[kind].append(cls._rule_record(elem, vsys_name, rule_seq))
+                    else:
+                        records[kind].extend(cls._object_records(kind, elem))
+                if elements:
+                    # 닫힌 요소는 항상 부모의 마지막 자식
+                    del elements[-1][-1]
+        except ET.ParseError:
+            raise FirewallAPIError("설정 XML 파싱 실패")
+        return cls(config_type, records)
+
+    @classmethod
+    def from_xml(cls, config_type: str, config_xml: str | bytes) -> "PaloAltoConfigSnapshot":
+        """API 응답 XML 문자열을 파싱하여 스냅샷을 생성합니다."""
+        if isinstance(config_xml, str):
+            config_xml = config_xml.encode('utf-8')
+        return cls.from_stream(config_type, io.BytesIO(config_xml))
+
+    @staticmethod
+    def _rule_record(rule: ET.Element, vsys_name: str | None, seq: int) -> dict:
+        """보안 정책 항목 하나를 export_security_rules 행으로 변환합니다."""
+        member_texts = PaloAltoAPI._get_member_texts
+        to_string = PaloAltoAPI.list_to_string
+        rule_name = str(rule.attrib.get('name'))
+
+        # PAN-OS XML: <disabled>yes</disabled> 이면 비활성 상태입니다.
+        disabled_list = member_texts(rule.findall('./disabled'))
+        is_disabled = (to_string(disabled_list).strip().lower() == "yes")
+        # 내부 표준에 따라 활성은 'Y', 비활성은 'N'으로 변환
+        disabled_status = "Y" if not is_disabled else "N"
+
+        # 각 정책 구성 요소(객체)들을 콤마 구분 문자열로 추출
+        action = to_string(member_texts(rule.findall('./action')))
+        source = to_string(member_texts(rule.findall('./source/member')))
+        user = to_string(member_texts(rule.findall('./source-user/member')))
+        destination = to_string(member_texts(rule.findall('./destination/member')))
+        service = to_string(member_texts(rule.findall('./service/member')))
+        application = to_string(member_texts(rule.findall('./application/member')))
+
+        # 출발지/목적지 존, 로그 포워딩 프로파일 (Palo Alto 전용 필드)
+        from_zone = to_string(member_texts(rule.findall('./from/member')))
+        to_zone = to_string(member_texts(rule.findall('./to/member')))
+        log_setting = to_string(member_texts(rule.findall('./log-setting')))
+
+        # 보안 프로필 및 카테고리 정보 추출
+        url_filtering = to_string(member_texts(rule.findall('./profile-setting/profiles/url-filtering/member')))
+        category = to_string(member_texts(rule.findall('./category/member')))
+        category = "any" if not category else category
+
+        # 설명(Description) 필드 줄바꿈 제거
+        description_list = member_texts(rule.findall('./description'))
+        description = to_string([desc.replace('\n', ' ') for desc in description_list])
+
+        return {
+            "vsys": vsys_name,
+            "seq": seq,
+            "rule_name": rule_name,
+            "enable": disabled_status,
+            "action": action,
+            "source": source,
+            "user": user,
+            "destination": destination,
+            "service": service,
+            "application": application,
+            "security_profile": url_filtering,
+            "category": category,
+            "description": description,
+            "from_zone": from_zone,
+            "to_zone": to_zone,
+            "log_setting": log_setting,
+        }
+
+    @staticmethod
+    def _object_records(kind: str, entry: ET.Element) -> list[dict]:
+        """객체·그룹·서비스 항목 하나를 export_* 행 목록으로 변환합니다 (서비스는 프로토콜별 1행)."""
+        to_string = PaloAltoAPI.list_to_string
+        name = entry.attrib.get('name')
+
+        if kind == 'address':
+            # ip-netmask, ip-range, fqdn 중 하나를 가짐
+            first_child = entry.find('*')
+            address_type = first_child.tag if first_child is not None else ""
+            members = [elem.text for elem in entry.findall(f'./{address_type}') if elem.text is not None]
+            return [{"Name": name, "Type": address_type, "Value": to_string(members)}]
+
+        if kind == 'service':
+            rows = []
+            protocol_elem = entry.find('protocol')
+            if protocol_elem is not None:
+                for protocol in protocol_elem:
+                    port_elem = protocol.find('port')
+                    rows.append({
+                        "Name": name,
+                        "Protocol": protocol.tag,
+                        "Port": port_elem.text if port_elem is not None else None,
+                    })
+            return rows
+
+        member_path = './static/member' if kind == 'address_group' else './members/member'
+        members = [elem.text for elem in entry.findall(member_path) if elem.text is not None]
+        return [{"Group Name": name, "Entry": to_string(members)}]
+
+
 class PaloAltoAPI(FirewallInterface):
     """
     Palo Alto 차세대 방화벽(PAN-OS)을 위한 연동 클래스입니다.
     XML API와 SSH(Paramiko)를 모두 사용하여 데이터를 추출합니다.
     """
+    # export_*는 잠금으로 보호되는 설정 스냅샷을 공유하고 API 호출은 요청마다 독립적이므로 동시 호출 가능
+    supports_concurrent_export = True
+    # export_last_hit_date의 VSYS별 동시 조회 상한 (관리 플레인 부하 고려)
+    hit_count_concurrency = 4
+
     def __init__(self, hostname: str, username: str, password: str) -> None:
         super().__init__(hostname, username, password)
         self.base_url = f'https://{hostname}/api/'
         self.api_key = None
+        # 장비별 HTTP 세션 (Keep-Alive 풀) — 첫 요청 시 생성, disconnect() 시 닫음
+        self._http: requests.Session | None = None
+        self._http_lock = threading.Lock()
+        # CLI export(히트 정보·리소스 한도·시스템 정보)가 공유하는 SSH 쉘 세션 풀 — disconnect() 시 닫음
+        self._ssh_pool = SSHSessionPool(hostname, username, password)
+        # config_type('running'/'candidate')별 설정 스냅샷 — 연결 수명 동안 재사용
+        self._config_snapshots: dict[str, PaloAltoConfigSnapshot] = {}
+        self._config_lock = threading.Lock()
 
     def connect(self) -> bool:
         """
         방화벽에 연결하고 API 키를 발급받습니다.
         """
         try:
+            self.clear_config_snapshot()
             self.api_key = self._get_api_key(self.username, self._password)
             self._connected = True
             return True
@@ -51,6 +241,9 @@ class PaloAltoAPI(FirewallInterface):
         """
         self.api_key = None
         self._connected = False
+        self.clear_config_snapshot()
+        self._close_http_session()
+        self._close_ssh_pool()
         return True
 
     def test_connection(self) -> bool:
@@ -74,20 +267,51 @@ class PaloAltoAPI(FirewallInterface):
             processed.append(f'"{s}"' if ',' in s else s)
         return ','.join(processed)
 
-    def get_api_data(self, parameters, timeout: int = 10000):
+    def _get_http_session(self) -> requests.Session:
+        """장비용 HTTP 세션을 반환합니다 (없으면 생성). 동시 export가 같은 연결 풀을 공유합니다."""
+        with self._http_lock:
+            if self._http is None:
+                self._http = create_device_session()
+            return self._http
+
+    def _close_http_session(self) -> None:
+        """HTTP 세션과 유지 중인 연결을 닫습니다."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    def _close_ssh_pool(self) -> None:
+        """SSH 세션 풀을 닫고 새 풀로 교체합니다 (재연결 시 다시 사용)."""
+        pool = self._ssh_pool
+        stats = pool.stats()
+        if stats["hits"] or stats["misses"]:
+            self.logger.info(f"SSH 세션 풀 종료: {self.hostname} {stats}")
+        pool.close()
+        self._ssh_pool = SSHSessionPool(self.hostname, self.username, self._password)
+
+    def ssh_pool_stats(self) -> dict:
+        """현재 SSH 세션 풀의 hit/miss/만료 횟수와 유휴 세션 수를 반환합니다."""
+        return self._ssh_pool.stats()
+
+    def get_api_data(self, parameters, timeout: float | tuple[float, float] = DEFAULT_TIMEOUT, stream: bool = False):
         """
         Palo Alto XML API에 HTTP GET 요청을 보냅니다.
+
+        장비별 세션으로 연결을 재사용하며, 연결 실패·일시적 오류는 세션이 백오프 재시도합니다.
         
         Args:
             parameters: API 요청 파라미터 (dict 또는 tuple)
-            timeout: 요청 타임아웃 (초)
+            timeout: 요청 타임아웃 (초). (연결, 읽기) 튜플 또는 단일 값
+            stream: True이면 본문을 미리 읽지 않음 (호출자가 response.raw를 읽고 닫아야 함)
         """
         try:
-            response = requests.get(
+            # SSL 인증서 검증은 세션에서 비활성화
+            response = self._get_http_session().get(
                 self.base_url,
                 params=parameters,
-                verify=False,  # SSL 인증서 검증 비활성화
-                timeout=timeout
+                timeout=timeout,
+                stream=stream,
             )
             if response.status_code != 200:
                 raise FirewallAPIError(f"API 요청 실패 (상태 코드: {response.status_code}): {response.text}")
@@ -123,22 +347,57 @@ class PaloAltoAPI(FirewallInterface):
         except Exception as e:
             raise FirewallAuthenticationError(f"API 키 생성 실패: {str(e)}")
 
-    def get_config(self, config_type: str = 'running') -> str:
-        """
-        방화벽의 설정을 XML 형태로 가져옵니다.
-        
-        xpath='/config'를 사용하여 전체 설정 트리를 요청합니다.
-        """
+    def _config_params(self, config_type: str) -> tuple:
+        """xpath='/config' 전체 설정 요청 파라미터."""
         action = 'show' if config_type == 'running' else 'get'
-        params = (
+        return (
             ('key', self.api_key),
             ('type', 'config'),
             ('action', action),
             ('xpath', '/config')
         )
-        response = self.get_api_data(params)
+
+    def get_config(self, config_type: str = 'running') -> str:
+        """
+        방화벽의 설정을 XML 형태로 가져옵니다.
+        
+        xpath='/config'를 사용하여 전체 설정 트리를 요청합니다.
+        """
+        response = self.get_api_data(self._config_params(config_type))
         return response.text
 
+    def _download_config_snapshot(self, config_type: str) -> PaloAltoConfigSnapshot:
+        """`/config` 응답 본문을 메모리에 모으지 않고 받는 즉시 스트리밍 파싱합니다."""
+        response = self.get_api_data(self._config_params(config_type), stream=True)
+        try:
+            # gzip 등 Content-Encoding은 urllib3가 읽으면서 해제
+            response.raw.decode_content = True
+            return PaloAltoConfigSnapshot.from_stream(config_type, response.raw)
+        except (requests.exceptions.RequestException, requests.packages.urllib3.exceptions.HTTPError) as e:
+            raise FirewallConnectionError(f"설정 다운로드 중 연결 오류: {str(e)}")
+        finally:
+            response.close()
+
+    def get_config_snapshot(self, config_type: str = 'running') -> PaloAltoConfigSnapshot:
+        """
+        설정 스냅샷을 반환합니다. 아직 없으면 `/config`를 한 번 내려받아 파싱합니다.
+
+        스냅샷은 connect()/disconnect() 또는 clear_config_snapshot() 호출 시 폐기되므로,
+        동기화 1회(연결~해제) 동안 모든 export_*가 같은 설정을 기준으로 추출합니다.
+        여러 export가 동시에 호출되어도 다운로드는 한 번만 일어나도록 잠금을 겁니다.
+        """
+        with self._config_lock:
+            snapshot = self._config_snapshots.get(config_type)
+            if snapshot is None:
+                snapshot = self._download_config_snapshot(config_type)
+                self._config_snapshots[config_type] = snapshot
+            return snapshot
+
+    def clear_config_snapshot(self) -> None:
+        """보관 중인 설정 스냅샷을 모두 폐기합니다 (다음 export 시 새로 다운로드)."""
+        with self._config_lock:
+            self._config_snapshots.clear()
+
     def get_system_info(self) -> pd.DataFrame:
         """장비의 시스템 정보를 조회합니다."""
         params = (
@@ -169,176 +428,47 @@ class PaloAltoAPI(FirewallInterface):
         1. /config/devices/entry/vsys/entry 경로를 통해 각 가상 시스템(VSYS)에 접근합니다.
         2. 각 VSYS 내부의 rulebase/security/rules/entry 경로를 순회하며 개별 정책을 파싱합니다.
         3. <disabled> 태그 존재 여부에 따라 정책의 활성화 상태를 판단합니다.
+
+        행 추출은 설정 스냅샷 파싱 중에 이루어집니다 (`PaloAltoConfigSnapshot._rule_record`).
         """
         config_type = kwargs.get('config_type', 'running')
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        
-        # 모든 VSYS 항목 탐색
-        vsys_entries = tree.findall('./result/config/devices/entry/vsys/entry')
-        security_rules = []
-
-        for vsys in vsys_entries:
-            vsys_name = vsys.attrib.get('name')
-            # 해당 VSYS의 보안 정책 기지(rulebase) 탐색
-            rulebase = vsys.findall('./rulebase/security/rules/entry')
-            for idx, rule in enumerate(rulebase):
-                rule_name = str(rule.attrib.get('name'))
-                
-                # PAN-OS XML: <disabled>yes</disabled> 이면 비활성 상태입니다.
-                disabled_list = self._get_member_texts(rule.findall('./disabled'))
-                is_disabled = (self.list_to_string(disabled_list).strip().lower() == "yes")
-                # 내부 표준에 따라 활성은 'Y', 비활성은 'N'으로 변환
-                disabled_status = "Y" if not is_disabled else "N"
-                
-                # 각 정책 구성 요소(객체)들을 콤마 구분 문자열로 추출
-                action = self.list_to_string(self._get_member_texts(rule.findall('./action')))
-                source = self.list_to_string(self._get_member_texts(rule.findall('./source/member')))
-                user = self.list_to_string(self._get_member_texts(rule.findall('./source-user/member')))
-                destination = self.list_to_string(self._get_member_texts(rule.findall('./destination/member')))
-                service = self.list_to_string(self._get_member_texts(rule.findall('./service/member')))
-                application = self.list_to_string(self._get_member_texts(rule.findall('./application/member')))
-
-                # 출발지/목적지 존, 로그 포워딩 프로파일 (Palo Alto 전용 필드)
-                from_zone = self.list_to_string(self._get_member_texts(rule.findall('./from/member')))
-                to_zone = self.list_to_string(self._get_member_texts(rule.findall('./to/member')))
-                log_setting = self.list_to_string(self._get_member_texts(rule.findall('./log-setting')))
-
-                # 보안 프로필 및 카테고리 정보 추출
-                url_filtering = self.list_to_string(self._get_member_texts(rule.findall('./profile-setting/profiles/url-filtering/member')))
-                category = self.list_to_string(self._get_member_texts(rule.findall('./category/member')))
-                category = "any" if not category else category
-                
-                # 설명(Description) 필드 줄바꿈 제거
-                description_list = self._get_member_texts(rule.findall('./description'))
-                description = self.list_to_string([desc.replace('\n', ' ') for desc in description_list])
-
-                rule_info = {
-                    "vsys": vsys_name,
-                    "seq": idx + 1,
-                    "rule_name": rule_name,
-                    "enable": disabled_status,
-                    "action": action,
-                    "source": source,
-                    "user": user,
-                    "destination": destination,
-                    "service": service,
-                    "application": application,
-                    "security_profile": url_filtering,
-                    "category": category,
-                    "description": description,
-                    "from_zone": from_zone,
-                    "to_zone": to_zone,
-                    "log_setting": log_setting,
-                }
-                security_rules.append(rule_info)
-
-        return pd.DataFrame(security_rules)
+        return pd.DataFrame(self.get_config_snapshot(config_type).records['security_rule'])
 
     def export_network_objects(self) -> pd.DataFrame:
         """네트워크 주소 객체를 추출합니다."""
-        config_xml = self.get_config()
-        tree = ET.fromstring(config_xml)
-        address_entries = tree.findall('./result/config/devices/entry/vsys/entry/address/entry')
-        address_objects = []
-
-        for address in address_entries:
-            address_name = address.attrib.get('name')
-            # ip-netmask, ip-range, fqdn 중 하나를 가짐
-            address_type = address.find('*').tag if address.find('*') is not None else ""
-            member_elements = address.findall(f'./{address_type}')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            object_info = {
-                "Name": address_name,
-                "Type": address_type,
-                "Value": self.list_to_string(members)
-            }
-            address_objects.append(object_info)
-
-        return pd.DataFrame(address_objects)
+        return pd.DataFrame(self.get_config_snapshot().records['address'])
 
     def export_network_group_objects(self) -> pd.DataFrame:
         """네트워크 주소 그룹 객체를 추출합니다."""
-        config_xml = self.get_config()
-        tree = ET.fromstring(config_xml)
-        group_entries = tree.findall('./result/config/devices/entry/vsys/entry/address-group/entry')
-        group_objects = []
-
-        for group in group_entries:
-            group_name = group.attrib.get('name')
-            member_elements = group.findall('./static/member')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            group_info = {
-                "Group Name": group_name,
-                "Entry": self.list_to_string(members)
-            }
-            group_objects.append(group_info)
-
-        return pd.DataFrame(group_objects)
+        return pd.DataFrame(self.get_config_snapshot().records['address_group'])
 
     def export_service_objects(self) -> pd.DataFrame:
         """서비스(포트) 객체를 추출합니다."""
-        config_xml = self.get_config()
-        tree = ET.fromstring(config_xml)
-        service_entries = tree.findall('./result/config/devices/entry/vsys/entry/service/entry')
-        service_objects = []
-
-        for service in service_entries:
-            service_name = service.attrib.get('name')
-            protocol_elem = service.find('protocol')
-            if protocol_elem is not None:
-                for protocol in protocol_elem:
-                    protocol_name = protocol.tag
-                    port = protocol.find('port').text if protocol.find('port') is not None else None
-
-                    service_info = {
-                        "Name": service_name,
-                        "Protocol": protocol_name,
-                        "Port": port,
-                    }
-                    service_objects.append(service_info)
-
-        return pd.DataFrame(service_objects)
+        return pd.DataFrame(self.get_config_snapshot().records['service'])
 
     def export_service_group_objects(self) -> pd.DataFrame:
         """서비스 그룹 객체를 추출합니다."""
-        config_xml = self.get_config()
-        tree = ET.fromstring(config_xml)
-        group_entries = tree.findall('./result/config/devices/entry/vsys/entry/service-group/entry')
-        group_objects = []
-
-        for group in group_entries:
-            group_name = group.attrib.get('name')
-            member_elements = group.findall('./members/member')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            group_info = {
-                "Group Name": group_name,
-                "Entry": self.list_to_string(members),
-            }
-            group_objects.append(group_info)
+        return pd.DataFrame(self.get_config_snapshot().records['service_group'])
 
-        return pd.DataFrame(group_objects)
-
-    def export_last_hit_date(self, vsys: list[str] | set[str] | None = None) -> pd.DataFrame:
+    def export_last_hit_date(
+        self,
+        vsys: list[str] | set[str] | None = None,
+        max_concurrency: int | None = None,
+    ) -> pd.DataFrame:
         """
         XML API를 사용하여 정책별 히트 카운트 및 날짜 정보를 조회합니다.
 
+        VSYS별 조회는 최대 max_concurrency개(기본 hit_count_concurrency)까지 동시에 요청하므로
+        전체 소요 시간은 VSYS 수의 합이 아니라 가장 느린 VSYS 수준이 됩니다. 관리 플레인 부하를
+        고려해 동시 요청 수를 제한하며, 요청은 장비 HTTP 세션의 연결 풀을 공유합니다.
+        각 VSYS 응답은 컬럼 목록으로만 파싱하고, 날짜 변환과 DataFrame 생성은 합친 뒤 한 번에 합니다.
+
         Palo Alto XML API 응답 구조:
         - member_texts[1]: Hit Count
         - member_texts[2]: Last Hit Timestamp (Epoch)
         - member_texts[4]: First Hit Timestamp (Epoch)
         """
-        results: list[dict] = []
-
-        def _ts_to_date(ts_int: int) -> str | None:
-            if ts_int == 0:
-                return None
-            return datetime.datetime.fromtimestamp(ts_int).strftime('%Y-%m-%d')
-
-        def _fetch_vsys_hit(vsys_name: str) -> list[dict]:
+        def _fetch_vsys_hit(vsys_name: str) -> tuple[list[str], list[int], list[int], list[int]]:
             params = (
                 ('type', 'op'),
                 (
@@ -353,7 +483,10 @@ class PaloAltoAPI(FirewallInterface):
             tree = ET.fromstring(response.text)
             rule_entries = tree.findall('./result/rule-hit-count/vsys/entry/rule-base/entry/rules/entry')
 
-            vsys_results: list[dict] = []
+            rule_names: list[str] = []
+            hit_counts: list[int] = []
+            last_hit_ts: list[int] = []
+            first_hit_ts: list[int] = []
             for rule in rule_entries:
                 rule_name = str(rule.attrib.get('name'))
 
@@ -364,35 +497,70 @@ class PaloAltoAPI(FirewallInterface):
                 member_texts = self._get_member_texts(rule)
                 try:
                     hit_count = int(member_texts[1])
-                    last_hit_ts = int(member_texts[2])
-                    first_hit_ts = int(member_texts[4])
+                    last_ts = int(member_texts[2])
+                    first_ts = int(member_texts[4])
                 except (IndexError, ValueError) as e:
                     self.logger.error("히트 카운트 파싱 오류 (%s): %s", rule_name, e)
                     continue
 
-                unused_days = 99999 if first_hit_ts == 0 else (
-                    datetime.datetime.now() - datetime.datetime.fromtimestamp(last_hit_ts)
-                ).days
-
-                vsys_results.append({
-                    "vsys": vsys_name,
-                    "rule_name": rule_name,
-                    "hit_count": hit_count,
-                    "first_hit_date": _ts_to_date(first_hit_ts),
-                    "last_hit_date": _ts_to_date(last_hit_ts),
-                    "unused_days": unused_days,
-                })
-            return vsys_results
-
-        target_vsys_list: list[str] = [str(v) for v in vsys] if vsys else ['vsys1']
+                rule_names.append(rule_name)
+                hit_counts.append(hit_count)
+                last_hit_ts.append(last_ts)
+                first_hit_ts.append(first_ts)
+            return rule_names, hit_counts, last_hit_ts, first_hit_ts
 
-        for vsys_name in target_vsys_list:
+        def _fetch_or_skip(vsys_name: str):
             try:
-                results.extend(_fetch_vsys_hit(vsys_name))
+                return _fetch_vsys_hit(vsys_name)
             except Exception as e:
                 self.logger.warning("VSYS %s hit-date 조회 실패: %s", vsys_name, e)
+                return None
 
-        return pd.DataFrame(results)
+        target_vsys_list: list[str] = [str(v) for v in vsys] if vsys else ['vsys1']
+        workers = max(1, min(max_concurrency or self.hit_count_concurrency, len(target_vsys_list)))
+        if workers == 1:
+            fetched = [_fetch_or_skip(vsys_name) for vsys_name in target_vsys_list]
+        else:
+            # 이 메서드는 IO_EXECUTOR 스레드에서 호출되므로 같은 풀에 다시 제출하지 않고 전용 풀을 사용
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pa-hit") as executor:
+                fetched = list(executor.map(_fetch_or_skip, target_vsys_list))
+
+        # VSYS 순서대로 컬럼을 이어 붙임
+        columns: dict[str, list] = {"vsys": [], "rule_name": [], "hit_count": [], "last_ts": [], "first_ts": []}
+        for vsys_name, result in zip(target_vsys_list, fetched):
+            if result is None:
+                continue
+            rule_names, hit_counts, last_hit_ts, first_hit_ts = result
+            columns["vsys"].extend([vsys_name] * len(rule_names))
+            columns["rule_name"].extend(rule_names)
+            columns["hit_count"].extend(hit_counts)
+            columns["last_ts"].extend(last_hit_ts)
+            columns["first_ts"].extend(first_hit_ts)
+
+        if not columns["rule_name"]:
+            return pd.DataFrame()
+
+        # 타임스탬프 → 로컬 날짜/경과일 변환은 고유 값마다 한 번만 계산
+        now = datetime.datetime.now()
+        local_times = {
+            ts: datetime.datetime.fromtimestamp(ts)
+            for ts in set(columns["last_ts"]) | set(columns["first_ts"])
+        }
+        local_dates = {
+            ts: (None if ts == 0 else local_time.strftime('%Y-%m-%d'))
+            for ts, local_time in local_times.items()
+        }
+        return pd.DataFrame({
+            "vsys": columns["vsys"],
+            "rule_name": columns["rule_name"],
+            "hit_count": columns["hit_count"],
+            "first_hit_date": [local_dates[ts] for ts in columns["first_ts"]],
+            "last_hit_date": [local_dates[ts] for ts in columns["last_ts"]],
+            "unused_days": [
+                99999 if first_ts == 0 else (now - local_times[last_ts]).days
+                for first_ts, last_ts in zip(columns["first_ts"], columns["last_ts"])
+            ],
+        })
 
     def export_last_hit_date_ssh(self, vsys: list[str] | set[str] | None = None, timeout: int = 3600) -> pd.DataFrame:
         """
@@ -400,11 +568,11 @@ class PaloAltoAPI(FirewallInterface):
         API 응답이 부정확하거나 누락된 데이터가 있을 때 대안으로 사용됩니다.
         
         주요 로직:
-        1. Paramiko를 통한 SSH 세션 수립 및 인터랙티브 쉘(invoke_shell) 실행.
-        2. 프롬프트('>', '#')가 나타날 때까지 버퍼를 읽는 `read_until_prompt` 구현.
+        1. 장비 SSH 세션 풀에서 인터랙티브 쉘 세션을 대여 (없으면 접속 후 invoke_shell 실행).
+        2. 세션이 프롬프트('>', '#')가 나타날 때까지 출력을 읽음 (`SSHShellSession.read_until_prompt`).
         3. CLI 환경 설정을 조정: scripting-mode ON(파싱 최적화), pager OFF(중단 없는 출력).
-        4. 정책 정보를 출력하는 CLI 명령 실행 및 수천 줄에 달하는 출력을 수집.
-        5. 복합 정규식(Regex)을 사용하여 정책 이름, 히트 수, 타임스탬프를 한 줄씩 파싱.
+        4. 정책 정보를 출력하는 CLI 명령 실행. 수천 줄에 달하는 출력은 모아 두지 않고 수신되는 대로 처리.
+        5. 복합 정규식(Regex)을 사용하여 정책 이름, 히트 수, 타임스탬프를 한 줄씩 파싱 (`_hit_count_line_parser`).
            - 타임스탬프 포맷(예: Tue Nov 4 00:50:48 2025)을 정규화하여 처리.
         """
         target_vsys_list: list[str] = ['vsys1']
@@ -414,99 +582,18 @@ class PaloAltoAPI(FirewallInterface):
         self.logger.info(f"Palo Alto SSH 기반 히트 정보 수집 시작 (VSYS: {target_vsys_list})")
         all_results = []
 
-        ssh = None
         try:
-            # SSH 클라이언트 설정 및 접속
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(
-                self.hostname, port=22, 
-                username=self.username, password=self._password, 
-                timeout=20, look_for_keys=False, allow_agent=False
-            )
-
-            # 인터랙티브 쉘 채널 획득
-            channel = ssh.invoke_shell()
-
-            def read_until_prompt(prompt_pattern: str = r'>\s*$', timeout: int = 10) -> str:
-                """쉘 프롬프트가 나타날 때까지 데이터를 계속해서 읽어들입니다."""
-                output = ""
-                start_time = time.time()
-                while True:
-                    if channel.recv_ready():
-                        # 수신된 바이트를 UTF-8로 디코딩, 오류 무시
-                        output += channel.recv(65535).decode('utf-8', errors='ignore')
-                        # 프롬프트 기호(>, #)로 끝나면 수신 완료로 판단
-                        if output.strip().endswith(('>', '#')):
-                            return output
-
-                    if time.time() - start_time > timeout:
-                        raise TimeoutError(f"쉘 프롬프트 대기 시간 초과. 현재 출력:\n{output}")
-
-                    time.sleep(0.5)
-
-            # 로그인 배너 및 초기 프롬프트 대기
-            read_until_prompt(timeout=20)
-
-            # CLI 자동화 설정: 스크립팅 모드 활성화 및 페이징 비활성화
-            channel.send("set cli scripting-mode on\n")
-            read_until_prompt()
-            channel.send("set cli pager off\n")
-            read_until_prompt()
-
-            for vsys_name in target_vsys_list:
-                command = f"show rule-hit-count vsys vsys-name {vsys_name} rule-base security rules all\n"
-                self.logger.info(f"VSYS {vsys_name} 명령 실행: {command.strip()}")
-                channel.send(command)
-
-                # 대량의 정책 정보 출력을 고려하여 긴 타임아웃 적용 (호출자가 지정, 기본 3600초)
-                output = read_until_prompt(timeout=timeout)
-                self.logger.info(f"VSYS {vsys_name} 데이터 수신 완료, 파싱 시작.")
-
-                lines = output.splitlines()
-                parsing_started = False
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # CLI 출력에서 데이터 섹션을 알리는 구분선(----------) 확인
-                    if '----------' in line:
-                        parsing_started = True
-                        continue
-
-                    if not parsing_started:
-                        continue
-
-                    # 기본 정책이 나타나면 사용자 정의 정책 영역 종료로 간주
-                    if 'intrazone-default' in line or 'interzone-default' in line:
-                        break
-
-                    # 정규식 패턴 분석: [룰이름] [히트수] [날짜문자열 또는 '-']
-                    # 날짜 예시: "Tue Nov  4 00:50:48 2025"
-                    match = re.match(r'^([a-zA-Z0-9/._-]+)\s+(\d+)\s+([A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4}|-)', line)
-                    if match:
-                        rule_name = match.group(1)
-                        hit_count = int(match.group(2))
-                        timestamp_str = match.group(3).strip()
-
-                        last_hit_date = None
-                        if timestamp_str != '-':
-                            try:
-                                # 날짜 사이의 중복 공백(한 자리 일자 대비)을 단일 공백으로 치환
-                                normalized_ts = re.sub(r'\s+', ' ', timestamp_str)
-                                # "%a %b %d %H:%M:%S %Y" 형식으로 파싱
-                                dt_obj = datetime.datetime.strptime(normalized_ts, '%a %b %d %H:%M:%S %Y')
-                                last_hit_date = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
-                            except ValueError:
-                                self.logger.warning(f"규칙 '{rule_name}'의 타임스탬프 파싱 실패: '{timestamp_str}'")
-
-                        all_results.append({
-                            "vsys": vsys_name,
-                            "rule_name": rule_name,
-                            "hit_count": hit_count,
-                            "last_hit_date": last_hit_date
-                        })
+            # 풀의 쉘 세션 사용 (로그인·pager 해제 완료 상태). 스크립팅 모드는 명령 실행 시 활성화
+            with self._ssh_pool.acquire() as session:
+                for vsys_name in target_vsys_list:
+                    command = f"show rule-hit-count vsys vsys-name {vsys_name} rule-base security rules all"
+                    self.logger.info(f"VSYS {vsys_name} 명령 실행: {command}")
+
+                    # 대량의 정책 정보 출력을 고려하여 긴 타임아웃 적용 (호출자가 지정, 기본 3600초).
+                    # 출력은 모아 두지 않고 줄 단위로 수신 즉시 파싱
+                    parse_line = self._hit_count_line_parser(vsys_name, all_results)
+                    session.run(command, timeout=timeout, scripting_mode=True, on_line=parse_line)
+                    self.logger.info(f"VSYS {vsys_name} 데이터 수신 및 파싱 완료.")
 
         except paramiko.AuthenticationException:
             self.logger.error(f"SSH 인증 실패: {self.hostname}")
@@ -520,13 +607,71 @@ class PaloAltoAPI(FirewallInterface):
         except Exception as e:
             self.logger.error(f"SSH 수집 중 예기치 않은 오류 발생: {self.hostname}, {e}", exc_info=True)
             raise FirewallAPIError(f"SSH 수집 중 오류: {str(e)}")
-        finally:
-            if ssh:
-                ssh.close()
-                self.logger.info(f"SSH 연결 종료: {self.hostname}")
 
         return pd.DataFrame(all_results)
 
+    # 정규식 패턴 분석: [룰이름] [히트수] [날짜문자열 또는 '-']
+    # 날짜 예시: "Tue Nov  4 00:50:48 2025"
+    _HIT_COUNT_LINE = re.compile(
+        r'^([a-zA-Z0-9/._-]+)\s+(\d+)\s+([A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4}|-)'
+    )
+
+    def _hit_count_line_parser(self, vsys_name: str, results: list[dict]):
+        """
+        `show rule-hit-count` 출력 한 줄씩을 받아 results에 정책 행을 추가하는 콜백을 만듭니다.
+
+        구분선(----------) 이후부터 파싱하고, 기본 정책(intrazone/interzone-default)이 나타나면
+        사용자 정의 정책 영역 종료로 보고 이후 줄은 무시합니다.
+        """
+        state = {"started": False, "done": False}
+
+        def parse_line(line: str) -> None:
+            if state["done"]:
+                return
+            line = line.strip()
+            if not line:
+                return
+
+            # CLI 출력에서 데이터 섹션을 알리는 구분선(----------) 확인
+            if '----------' in line:
+                state["started"] = True
+                return
+
+            if not state["started"]:
+                return
+
+            # 기본 정책이 나타나면 사용자 정의 정책 영역 종료로 간주
+            if 'intrazone-default' in line or 'interzone-default' in line:
+                state["done"] = True
+                return
+
+            match = self._HIT_COUNT_LINE.match(line)
+            if not match:
+                return
+            rule_name = match.group(1)
+            hit_count = int(match.group(2))
+            timestamp_str = match.group(3).strip()
+
+            last_hit_date = None
+            if timestamp_str != '-':
+                try:
+                    # 날짜 사이의 중복 공백(한 자리 일자 대비)을 단일 공백으로 치환
+                    normalized_ts = re.sub(r'\s+', ' ', timestamp_str)
+                    # "%a %b %d %H:%M:%S %Y" 형식으로 파싱
+                    dt_obj = datetime.datetime.strptime(normalized_ts, '%a %b %d %H:%M:%S %Y')
+                    last_hit_date = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
+                except ValueError:
+                    self.logger.warning(f"규칙 '{rule_name}'의 타임스탬프 파싱 실패: '{timestamp_str}'")
+
+            results.append({
+                "vsys": vsys_name,
+                "rule_name": rule_name,
+                "hit_count": hit_count,
+                "last_hit_date": last_hit_date
+            })
+
+        return parse_line
+
     # PAN-OS 리소스 한도 키 → Device threshold 필드명 매핑
     _RESOURCE_LIMIT_KEY_MAP = {
         "max-policy-rule": "policy_threshold",
@@ -545,40 +690,9 @@ class PaloAltoAPI(FirewallInterface):
         """
         self.logger.info(f"Palo Alto 리소스 한도 조회 시작: {self.hostname}")
 
-        ssh = None
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(
-                self.hostname, port=22,
-                username=self.username, password=self._password,
-                timeout=20, look_for_keys=False, allow_agent=False
-            )
-
-            # exec_command는 매 호출마다 새 세션이라 pager 설정이 적용되지 않아
-            # 출력이 길면 --More-- 에서 멈춰 타임아웃남. 인터랙티브 쉘로 pager를 먼저 끈다
-            # (export_last_hit_date_ssh와 동일한 패턴).
-            channel = ssh.invoke_shell()
-
-            def read_until_prompt(timeout: int = 10) -> str:
-                output = ""
-                start_time = time.time()
-                while True:
-                    if channel.recv_ready():
-                        output += channel.recv(65535).decode('utf-8', errors='ignore')
-                        if output.strip().endswith(('>', '#')):
-                            return output
-                    if time.time() - start_time > timeout:
-                        raise TimeoutError(f"쉘 프롬프트 대기 시간 초과. 현재 출력:\n{output}")
-                    time.sleep(0.5)
-
-            read_until_prompt(timeout=20)  # 로그인 배너 및 초기 프롬프트 대기
-
-            channel.send("set cli pager off\n")
-            read_until_prompt()
-
-            channel.send("show system state filter cfg.general.max*\n")
-            output = read_until_prompt(timeout=30)
+            with self._ssh_pool.acquire() as session:
+                output = session.run("show system state filter cfg.general.max*", timeout=30, scripting_mode=False)
 
             limits = {}
             for line in output.splitlines():
@@ -604,10 +718,6 @@ class PaloAltoAPI(FirewallInterface):
         except Exception as e:
             self.logger.error(f"리소스 한도 조회 중 예기치 않은 오류 발생: {self.hostname}, {e}", exc_info=True)
             raise FirewallAPIError(f"리소스 한도 조회 중 오류: {str(e)}")
-        finally:
-            if ssh:
-                ssh.close()
-                self.logger.info(f"SSH 연결 종료: {self.hostname}")
 
     # PAN-OS `show system info` 키 → Device 필드명 매핑
     _SYSTEM_INFO_KEY_MAP = {
@@ -628,37 +738,9 @@ class PaloAltoAPI(FirewallInterface):
         """
         self.logger.info(f"Palo Alto 시스템 정보 조회 시작: {self.hostname}")
 
-        ssh = None
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(
-                self.hostname, port=22,
-                username=self.username, password=self._password,
-                timeout=20, look_for_keys=False, allow_agent=False
-            )
-
-            channel = ssh.invoke_shell()
-
-            def read_until_prompt(timeout: int = 10) -> str:
-                output = ""
-                start_time = time.time()
-                while True:
-                    if channel.recv_ready():
-                        output += channel.recv(65535).decode('utf-8', errors='ignore')
-                        if output.strip().endswith(('>', '#')):
-                            return output
-                    if time.time() - start_time > timeout:
-                        raise TimeoutError(f"쉘 프롬프트 대기 시간 초과. 현재 출력:\n{output}")
-                    time.sleep(0.5)
-
-            read_until_prompt(timeout=20)  # 로그인 배너 및 초기 프롬프트 대기
-
-            channel.send("set cli pager off\n")
-            read_until_prompt()
-
-            channel.send("show system info\n")
-            output = read_until_prompt(timeout=30)
+            with self._ssh_pool.acquire() as session:
+                output = session.run("show system info", timeout=30, scripting_mode=False)
 
             info = {}
             for line in output.splitlines():
@@ -684,7 +766,3 @@ class PaloAltoAPI(FirewallInterface):
         except Exception as e:
             self.logger.error(f"시스템 정보 조회 중 예기치 않은 오류 발생: {self.hostname}, {e}", exc_info=True)
             raise FirewallAPIError(f"시스템 정보 조회 중 오류: {str(e)}")
-        finally:
-            if ssh:
-                ssh.close()
-                self.logger.info(f"SSH 연결 종료: {self.hostname}")
@@ -0,0 +1,381 @@
+"""
+흐름(출발지 IP, 목적지 IP, 프로토콜, 포트[, 존]) 묶음마다 처음으로 일치하는 정책을 찾는 일괄 조회
+(packet trace).
+
+장비의 정책 멤버 인덱스(`policy_address_members` / `policy_service_members`)를 한 번 읽어
+차원(출발지/목적지 IPv4·IPv6, 프로토콜별 포트)마다 정렬된 구간 경계 목록(`_IntervalIndex`)을 만듭니다.
+조회할 흐름 값을 정렬한 뒤 경계를 한 번 훑으면(sweep) 각 값을 포함하는 정책 집합을 비트마스크(정수)로
+얻을 수 있습니다. 정책 비트는 평가 순서((vsys, seq, id))대로 매기므로 차원별 마스크 교집합의
+가장 낮은 비트가 첫 일치 정책입니다.
+
+판정 기준:
+- 활성(is_active) 정책 중 비활성화(enable = False)되지 않은 정책만 대상
+- 주소: 인덱스 범위에 포함되거나 필드에 'any'가 있으면 일치 (FQDN 등 범위로 해소되지 않는 멤버는 불일치)
+- 서비스: 같은 프로토콜 또는 'any' 프로토콜 범위에 포트가 포함되면 일치. 포트를 생략하면(ICMP 등)
+  해당 프로토콜 멤버가 하나라도 있으면 일치. 포트 없는 프로토콜 서비스(ICMP 등, token_type = 'protocol')는
+  그 프로토콜의 모든 흐름과 일치
+- application-default 서비스 정책은 애플리케이션 표준 포트를 알 수 없어 일치로 확정하지 않고,
+  서비스 외 조건이 모두 맞으면 첫 일치 정책보다 앞선 것만 가능한 일치(possible_matches)로 함께 반환
+- 존/vsys: 흐름에 지정한 경우에만 비교 (정책 존이 비었거나 'any'면 일치)
+- 애플리케이션 조건은 판정에 쓰지 않으며, 일치 정책의 application 값을 함께 반환합니다
+
+장비별 구조는 `devices.data_version`을 키로 캐시하므로 동기화·재인덱싱 전까지 재사용됩니다.
+흐름별 마스크는 정책 수만큼의 비트를 가지므로 흐름을 FLOW_BATCH_SIZE건씩 나눠 조회해 메모리 사용량을 묶어 둡니다.
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from ipaddress import ip_address
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import crud, models, schemas
+from app.services.group_closure import parse_group_members
+from app.services.normalize import join_ipv6_numeric, parse_ipv4_fast
+from app.services.policy_builder.member_resolver import merge_numeric_ranges
+
+# 한 요청에서 조회할 수 있는 최대 흐름 수
+MAX_FLOWS_PER_REQUEST = 20000
+
+# 한 번에 마스크를 계산하는 흐름 수. 흐름·차원마다 정책 수 비트의 마스크를 만들므로
+# (정책 1만 건이면 마스크 1개 약 1.3KB) 요청 전체를 한 번에 처리하지 않고 이 단위로 나눕니다.
+FLOW_BATCH_SIZE = 5000
+
+# 흐름 1건에 돌려주는 가능한 일치 정책(application-default) 최대 수
+MAX_POSSIBLE_MATCHES = 10
+
+# 장비별 조회 구조 캐시 항목 수
+_CACHE_MAX_DEVICES = 8
+
+# IP 프로토콜 번호로 입력한 경우의 이름
+_PROTOCOL_NUMBERS = {"6": "tcp", "17": "udp", "1": "icmp", "58": "icmp6", "132": "sctp"}
+
+# 주소/존 필드의 'any', 그리고 모든 프로토콜에 적용되는 포트 구간의 키
+# (protocol = 'any' 또는 프로토콜 없이 포트만 쓴 토큰)
+_ANY = "any"
+
+
+class _IntervalIndex:
+    """
+    정책별 정수 구간을 정렬된 경계 목록으로 보관합니다.
+
+    같은 정책의 구간은 병합해 서로 겹치지 않게 두므로, 경계를 지날 때마다 그 정책의 비트를
+    토글(XOR)하는 것만으로 현재 값을 포함하는 정책 집합을 유지할 수 있습니다.
+    주소 멤버처럼 인덱서가 정책·방향별로 이미 병합해 둔 구간은 merged=True로 병합을 생략합니다.
+    """
+
+    __slots__ = ("points", "rules", "mask_bytes")
+
+    def __init__(self, ranges_by_rule: Dict[int, List[Tuple[int, int]]], merged: bool = False) -> None:
+        events: List[Tuple[int, int]] = []
+        for rule, ranges in ranges_by_rule.items():
+            for start, end in (ranges if merged else merge_numeric_ranges(ranges)):
+                events.append((start, rule))
+                events.append((end + 1, rule))
+        events.sort()
+        self.points = [point for point, _ in events]
+        self.rules = [rule for _, rule in events]
+        self.mask_bytes = (max(ranges_by_rule, default=-1) >> 3) + 1
+
+    def masks_at(self, values: Sequence[int]) -> List[int]:
+        """
+        각 값을 포함하는 정책 비트마스크 목록 (values 순서 유지).
+
+        훑는 동안의 정책 집합은 바이트 배열에서 비트만 토글하고, 값마다 한 번만 정수로 변환합니다
+        (경계마다 정책 수 비트의 큰 정수를 새로 만들지 않음).
+        """
+        masks = [0] * len(values)
+        points, rules = self.points, self.rules
+        state = bytearray(self.mask_bytes)
+        mask, changed, i, n = 0, False, 0, len(points)
+        for q in sorted(range(len(values)), key=values.__getitem__):
+            value = values[q]
+            while i < n and points[i] <= value:
+                rule = rules[i]
+                state[rule >> 3] ^= 1 << (rule & 7)
+                changed = True
+                i += 1
+            if changed:
+                mask, changed = int.from_bytes(state, "little"), False
+            masks[q] = mask
+        return masks
+
+
+@dataclass
+class _DeviceFlowIndex:
+    """장비 한 대의 흐름 조회 구조."""
+    policies: List[tuple]
+    src: Dict[int, _IntervalIndex]          # IP 버전 → 출발지 구간
+    dst: Dict[int, _IntervalIndex]          # IP 버전 → 목적지 구간
+    src_any: int
+    dst_any: int
+    ports: Dict[str, _IntervalIndex]        # 프로토콜 → 포트 구간 (_ANY 포함)
+    protocol_any_port: Dict[str, int]       # 프로토콜 → 멤버가 하나라도 있는 정책 마스크
+    protocol_whole: Dict[str, int] = field(default_factory=dict)  # 프로토콜 → 포트 없이 프로토콜 전체를 허용하는 정책 마스크
+    application_default: int = 0            # application-default 서비스를 가진 정책 마스크
+    from_zones: Dict[str, int] = field(default_factory=dict)
+    to_zones: Dict[str, int] = field(default_factory=dict)
+    from_zone_any: int = 0
+    to_zone_any: int = 0
+    vsys: Dict[Optional[str], int] = field(default_factory=dict)
+
+
+_cache: "OrderedDict[int, Tuple[int, _DeviceFlowIndex]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _bits_to_mask(bits: Iterable[int]) -> int:
+    """정책 비트 번호 목록을 비트마스크로 만듭니다 (큰 정수에 비트를 하나씩 OR하지 않도록 바이트 배열 사용)."""
+    buffer = bytearray()
+    for bit in bits:
+        index = bit >> 3
+        if index >= len(buffer):
+            buffer.extend(bytes(index + 1 - len(buffer)))
+        buffer[index] |= 1 << (bit & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _any_mask(policies: List[tuple], column: int) -> int:
+    """쉼표 구분 주소 필드에 'any'가 있는 정책 마스크."""
+    return _bits_to_mask(
+        bit for bit, policy in enumerate(policies)
+        if any(name.lower() == _ANY for name in parse_group_members(policy[column]))
+    )
+
+
+def _zone_masks(policies: List[tuple], column: int) -> Tuple[Dict[str, int], int]:
+    """존 필드로 (소문자 존 이름 → 정책 마스크, 존이 비었거나 'any'인 정책 마스크)를 만듭니다."""
+    by_zone: Dict[str, List[int]] = defaultdict(list)
+    any_bits: List[int] = []
+    for bit, policy in enumerate(policies):
+        zones = {name.lower() for name in parse_group_members(policy[column])}
+        if not zones or _ANY in zones:
+            any_bits.append(bit)
+        for zone in zones:
+            by_zone[zone].append(bit)
+    return {zone: _bits_to_mask(bits) for zone, bits in by_zone.items()}, _bits_to_mask(any_bits)
+
+
+async def _build_index(db: AsyncSession, device_id: int) -> _DeviceFlowIndex:
+    policy = models.Policy
+    result = await db.execute(
+        select(
+            policy.id, policy.rule_name, policy.vsys, policy.seq, policy.action, policy.application,
+            policy.source, policy.destination, policy.from_zone, policy.to_zone,
+        )
+        .where(policy.device_id == device_id, policy.is_active == True, policy.enable.isnot(False))
+        .order_by(policy.vsys, policy.seq, policy.id)
+    )
+    policies = [tuple(row) for row in result.all()]
+    bit_of = {row[0]: bit for bit, row in enumerate(policies)}
+
+    src_ranges: Dict[int, Dict[int, List[Tuple[int, int]]]] = {4: defaultdict(list), 6: defaultdict(list)}
+    dst_ranges: Dict[int, Dict[int, List[Tuple[int, int]]]] = {4: defaultdict(list), 6: defaultdict(list)}
+    # 멤버 행이 많으므로 ORM 엔티티 로딩을 거치지 않도록 Core 테이블 컬럼으로 조회
+    addr = models.PolicyAddressMember.__table__.c
+    result = await db.execute(
+        select(
+            addr.policy_id, addr.direction, addr.ip_start, addr.ip_end,
+            addr.ip6_start_hi, addr.ip6_start_lo, addr.ip6_end_hi, addr.ip6_end_lo,
+        ).where(addr.device_id == device_id, addr.token_type.in_(("ipv4_range", "ipv6_range")))
+    )
+    for policy_id, direction, start, end, start_hi, start_lo, end_hi, end_lo in result.all():
+        bit = bit_of.get(policy_id)
+        if bit is None:
+            continue
+        target = src_ranges if direction == "source" else dst_ranges
+        if start is not None and end is not None:
+            target[4][bit].append((start, end))
+        elif start_hi is not None and end_hi is not None:
+            target[6][bit].append((join_ipv6_numeric(start_hi, start_lo), join_ipv6_numeric(end_hi, end_lo)))
+
+    port_ranges: Dict[str, Dict[int, List[Tuple[int, int]]]] = defaultdict(lambda: defaultdict(list))
+    svc = models.PolicyServiceMember.__table__.c
+    result = await db.execute(
+        select(svc.policy_id, svc.protocol, svc.port_start, svc.port_end)
+        .where(svc.device_id == device_id, svc.port_start.isnot(None), svc.port_end.isnot(None))
+    )
+    for policy_id, protocol, start, end in result.all():
+        bit = bit_of.get(policy_id)
+        if bit is None:
+            continue
+        port_ranges[(protocol or _ANY).lower()][bit].append((start, end))
+
+    # 포트 없는 프로토콜 센티넬 행 (ICMP 등)과 application-default 센티넬 행
+    protocol_bits: Dict[str, List[int]] = defaultdict(list)
+    application_default_bits: List[int] = []
+    result = await db.execute(
+        select(svc.policy_id, svc.token_type, svc.protocol)
+        .where(svc.device_id == device_id, svc.token_type.in_(("protocol", "application_default")))
+    )
+    for policy_id, token_type, protocol in result.all():
+        bit = bit_of.get(policy_id)
+        if bit is None:
+            continue
+        if token_type == "application_default":
+            application_default_bits.append(bit)
+        elif protocol:
+            protocol_bits[protocol.lower()].append(bit)
+
+    from_zones, from_zone_any = _zone_masks(policies, 8)
+    to_zones, to_zone_any = _zone_masks(policies, 9)
+    vsys_bits: Dict[Optional[str], List[int]] = defaultdict(list)
+    for bit, row in enumerate(policies):
+        vsys_bits[row[2]].append(bit)
+
+    return _DeviceFlowIndex(
+        policies=policies,
+        src={version: _IntervalIndex(ranges, merged=True) for version, ranges in src_ranges.items()},
+        dst={version: _IntervalIndex(ranges, merged=True) for version, ranges in dst_ranges.items()},
+        src_any=_any_mask(policies, 6),
+        dst_any=_any_mask(policies, 7),
+        ports={protocol: _IntervalIndex(ranges) for protocol, ranges in port_ranges.items()},
+        protocol_any_port={protocol: _bits_to_mask(ranges) for protocol, ranges in port_ranges.items()},
+        protocol_whole={protocol: _bits_to_mask(bits) for protocol, bits in protocol_bits.items()},
+        application_default=_bits_to_mask(application_default_bits),
+        from_zones=from_zones,
+        to_zones=to_zones,
+        from_zone_any=from_zone_any,
+        to_zone_any=to_zone_any,
+        vsys={name: _bits_to_mask(bits) for name, bits in vsys_bits.items()},
+    )
+
+
+async def get_device_flow_index(db: AsyncSession, device_id: int) -> _DeviceFlowIndex:
+    """장비의 흐름 조회 구조를 데이터 버전 기준 캐시에서 가져오거나 새로 만듭니다."""
+    version = (await crud.device.get_data_versions(db, [device_id])).get(device_id, 0)
+    with _cache_lock:
+        cached = _cache.get(device_id)
+        if cached is not None and cached[0] == version:
+            _cache.move_to_end(device_id)
+            return cached[1]
+
+    index = await _build_index(db, device_id)
+    with _cache_lock:
+        _cache[device_id] = (version, index)
+        _cache.move_to_end(device_id)
+        while len(_cache) > _CACHE_MAX_DEVICES:
+            _cache.popitem(last=False)
+    return index
+
+
+def _parse_ip(value: str) -> Tuple[int, int]:
+    """단일 IP 주소를 (버전, 정수)로 변환합니다. 형식이 틀리면 ValueError."""
+    value = value.strip()
+    if '/' not in value and '-' not in value:
+        fast = parse_ipv4_fast(value)
+        if fast is not None:
+            return 4, fast[0]
+    address = ip_address(value)
+    return address.version, int(address)
+
+
+def _address_masks(intervals: Dict[int, _IntervalIndex], parsed: List[Optional[Tuple[int, int]]]) -> List[int]:
+    """흐름별 주소 값이 포함된 정책 마스크 (IP 버전별로 나눠 조회)."""
+    masks = [0] * len(parsed)
+    for version, index in intervals.items():
+        positions = [i for i, value in enumerate(parsed) if value is not None and value[0] == version]
+        if not positions:
+            continue
+        for i, mask in zip(positions, index.masks_at([parsed[i][1] for i in positions])):
+            masks[i] = mask
+    return masks
+
+
+def _possible_matches(index: _DeviceFlowIndex, mask: int) -> List[schemas.FlowCandidate]:
+    """마스크의 정책을 평가 순서대로 최대 MAX_POSSIBLE_MATCHES건 반환합니다."""
+    candidates: List[schemas.FlowCandidate] = []
+    while mask and len(candidates) < MAX_POSSIBLE_MATCHES:
+        lowest = mask & -mask
+        policy_id, rule_name, vsys, seq, action, application = index.policies[lowest.bit_length() - 1][:6]
+        candidates.append(schemas.FlowCandidate(
+            policy_id=policy_id, rule_name=rule_name, vsys=vsys, seq=seq, action=action, application=application,
+        ))
+        mask ^= lowest
+    return candidates
+
+
+def lookup_flows(index: _DeviceFlowIndex, flows: List[schemas.FlowTuple]) -> List[schemas.FlowMatch]:
+    """흐름마다 처음으로 일치하는 정책을 찾습니다 (입력 순서대로 결과 반환, FLOW_BATCH_SIZE건씩 처리)."""
+    results: List[schemas.FlowMatch] = []
+    for offset in range(0, len(flows), FLOW_BATCH_SIZE):
+        results.extend(_lookup_batch(index, flows[offset:offset + FLOW_BATCH_SIZE], offset))
+    return results
+
+
+def _lookup_batch(index: _DeviceFlowIndex, flows: List[schemas.FlowTuple], offset: int) -> List[schemas.FlowMatch]:
+    """흐름 한 묶음을 조회합니다. 결과의 index는 offset을 더한 요청 내 위치입니다."""
+    errors: List[Optional[str]] = [None] * len(flows)
+    src: List[Optional[Tuple[int, int]]] = [None] * len(flows)
+    dst: List[Optional[Tuple[int, int]]] = [None] * len(flows)
+    protocols: List[str] = []
+    for i, flow in enumerate(flows):
+        protocol = (flow.protocol or "").strip().lower()
+        protocols.append(_PROTOCOL_NUMBERS.get(protocol, protocol))
+        try:
+            src[i], dst[i] = _parse_ip(flow.src_ip), _parse_ip(flow.dst_ip)
+        except ValueError as e:
+            errors[i] = f"Invalid IP address: {e}"
+            continue
+        if src[i][0] != dst[i][0]:
+            errors[i] = "Source and destination IP versions differ"
+        elif not protocols[i] or protocols[i] == _ANY:
+            errors[i] = "Protocol is required"
+        elif flow.port is not None and not 0 <= flow.port <= 65535:
+            errors[i] = "Port must be between 0 and 65535"
+
+    src_masks = _address_masks(index.src, src)
+    dst_masks = _address_masks(index.dst, dst)
+
+    # 포트 구간은 흐름 프로토콜과 'any' 프로토콜 양쪽에서 조회
+    port_masks = [0] * len(flows)
+    for protocol_key in {*protocols, _ANY}:
+        ports = index.ports.get(protocol_key)
+        if ports is None:
+            continue
+        positions = [
+            i for i, flow in enumerate(flows)
+            if errors[i] is None and flow.port is not None
+            and (protocol_key == _ANY or protocols[i] == protocol_key)
+        ]
+        if positions:
+            for i, mask in zip(positions, ports.masks_at([flows[i].port for i in positions])):
+                port_masks[i] |= mask
+
+    results: List[schemas.FlowMatch] = []
+    for i, flow in enumerate(flows):
+        if errors[i] is not None:
+            results.append(schemas.FlowMatch(index=offset + i, matched=False, error=errors[i]))
+            continue
+        if flow.port is None:
+            service_mask = index.protocol_any_port.get(protocols[i], 0) | index.protocol_any_port.get(_ANY, 0)
+        else:
+            service_mask = port_masks[i]
+        service_mask |= index.protocol_whole.get(protocols[i], 0)
+        # 서비스 외 조건(주소·존·vsys)이 일치하는 정책
+        mask = (src_masks[i] | index.src_any) & (dst_masks[i] | index.dst_any)
+        if flow.from_zone:
+            mask &= index.from_zone_any | index.from_zones.get(flow.from_zone.strip().lower(), 0)
+        if flow.to_zone:
+            mask &= index.to_zone_any | index.to_zones.get(flow.to_zone.strip().lower(), 0)
+        if flow.vsys:
+            mask &= index.vsys.get(flow.vsys, 0)
+        possible = mask & index.application_default
+        mask &= service_mask
+        # 첫 일치 정책보다 앞선 application-default 정책만 결과를 바꿀 수 있음
+        first = mask & -mask
+        if first:
+            possible &= first - 1
+        possible_matches = _possible_matches(index, possible) if possible else []
+        if not mask:
+            results.append(schemas.FlowMatch(index=offset + i, matched=False, possible_matches=possible_matches))
+            continue
+        policy_id, rule_name, vsys, seq, action, application = index.policies[first.bit_length() - 1][:6]
+        results.append(schemas.FlowMatch(
+            index=offset + i, matched=True, policy_id=policy_id, rule_name=rule_name, vsys=vsys, seq=seq,
+            action=action, application=application, possible_matches=possible_matches,
+        ))
+    return results
@@ -0,0 +1,215 @@
+"""
+주소/서비스 그룹의 전이 폐포(closure)를 계산하고 `network_group_closures` /
+`service_group_closures` 테이블에 영속 저장하는 모듈.
+
+- 동기화(`sync_data_task`)는 멤버 구성이 바뀐 그룹과 그 상위(조상) 그룹만 다시 계산합니다.
+- 정책 인덱싱(`rebuild_policy_indices`)은 저장된 폐포를 조회만 하며, 폐포 행이 없는
+  그룹(마이그레이션 직후 등)만 그 자리에서 계산해 채워 넣습니다.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Literal, Optional, Set
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.services.policy_builder.member_resolver import GROUP_MARKER_PREFIX
+
+GroupKind = Literal["network", "service"]
+
+_CLOSURE_MODELS = {
+    "network": models.NetworkGroupClosure,
+    "service": models.ServiceGroupClosure,
+}
+
+# SQLite 변수 제한(SQLITE_MAX_VARIABLES)을 고려한 IN 절 청크 크기 (policy_indexer와 동일 기준)
+_SQLITE_MAX_VARIABLES = 900
+
+
+def parse_group_members(members: Optional[str]) -> List[str]:
+    """그룹의 콤마 구분 멤버 문자열을 이름 리스트로 변환합니다."""
+    return [m.strip() for m in (members or "").split(',') if m.strip()]
+
+
+def expand_group_closures(
+    group_map: Dict[str, List[str]],
+    names: Optional[Iterable[str]] = None,
+    memo: Optional[Dict[str, Set[str]]] = None,
+) -> Dict[str, Set[str]]:
+    """
+    그룹을 최하위 멤버 집합으로 펼칩니다.
+
+    - 빈 그룹은 존재 여부를 남기기 위해 '__GROUP__:이름' 마커 하나로 펼칩니다.
+    - 순환 참조는 현재 탐색 경로(path)로 감지하며, 재진입한 그룹은 이름 그대로 남깁니다.
+      경로 집합은 복사하지 않고 진입/이탈 시 추가·제거(backtracking)합니다.
+
+    Args:
+        group_map: 그룹명 → 직계 멤버명 리스트
+        names: 계산할 그룹명 (None이면 group_map 전체)
+        memo: 이미 알고 있는 그룹 폐포 (예: 저장된 폐포). 계산 결과도 여기에 채워집니다.
+
+    Returns:
+        names에 포함된 그룹(group_map에 있는 것만)의 폐포 dict
+    """
+    memo = {} if memo is None else memo
+    path: Set[str] = set()
+
+    def _expand(name: str) -> Set[str]:
+        cached = memo.get(name)
+        if cached is not None:
+            return cached
+        if name not in group_map or name in path:
+            return {name}
+
+        members = group_map[name]
+        if not members:
+            result = {f"{GROUP_MARKER_PREFIX}{name}"}
+        else:
+            path.add(name)
+            result = set()
+            for member_name in members:
+                result |= _expand(member_name)
+            path.discard(name)
+        memo[name] = result
+        return result
+
+    targets = list(group_map) if names is None else [n for n in names if n in group_map]
+    for name in targets:
+        _expand(name)
+    return {name: memo[name] for name in targets}
+
+
+def collect_affected_groups(changed: Iterable[str], *group_maps: Dict[str, List[str]]) -> Set[str]:
+    """
+    변경된 이름과, 이를 직·간접적으로 포함하는 모든 상위 그룹 이름을 반환합니다.
+
+    삭제된 그룹을 참조하던 상위 그룹도 찾을 수 있도록 변경 전/후 그룹 맵을 모두 넘겨
+    역방향 간선(멤버 → 그룹)을 합쳐서 탐색합니다.
+    """
+    parents: Dict[str, Set[str]] = defaultdict(set)
+    for group_map in group_maps:
+        for group_name, members in group_map.items():
+            for member_name in members:
+                parents[member_name].add(group_name)
+
+    affected: Set[str] = set()
+    stack = list(changed)
+    while stack:
+        name = stack.pop()
+        if name in affected:
+            continue
+        affected.add(name)
+        stack.extend(parents.get(name, ()))
+    return affected
+
+
+async def _load_rows(db: AsyncSession, device_id: int, kind: GroupKind,
+                     group_names: Optional[Iterable[str]] = None) -> Dict[str, Set[str]]:
+    """저장된 폐포 행을 그룹명 → 멤버 집합으로 읽어옵니다 (group_names 지정 시 해당 그룹만)."""
+    model = _CLOSURE_MODELS[kind]
+    closures: Dict[str, Set[str]] = defaultdict(set)
+
+    base = select(model.group_name, model.member_name).where(model.device_id == device_id)
+    if group_names is None:
+        chunks = [None]
+    else:
+        name_list = list(group_names)
+        chunks = [name_list[i:i + _SQLITE_MAX_VARIABLES] for i in range(0, len(name_list), _SQLITE_MAX_VARIABLES)]
+
+    for chunk in chunks:
+        stmt = base if chunk is None else base.where(model.group_name.in_(chunk))
+        result = await db.execute(stmt)
+        for group_name, member_name in result.all():
+            closures[group_name].add(member_name)
+    return dict(closures)
+
+
+async def _write_rows(db: AsyncSession, device_id: int, kind: GroupKind,
+                      stale_names: Iterable[str], closures: Dict[str, Set[str]]) -> None:
+    """stale_names 그룹의 기존 폐포 행을 지우고 closures 내용을 새로 삽입합니다."""
+    model = _CLOSURE_MODELS[kind]
+    stale_list = list(stale_names)
+    for i in range(0, len(stale_list), _SQLITE_MAX_VARIABLES):
+        chunk = stale_list[i:i + _SQLITE_MAX_VARIABLES]
+        await db.execute(delete(model).where(model.device_id == device_id, model.group_name.in_(chunk)))
+
+    rows = [
+        {"device_id": device_id, "group_name": group_name, "member_name": member_name}
+        for group_name, members in closures.items()
+        for member_name in members
+    ]
+    if rows:
+        await db.run_sync(lambda sync_session: sync_session.bulk_insert_mappings(model, rows))
+
+
+async def refresh_group_closures(
+    db: AsyncSession,
+    device_id: int,
+    kind: GroupKind,
+    new_group_map: Dict[str, List[str]],
+    old_group_map: Optional[Dict[str, List[str]]] = None,
+) -> Set[str]:
+    """
+    그룹 멤버 구성 변경을 폐포 테이블에 반영합니다 (커밋은 호출자 책임).
+
+    old_group_map이 주어지면 생성/삭제/멤버 변경된 그룹과 그 조상 그룹만 다시 계산하고,
+    영향받지 않은 하위 그룹은 저장된 폐포를 그대로 재사용합니다.
+    old_group_map이 None이면 장비의 폐포 전체를 다시 계산합니다.
+
+    Returns:
+        폐포가 다시 계산(또는 삭제)된 그룹명 집합
+    """
+    model = _CLOSURE_MODELS[kind]
+
+    if old_group_map is None:
+        await db.execute(delete(model).where(model.device_id == device_id))
+        closures = expand_group_closures(new_group_map)
+        await _write_rows(db, device_id, kind, [], closures)
+        return set(new_group_map)
+
+    changed = {
+        name for name in set(old_group_map) | set(new_group_map)
+        if old_group_map.get(name) != new_group_map.get(name)
+    }
+    if not changed:
+        return set()
+
+    affected = collect_affected_groups(changed, old_group_map, new_group_map)
+
+    # 영향받지 않은 직계 하위 그룹은 저장된 폐포를 memo로 사용 (재귀 재계산 생략)
+    seed_names = {
+        member_name
+        for name in affected if name in new_group_map
+        for member_name in new_group_map[name]
+        if member_name in new_group_map and member_name not in affected
+    }
+    memo = await _load_rows(db, device_id, kind, seed_names) if seed_names else {}
+
+    closures = expand_group_closures(new_group_map, names=affected, memo=memo)
+    await _write_rows(db, device_id, kind, affected, closures)
+    return affected
+
+
+async def load_group_closures(
+    db: AsyncSession,
+    device_id: int,
+    kind: GroupKind,
+    group_map: Dict[str, List[str]],
+) -> Dict[str, Set[str]]:
+    """
+    group_map에 있는 모든 그룹의 폐포를 반환합니다.
+
+    저장된 행을 우선 사용하고, 폐포 행이 없는 그룹만 계산해 테이블에 채워 넣습니다
+    (커밋은 호출자 책임).
+    """
+    stored = await _load_rows(db, device_id, kind)
+    closures = {name: stored[name] for name in group_map if name in stored}
+
+    missing = [name for name in group_map if name not in closures]
+    if missing:
+        computed = expand_group_closures(group_map, names=missing, memo=dict(closures))
+        await _write_rows(db, device_id, kind, missing, computed)
+        closures.update(computed)
+    return closures
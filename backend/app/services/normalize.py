@@ -1,6 +1,54 @@
-from ipaddress import ip_network, ip_address, IPv4Address
+from ipaddress import ip_network, ip_address, IPv4Address, IPv6Address
 from typing import Optional, Tuple
 
+# SQLite INTEGER는 부호 있는 64비트이므로, IPv6 주소(128비트)를 상/하위 64비트로 나눈 뒤
+# 각 값에서 2^63을 빼서 저장한다. 편향(bias)을 주면 부호 있는 정수 비교 순서가
+# 원래의 부호 없는 값 순서와 같아져 (hi, lo) 사전순 비교로 범위 검색이 가능하다.
+_IPV6_HALF_BIAS = 1 << 63
+_IPV6_HALF_MASK = (1 << 64) - 1
+_IPV4_MAX = (1 << 32) - 1
+
+
+def _dotted_quad_to_int(value: str) -> Optional[int]:
+    """'a.b.c.d' 표기의 IPv4 주소를 정수로 변환합니다. 다른 표기이거나 잘못된 값이면 None."""
+    parts = value.split('.')
+    if len(parts) != 4:
+        return None
+    n = 0
+    for part in parts:
+        # ipaddress와 같이 앞자리 0('010')은 허용하지 않음
+        if not (part.isascii() and part.isdigit()) or len(part) > 3 or (len(part) > 1 and part[0] == '0'):
+            return None
+        octet = int(part)
+        if octet > 255:
+            return None
+        n = (n << 8) | octet
+    return n
+
+
+def parse_ipv4_fast(value: str) -> Optional[Tuple[int, int]]:
+    """
+    흔한 IPv4 표기(단일 주소, 'a.b.c.d/길이' CIDR, 'a-b' 범위)를 ipaddress 모듈 없이 (시작, 끝) 정수로 변환합니다.
+
+    범위는 입력 순서 그대로 반환합니다. 그 밖의 표기(IPv6, 넷마스크 CIDR, 앞뒤 공백 등)나
+    잘못된 값은 None을 반환하므로, 호출자는 ipaddress로 다시 파싱해 최종 판단합니다.
+    """
+    if '-' in value:
+        a, _, b = value.partition('-')
+        start, end = _dotted_quad_to_int(a.strip()), _dotted_quad_to_int(b.strip())
+        if start is None or end is None:
+            return None
+        return start, end
+    if '/' in value:
+        addr, _, prefix = value.partition('/')
+        n = _dotted_quad_to_int(addr)
+        if n is None or not (prefix.isascii() and prefix.isdigit()) or len(prefix) > 2 or int(prefix) > 32:
+            return None
+        host_mask = _IPV4_MAX >> int(prefix)
+        return n & ~host_mask & _IPV4_MAX, n | host_mask
+    n = _dotted_quad_to_int(value)
+    return None if n is None else (n, n)
+
 
 def parse_ipv4_numeric(value: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
     """Return (version, start, end) for IPv4; FQDN/IPv6/invalid -> (None, None, None)."""
@@ -11,6 +59,9 @@ def parse_ipv4_numeric(value: str) -> Tuple[Optional[int], Optional[int], Option
         return (4, 0, (2**32) - 1)
     if any(c.isalpha() for c in v):  # fqdn
         return (None, None, None)
+    fast = parse_ipv4_fast(v)
+    if fast is not None:
+        return (4, *fast)
     try:
         if '-' in v:
             a, b = v.split('-', 1)
@@ -32,6 +83,44 @@ def parse_ipv4_numeric(value: str) -> Tuple[Optional[int], Optional[int], Option
     return (None, None, None)
 
 
+def parse_ipv6_numeric(value: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Return (6, start, end) for IPv6 single/cidr/range; IPv4/FQDN/invalid -> (None, None, None)."""
+    if not value:
+        return (None, None, None)
+    v = value.strip()
+    if ':' not in v:
+        return (None, None, None)
+    try:
+        if '-' in v:
+            a, b = v.split('-', 1)
+            ia, ib = ip_address(a.strip()), ip_address(b.strip())
+            if isinstance(ia, IPv6Address) and isinstance(ib, IPv6Address):
+                return (6, min(int(ia), int(ib)), max(int(ia), int(ib)))
+            return (None, None, None)
+        if '/' in v:
+            net = ip_network(v, strict=False)
+            if isinstance(net.network_address, IPv6Address):
+                return (6, int(net.network_address), int(net.broadcast_address))
+            return (None, None, None)
+        ip = ip_address(v)
+        if isinstance(ip, IPv6Address):
+            n = int(ip)
+            return (6, n, n)
+    except Exception:
+        return (None, None, None)
+    return (None, None, None)
+
+
+def split_ipv6_numeric(value: int) -> Tuple[int, int]:
+    """128비트 IPv6 정수를 정렬 순서가 보존되는 (hi, lo) 부호 있는 64비트 정수 쌍으로 나눕니다."""
+    return (value >> 64) - _IPV6_HALF_BIAS, (value & _IPV6_HALF_MASK) - _IPV6_HALF_BIAS
+
+
+def join_ipv6_numeric(hi: int, lo: int) -> int:
+    """split_ipv6_numeric으로 나눈 (hi, lo) 쌍을 128비트 IPv6 정수로 되돌립니다."""
+    return ((hi + _IPV6_HALF_BIAS) << 64) | (lo + _IPV6_HALF_BIAS)
+
+
 def parse_port_numeric(value: str) -> Tuple[Optional[int], Optional[int]]:
     if not value:
         return (None, None)
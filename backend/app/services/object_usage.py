@@ -0,0 +1,188 @@
+"""
+객체 사용 횟수(`object_usage_counts`)를 집계·갱신하는 모듈.
+
+정책 필드의 이름 토큰(`policy_tokens`)과 그룹 멤버 구성으로 이름별 참조 횟수를 계산합니다.
+
+- 직접 참조(policy_count): 정책 필드에 이름이 나열된 횟수
+- 그룹 경유(group_policy_count): 이름을 중첩 포함 멤버로 가진 그룹을 참조하는 정책 수
+
+그룹을 참조하는 정책이 바뀌면 그 그룹의 하위 멤버 전체의 그룹 경유 횟수가 바뀌므로,
+갱신 대상 이름에는 항상 하위 멤버(중간 그룹 포함)를 함께 넣어 다시 계산합니다.
+갱신 시점은 다음과 같습니다 (커밋은 모두 호출자 책임).
+
+- 정책 인덱싱(`rebuild_policy_indices`): 재인덱싱된 정책의 이전/현재 토큰
+- 정책 삭제(`sync_data_task`): 삭제된 정책의 토큰
+- 그룹 동기화(`sync_data_task`): 멤버 구성이 바뀐 그룹과 그 상위 그룹
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Literal, Optional, Set
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.services.group_closure import parse_group_members
+
+UsageKind = Literal["network", "service"]
+
+# 그룹 종류별 (사용 횟수 member_type, 참조 정책 필드, 그룹 모델)
+_KIND_CONFIG = {
+    "network": ("address", ("source", "destination"), models.NetworkGroup),
+    "service": ("service", ("service",), models.ServiceGroup),
+}
+
+# 정책 필드 → 그룹 종류
+FIELD_USAGE_KIND: Dict[str, UsageKind] = {
+    field: kind for kind, (_, fields, _) in _KIND_CONFIG.items() for field in fields
+}
+
+# SQLite 변수 제한(SQLITE_MAX_VARIABLES)을 고려한 IN 절 청크 크기 (policy_indexer와 동일 기준)
+_SQLITE_MAX_VARIABLES = 900
+_FULL_SCAN_NAMES = _SQLITE_MAX_VARIABLES * 2
+
+
+def _chunks(values: List[str]) -> Iterable[List[str]]:
+    for i in range(0, len(values), _SQLITE_MAX_VARIABLES):
+        yield values[i:i + _SQLITE_MAX_VARIABLES]
+
+
+def collect_descendants(names: Iterable[str], *group_maps: Dict[str, List[str]]) -> Set[str]:
+    """이름과, 그룹인 경우 그 하위 멤버(중간 그룹 포함)를 모두 반환합니다 (여러 그룹 맵의 간선을 합쳐 탐색)."""
+    result: Set[str] = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name in result:
+            continue
+        result.add(name)
+        for group_map in group_maps:
+            stack.extend(group_map.get(name, ()))
+    return result
+
+
+def _ancestor_resolver(group_map: Dict[str, List[str]]):
+    """이름 → 이름을 (중첩 포함) 멤버로 가진 모든 그룹 집합을 반환하는 함수를 만듭니다 (결과 memo)."""
+    parents: Dict[str, Set[str]] = defaultdict(set)
+    for group_name, members in group_map.items():
+        for member_name in members:
+            parents[member_name].add(group_name)
+    memo: Dict[str, Set[str]] = {}
+
+    def ancestors(name: str) -> Set[str]:
+        cached = memo.get(name)
+        if cached is not None:
+            return cached
+        found: Set[str] = set()
+        stack = list(parents.get(name, ()))
+        while stack:
+            parent = stack.pop()
+            if parent in found:
+                continue
+            found.add(parent)
+            stack.extend(parents.get(parent, ()))
+        # 순환 그룹은 자기 자신을 조상으로 보지 않음
+        found.discard(name)
+        memo[name] = found
+        return found
+
+    return ancestors
+
+
+async def _load_group_map(db: AsyncSession, device_id: int, kind: UsageKind) -> Dict[str, List[str]]:
+    group_model = _KIND_CONFIG[kind][2]
+    result = await db.execute(
+        select(group_model.name, group_model.members).where(group_model.device_id == device_id)
+    )
+    return {name: parse_group_members(members) for name, members in result.all()}
+
+
+async def _load_token_refs(
+    db: AsyncSession, device_id: int, fields: Iterable[str], names: Optional[Set[str]],
+) -> Dict[str, List[int]]:
+    """이름 → 참조 정책 ID 목록 (필드 내 나열 횟수만큼 중복 포함). names가 None이면 장비 전체."""
+    token = models.PolicyToken
+    base = select(token.token, token.policy_id).where(token.device_id == device_id, token.field.in_(tuple(fields)))
+    refs: Dict[str, List[int]] = defaultdict(list)
+    # 이름이 많으면 청크별 인덱스 조회보다 장비 전체를 한 번 읽고 거르는 편이 빠름
+    if names is None or len(names) > _FULL_SCAN_NAMES:
+        statements = [base]
+    else:
+        statements = [base.where(token.token.collate("NOCASE").in_(chunk)) for chunk in _chunks(list(names))]
+    for stmt in statements:
+        result = await db.execute(stmt)
+        for name, policy_id in result.all():
+            # NOCASE 인덱스로 찾은 뒤 객체 이름은 대소문자를 구분해 다시 비교
+            if names is None or name in names:
+                refs[name].append(policy_id)
+    return refs
+
+
+async def refresh_object_usage(
+    db: AsyncSession,
+    device_id: int,
+    kind: UsageKind,
+    names: Optional[Iterable[str]] = None,
+    old_group_map: Optional[Dict[str, List[str]]] = None,
+) -> int:
+    """
+    이름들의 사용 횟수를 현재 정책 토큰과 그룹 구성으로 다시 계산해 저장합니다 (커밋은 호출자 책임).
+
+    names의 하위 멤버도 함께 갱신하며, old_group_map이 주어지면 이전 구성에서의 하위 멤버
+    (그룹에서 빠진 멤버)도 포함합니다. names가 None이면 장비의 해당 종류 전체를 다시 계산합니다.
+
+    Returns:
+        다시 계산한 이름 수
+    """
+    member_type, fields, _ = _KIND_CONFIG[kind]
+    usage = models.ObjectUsageCount
+    group_map = await _load_group_map(db, device_id, kind)
+    ancestors = _ancestor_resolver(group_map)
+
+    if names is None:
+        refs = await _load_token_refs(db, device_id, fields, None)
+        targets = collect_descendants(refs, group_map)
+        await db.execute(delete(usage).where(usage.device_id == device_id, usage.member_type == member_type))
+    else:
+        maps = (group_map,) if old_group_map is None else (group_map, old_group_map)
+        targets = collect_descendants(names, *maps)
+        if not targets:
+            return 0
+        lookup = set(targets)
+        for name in targets:
+            lookup |= ancestors(name)
+        refs = await _load_token_refs(db, device_id, fields, lookup)
+        for chunk in _chunks(list(targets)):
+            await db.execute(
+                delete(usage).where(
+                    usage.device_id == device_id, usage.member_type == member_type, usage.name.in_(chunk)
+                )
+            )
+
+    rows = []
+    for name in targets:
+        via_group: Set[int] = set()
+        for group_name in ancestors(name):
+            via_group.update(refs.get(group_name, ()))
+        direct = len(refs.get(name, ()))
+        if direct or via_group:
+            rows.append({
+                "device_id": device_id, "member_type": member_type, "name": name,
+                "policy_count": direct, "group_policy_count": len(via_group),
+            })
+    if rows:
+        await db.run_sync(lambda sync_session: sync_session.bulk_insert_mappings(usage, rows))
+    return len(targets)
+
+
+async def refresh_usage_for_tokens(db: AsyncSession, device_id: int, token_rows: Iterable) -> None:
+    """(field, token) 쌍들이 가리키는 이름의 사용 횟수를 종류별로 갱신합니다 (커밋은 호출자 책임)."""
+    names_by_kind: Dict[str, Set[str]] = defaultdict(set)
+    for field, name in token_rows:
+        kind = FIELD_USAGE_KIND.get(field)
+        if kind:
+            names_by_kind[kind].add(name)
+    for kind, names in names_by_kind.items():
+        await refresh_object_usage(db, device_id, kind, names)
+
@@ -4,67 +4,56 @@
 `policy_builder`의 가상 정책 삽입 분석이 공유합니다.
 """
 
-from ipaddress import ip_network, ip_address, IPv4Address, IPv4Network
+from ipaddress import ip_network, ip_address
 from typing import Dict, List, Optional, Set, Tuple
 
-from app.services.normalize import parse_port_numeric
+from app.services.normalize import parse_ipv4_fast, parse_port_numeric, split_ipv6_numeric
+from app.services.predefined_services import ANY_SERVICE, APPLICATION_DEFAULT
 
 GROUP_MARKER_PREFIX = "__GROUP__:"
+# 포트가 없는 프로토콜 서비스 객체(ICMP 등)의 해소 값 (뒤에 소문자 프로토콜 이름)
+PROTOCOL_MARKER_PREFIX = "__PROTOCOL__:"
 
+# bulk insert 시 행마다 키 구성이 같아야 한 번의 executemany로 묶이므로 IPv6 컬럼을 항상 채운다
+_NO_IPV6_RANGE = {"ip6_start_hi": None, "ip6_start_lo": None, "ip6_end_hi": None, "ip6_end_lo": None}
 
-def _ip_str_to_numeric_range(ip_str: str) -> Optional[Tuple[int, int]]:
+
+def _ip_str_to_numeric_range(ip_str: str) -> Optional[Tuple[int, int, int]]:
     """
-    단일 IP, CIDR 또는 범위 문자열을 숫자형 시작-끝 튜플로 변환합니다.
+    단일 IP, CIDR 또는 범위 문자열을 (버전, 시작, 끝) 숫자형 튜플로 변환합니다.
 
     Args:
-        ip_str: 변환할 IP 문자열 (예: '1.1.1.1', '1.1.1.0/24', '1.1.1.1-1.1.1.5')
+        ip_str: 변환할 IP 문자열 (예: '1.1.1.1', '1.1.1.0/24', '1.1.1.1-1.1.1.5', '2001:db8::/32')
 
     Returns:
-        (시작_IP_숫자, 끝_IP_숫자) 형태의 튜플, 변환 실패 시 None
+        (IP_버전, 시작_IP_숫자, 끝_IP_숫자) 형태의 튜플, 변환 실패 또는 v4/v6 혼합 범위면 None
     """
+    # 흔한 IPv4 표기는 ipaddress 객체를 만들지 않고 직접 변환
+    fast = parse_ipv4_fast(ip_str)
+    if fast is not None:
+        start, end = fast
+        return 4, min(start, end), max(start, end)
     try:
         if '-' in ip_str:
             start_str, end_str = ip_str.split('-', 1)
             start_addr = ip_address(start_str.strip())
             end_addr = ip_address(end_str.strip())
-            if not (isinstance(start_addr, IPv4Address) and isinstance(end_addr, IPv4Address)):
+            if start_addr.version != end_addr.version:
                 return None
-            return min(int(start_addr), int(end_addr)), max(int(start_addr), int(end_addr))
+            return start_addr.version, min(int(start_addr), int(end_addr)), max(int(start_addr), int(end_addr))
         elif '/' in ip_str:
             net = ip_network(ip_str, strict=False)
-            if not isinstance(net, IPv4Network):
-                return None
-            return int(net.network_address), int(net.broadcast_address)
+            return net.version, int(net.network_address), int(net.broadcast_address)
         else:
             addr = ip_address(ip_str.strip())
-            if not isinstance(addr, IPv4Address):
-                return None
             n = int(addr)
-            return n, n
+            return addr.version, n, n
     except ValueError:
         return None
 
 
-def merge_ip_ranges(ip_strings: Set[str]) -> List[Tuple[int, int]]:
-    """
-    IP 관련 문자열 집합을 최소한의 연속된 숫자 범위 리스트로 병합합니다.
-    이 알고리즘은 중복되거나 인접한 IP 범위를 하나로 합쳐 인덱스 크기를 줄입니다.
-
-    Args:
-        ip_strings: IP 주소, CIDR, 범위 문자열 집합
-
-    Returns:
-        병합된 (시작_IP_숫자, 끝_IP_숫자) 튜플의 리스트
-    """
-    if not ip_strings:
-        return []
-
-    ranges = []
-    for s in ip_strings:
-        r = _ip_str_to_numeric_range(s)
-        if r:
-            ranges.append(r)
-
+def merge_numeric_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """정렬 후 중복되거나 인접한 (시작, 끝) 범위를 하나로 합칩니다."""
     if not ranges:
         return []
 
@@ -86,6 +75,50 @@ def merge_ip_ranges(ip_strings: Set[str]) -> List[Tuple[int, int]]:
     return merged
 
 
+def merge_ip_ranges_by_version(
+    ip_strings: Set[str],
+    ip_cache: Optional[Dict[str, Optional[Tuple[int, int, int]]]] = None,
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    IP 관련 문자열 집합을 IPv4/IPv6 별로 최소한의 연속된 숫자 범위 리스트로 병합합니다.
+    두 주소 체계의 정수 값은 서로 겹치므로 반드시 따로 병합합니다.
+
+    Args:
+        ip_cache: 문자열 → 파싱 결과 캐시(선택). 같은 객체 값을 여러 정책에서 다시 파싱하지 않습니다.
+
+    Returns:
+        (병합된_IPv4_범위_리스트, 병합된_IPv6_범위_리스트)
+    """
+    v4_ranges: List[Tuple[int, int]] = []
+    v6_ranges: List[Tuple[int, int]] = []
+    for s in ip_strings or ():
+        if ip_cache is None:
+            r = _ip_str_to_numeric_range(s)
+        elif s in ip_cache:
+            r = ip_cache[s]
+        else:
+            r = ip_cache[s] = _ip_str_to_numeric_range(s)
+        if r is None:
+            continue
+        version, start, end = r
+        (v4_ranges if version == 4 else v6_ranges).append((start, end))
+    return merge_numeric_ranges(v4_ranges), merge_numeric_ranges(v6_ranges)
+
+
+def merge_ip_ranges(ip_strings: Set[str]) -> List[Tuple[int, int]]:
+    """
+    IP 관련 문자열 집합을 최소한의 연속된 숫자 범위 리스트로 병합합니다 (IPv4만).
+    이 알고리즘은 중복되거나 인접한 IP 범위를 하나로 합쳐 인덱스 크기를 줄입니다.
+
+    Args:
+        ip_strings: IP 주소, CIDR, 범위 문자열 집합
+
+    Returns:
+        병합된 (시작_IP_숫자, 끝_IP_숫자) 튜플의 리스트
+    """
+    return merge_ip_ranges_by_version(ip_strings)[0]
+
+
 def compute_policy_member_rows(
     source: str,
     destination: str,
@@ -93,6 +126,7 @@ def compute_policy_member_rows(
     resolved_address_map: Dict[str, Set[str]],
     resolved_service_map: Dict[str, Set[str]],
     port_cache: Optional[Dict[str, Tuple[Optional[int], Optional[int]]]] = None,
+    ip_cache: Optional[Dict[str, Optional[Tuple[int, int, int]]]] = None,
 ) -> Tuple[List[dict], List[dict]]:
     """
     정책 1건의 source/destination/service 문자열을 주소/서비스 멤버 행으로 변환합니다.
@@ -103,9 +137,12 @@ def compute_policy_member_rows(
     Args:
         port_cache: 여러 정책에 걸쳐 포트 파싱 결과를 재사용하기 위한 캐시(선택).
                     넘기지 않으면 이 호출 범위에서만 쓰이는 캐시를 새로 만듭니다.
+        ip_cache: 여러 정책에 걸쳐 IP 문자열 파싱 결과를 재사용하기 위한 캐시(선택, port_cache와 같은 방식).
     """
     if port_cache is None:
         port_cache = {}
+    if ip_cache is None:
+        ip_cache = {}
 
     src_members: Set[str] = set()
     for name in [s.strip() for s in (source or "").split(',') if s.strip()]:
@@ -126,12 +163,25 @@ def compute_policy_member_rows(
         ip_members = {m for m in members if not m.startswith(GROUP_MARKER_PREFIX)}
         group_markers = {m for m in members if m.startswith(GROUP_MARKER_PREFIX)}
 
-        merged_ranges = merge_ip_ranges(ip_members)
-        for start_ip, end_ip in merged_ranges:
+        v4_ranges, v6_ranges = merge_ip_ranges_by_version(ip_members, ip_cache)
+        for start_ip, end_ip in v4_ranges:
             addr_rows.append({
                 "direction": direction,
                 "token_type": 'ipv4_range',
                 "ip_start": start_ip, "ip_end": end_ip,
+                **_NO_IPV6_RANGE,
+            })
+
+        # IPv6는 128비트라 ip_start/ip_end(BigInteger)에 담을 수 없으므로 상/하위 64비트 컬럼에 저장
+        for start_ip, end_ip in v6_ranges:
+            start_hi, start_lo = split_ipv6_numeric(start_ip)
+            end_hi, end_lo = split_ipv6_numeric(end_ip)
+            addr_rows.append({
+                "direction": direction,
+                "token_type": 'ipv6_range',
+                "ip_start": None, "ip_end": None,
+                "ip6_start_hi": start_hi, "ip6_start_lo": start_lo,
+                "ip6_end_hi": end_hi, "ip6_end_lo": end_lo,
             })
 
         for marker in group_markers:
@@ -141,6 +191,7 @@ def compute_policy_member_rows(
                 "token": group_name,
                 "token_type": 'unknown',
                 "ip_start": None, "ip_end": None,
+                **_NO_IPV6_RANGE,
             })
 
     for token in filter(None, svc_members):
@@ -152,12 +203,30 @@ def compute_policy_member_rows(
                 "protocol": None, "port_start": None, "port_end": None,
             })
             continue
+        if token.startswith(PROTOCOL_MARKER_PREFIX):
+            # 프로토콜 전체를 뜻하지만 포트 범위가 없으므로 포트 NULL 센티넬 행으로 저장
+            # (0-65535로 저장하면 포트 기반 서비스와 같은 크기·포함 관계로 취급됨)
+            protocol = token.replace(PROTOCOL_MARKER_PREFIX, "", 1)
+            svc_rows.append({
+                "token": protocol,
+                "token_type": 'protocol',
+                "protocol": protocol, "port_start": None, "port_end": None,
+            })
+            continue
 
         token_lower = token.lower()
+        if token_lower == APPLICATION_DEFAULT:
+            # 포트 범위가 없는 예약어는 protocol 컬럼에 예약어를 담은 센티넬 행으로 저장
+            svc_rows.append({
+                "token": token,
+                "token_type": 'application_default',
+                "protocol": APPLICATION_DEFAULT, "port_start": None, "port_end": None,
+            })
+            continue
         if '/' in token_lower:
             proto, port_str = token_lower.split('/', 1)
         else:
-            proto, port_str = ('any' if token_lower == 'any' else None), token_lower
+            proto, port_str = (ANY_SERVICE if token_lower == ANY_SERVICE else None), token_lower
 
         if port_str in port_cache:
             start, end = port_cache[port_str]
@@ -170,7 +239,7 @@ def compute_policy_member_rows(
 
         svc_rows.append({
             "token": token,
-            "token_type": 'proto_port',
+            "token_type": ANY_SERVICE if token_lower == ANY_SERVICE else 'proto_port',
             "protocol": proto, "port_start": start, "port_end": end,
         })
 
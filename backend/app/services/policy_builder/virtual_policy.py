@@ -14,6 +14,7 @@ from app import crud
 from app.schemas.policy_builder import NewObjectSpec, NewPolicyRow
 from app.services.policy_builder.member_resolver import compute_policy_member_rows
 from app.services.policy_indexer import Resolver
+from app.services.predefined_services import predefined_service_values
 
 
 @dataclass
@@ -97,18 +98,21 @@ async def resolve_virtual_policies(
         elif obj.object_kind == "service" and obj.protocol and obj.port:
             services.append(SimpleNamespace(name=obj.name, protocol=obj.protocol, port=obj.port))
 
+    device = await crud.device.get_device(db, device_id=device_id)
     resolver = Resolver()
     resolved_address_map, resolved_service_map = resolver.pre_resolve_objects(
-        network_objs, network_grps, services, service_grps
+        network_objs, network_grps, services, service_grps,
+        predefined_services=predefined_service_values(device.vendor if device else None),
     )
 
     port_cache: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    ip_cache: Dict[str, Optional[Tuple[int, int, int]]] = {}
     virtual_policies: List[VirtualPolicy] = []
 
     for row in new_policies:
         addr_rows, svc_rows = compute_policy_member_rows(
             row.source, row.destination, row.service,
-            resolved_address_map, resolved_service_map, port_cache,
+            resolved_address_map, resolved_service_map, port_cache, ip_cache,
         )
         address_members = [
             VirtualAddressMember(
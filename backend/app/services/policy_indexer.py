@@ -1,9 +1,22 @@
 import asyncio
-from typing import Iterable, Dict, Set, List, Tuple, Optional
+import logging
+import time
+from itertools import islice
+from typing import AsyncIterator, Iterable, Dict, Set, List, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, update
+from sqlalchemy.future import select
 from app import crud, models
-from app.services.policy_builder.member_resolver import compute_policy_member_rows
+from app.services.policy_builder.member_resolver import PROTOCOL_MARKER_PREFIX, compute_policy_member_rows
+from app.services.group_closure import (
+    GroupKind,
+    collect_affected_groups,
+    expand_group_closures,
+    load_group_closures,
+    parse_group_members,
+)
+from app.services.object_usage import refresh_usage_for_tokens
+from app.services.predefined_services import predefined_service_values
 
 # --- 최적화된 리졸버 (Resolver) ---
 
@@ -18,91 +31,62 @@ class Resolver:
         self._net_group_closure_cache: Dict[str, Set[str]] = {}
         self._svc_group_closure_cache: Dict[str, Set[str]] = {}
 
-    def _expand_groups(
-        self,
-        name: str,
-        group_map: Dict[str, List[str]],
-        closure_cache: Dict[str, Set[str]],
-        visited: Optional[Set[str]] = None
-    ) -> Set[str]:
-        """
-        그룹 멤버를 재귀적으로 확장합니다.
-        
-        복잡한 중첩 그룹을 단일 객체 리스트로 풀어서 반환하며, 
-        순환 참조(Circular Dependency)를 방지하는 로직이 포함되어 있습니다.
-        """
-        # 이미 계산된 결과가 캐시에 있으면 즉시 반환
-        if name in closure_cache:
-            return closure_cache[name]
-
-        # 순환 참조 보호 로직: 현재 탐색 경로에 이미 존재하는 이름이면 중단
-        if visited is None:
-            visited = set()
-        if name in visited:
-            return {name}
-        visited.add(name)
-
-        # 해당 이름이 그룹 맵에 존재하는지 확인
-        if name in group_map:
-            members = group_map[name]
-            # 빈 그룹인 경우 특수 마커를 반환하여 존재 여부 기록
-            if not members:
-                closure_cache[name] = {f"__GROUP__:{name}"}
-                return {f"__GROUP__:{name}"}
-            
-            # 모든 멤버를 재귀적으로 확장하여 합집합(Set) 생성
-            expanded_members: Set[str] = set()
-            for member_name in members:
-                expanded_members.update(self._expand_groups(member_name, group_map, closure_cache, visited.copy()))
-            
-            # 결과 캐싱 후 반환
-            closure_cache[name] = expanded_members
-            return expanded_members
-        else:
-            # 그룹이 아닌 기본 객체인 경우 자기 자신을 반환
-            closure_cache[name] = {name}
-            return {name}
-
     def pre_resolve_objects(
         self,
         network_objects: Iterable[models.NetworkObject],
         network_groups: Iterable[models.NetworkGroup],
         service_objects: Iterable[models.Service],
-        service_groups: Iterable[models.ServiceGroup]
+        service_groups: Iterable[models.ServiceGroup],
+        net_group_closures: Optional[Dict[str, Set[str]]] = None,
+        svc_group_closures: Optional[Dict[str, Set[str]]] = None,
+        predefined_services: Optional[Dict[str, Set[str]]] = None,
     ) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
         """
         모든 네트워크 및 서비스 객체를 사전 분석하여 최종 값(IP/Port) 맵을 생성합니다.
-        
+
+        net_group_closures / svc_group_closures에 저장된 그룹 폐포를 넘기면 그룹 확장(DFS)을
+        생략하고 그대로 사용합니다. 넘기지 않으면 이 자리에서 계산합니다.
+        predefined_services(벤더 기본 제공 서비스 이름 → 값)는 같은 이름의 서비스 객체가 없을 때만 쓰입니다.
+
         Returns:
             (최종_주소_맵, 최종_서비스_맵) 튜플
         """
         # 1. SQLAlchemy 객체로부터 기본 값 맵과 그룹 맵 생성
         net_value_map = {o.name: {o.ip_address} for o in network_objects}
-        net_group_map = {g.name: [m.strip() for m in (g.members or "").split(',') if m.strip()] for g in network_groups}
+        net_group_map = {g.name: parse_group_members(g.members) for g in network_groups}
 
-        svc_value_map = {}
+        svc_value_map = dict(predefined_services or {})
         for s in service_objects:
             proto, port = str(s.protocol or "").lower(), str(s.port or "").replace(" ", "")
             if port and port != "none":
                 svc_value_map[s.name] = {f"{proto}/{p.strip()}" for p in port.split(',')}
+            elif proto and proto not in ("none", "tcp", "udp"):
+                # 포트가 없는 프로토콜 서비스(ICMP 등)는 포트 없는 프로토콜 센티넬로 해소
+                svc_value_map[s.name] = {f"{PROTOCOL_MARKER_PREFIX}{proto}"}
+
+        svc_group_map = {g.name: parse_group_members(g.members) for g in service_groups}
 
-        svc_group_map = {g.name: [m.strip() for m in (g.members or "").split(',') if m.strip()] for g in service_groups}
+        # 2. 그룹 폐포 확보 (저장된 폐포가 없으면 재귀 확장)
+        if net_group_closures is None:
+            net_group_closures = expand_group_closures(net_group_map, memo=self._net_group_closure_cache)
+        if svc_group_closures is None:
+            svc_group_closures = expand_group_closures(svc_group_map, memo=self._svc_group_closure_cache)
 
-        # 2. 모든 주소 그룹 분석 (재귀적 확장 적용)
+        # 3. 모든 주소 이름을 최종 값으로 변환
         resolved_address_map: Dict[str, Set[str]] = {}
         all_address_names = set(net_value_map.keys()) | set(net_group_map.keys())
         for name in all_address_names:
-            expanded_group_names = self._expand_groups(name, net_group_map, self._net_group_closure_cache)
+            expanded_group_names = net_group_closures.get(name, {name})
             final_values: Set[str] = set()
             for n in expanded_group_names:
                 final_values.update(net_value_map.get(n, {n}))
             resolved_address_map[name] = final_values
 
-        # 3. 모든 서비스 그룹 분석 (재귀적 확장 적용)
+        # 4. 모든 서비스 이름을 최종 값으로 변환
         resolved_service_map: Dict[str, Set[str]] = {}
         all_service_names = set(svc_value_map.keys()) | set(svc_group_map.keys())
         for name in all_service_names:
-            expanded_group_names = self._expand_groups(name, svc_group_map, self._svc_group_closure_cache)
+            expanded_group_names = svc_group_closures.get(name, {name})
             final_values: Set[str] = set()
             for n in expanded_group_names:
                 final_values.update(svc_value_map.get(n, {n}))
@@ -111,69 +95,285 @@ class Resolver:
         return resolved_address_map, resolved_service_map
 
 
+# 한 번에 분석·삽입하는 정책 수. 멤버 행은 이 단위로만 메모리에 올라가므로 전체 정책 수와 무관하게
+# 메모리 사용량이 일정합니다.
+INDEX_CHUNK_SIZE = 1000
+
+
+async def _iter_policy_chunks(
+    db: AsyncSession,
+    device_id: int,
+    policies: Optional[Iterable[models.Policy]],
+    only_unindexed: bool,
+) -> AsyncIterator[List[models.Policy]]:
+    """정책을 INDEX_CHUNK_SIZE 단위로 나눠 반환합니다. policies가 None이면 DB에서 ID 순으로 페이지 단위 조회합니다."""
+    if policies is not None:
+        iterator = iter(policies)
+        while chunk := list(islice(iterator, INDEX_CHUNK_SIZE)):
+            yield chunk
+        return
+
+    last_id = 0
+    while True:
+        stmt = (
+            select(models.Policy)
+            .where(models.Policy.device_id == device_id, models.Policy.id > last_id)
+            .order_by(models.Policy.id)
+            .limit(INDEX_CHUNK_SIZE)
+        )
+        if only_unindexed:
+            stmt = stmt.where(models.Policy.is_indexed == False)
+        chunk = (await db.execute(stmt)).scalars().all()
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+async def _clear_staging(db: AsyncSession, device_id: int) -> None:
+    """장비의 스테이징 행을 모두 지웁니다."""
+    for _, staging in models.POLICY_INDEX_STAGING_TABLES:
+        await db.execute(delete(staging).where(staging.c.device_id == device_id))
+    staging_ids = models.policy_index_staging_ids
+    await db.execute(delete(staging_ids).where(staging_ids.c.device_id == device_id))
+
+
+async def _swap_staged_indices(db: AsyncSession, device_id: int) -> None:
+    """
+    스테이징된 인덱스 행으로 본 인덱스의 해당 정책 행을 교체합니다 (커밋은 호출자 책임).
+
+    교체 대상 정책의 기존 행 삭제, 스테이징 행 INSERT … SELECT, 인덱싱 완료 표시, 사용 횟수 갱신,
+    스테이징 정리를 한 트랜잭션에서 수행합니다.
+    """
+    staging_ids = models.policy_index_staging_ids
+    staged_policy_ids = select(staging_ids.c.policy_id).where(staging_ids.c.device_id == device_id)
+
+    # 쓰기 잠금을 먼저 잡아 교체 도중 다른 쓰기와 스냅샷이 어긋나지 않도록 버전 증가부터 수행
+    # (인덱스 변경과 함께 커밋되어 검색 결과 캐시도 무효화됨)
+    await crud.device.bump_data_version(db, device_id)
+
+    # 사용 횟수 갱신 대상: 교체되는 정책의 이전 토큰 + 새 토큰
+    token, staged_token = models.PolicyToken.__table__, models.policy_tokens_staging
+    old_tokens = await db.execute(
+        select(token.c.field, token.c.token).distinct().where(token.c.policy_id.in_(staged_policy_ids))
+    )
+    new_tokens = await db.execute(
+        select(staged_token.c.field, staged_token.c.token).distinct().where(staged_token.c.device_id == device_id)
+    )
+    touched_tokens = set(old_tokens.all()) | set(new_tokens.all())
+
+    for table, staging in models.POLICY_INDEX_STAGING_TABLES:
+        await db.execute(delete(table).where(table.c.policy_id.in_(staged_policy_ids)))
+        columns = [c.name for c in staging.columns]
+        await db.execute(
+            insert(table).from_select(columns, select(staging).where(staging.c.device_id == device_id))
+        )
+    await db.execute(
+        update(models.Policy).where(models.Policy.id.in_(staged_policy_ids)).values(is_indexed=True)
+    )
+    await _clear_staging(db, device_id)
+    await refresh_usage_for_tokens(db, device_id, touched_tokens)
+
+
+# 장비별 인덱스 재구축 잠금 — 스테이징 행은 장비 단위로 공유되므로 같은 장비의 재구축
+# (동기화 후 재인덱싱, 수동 parse-index 등)이 겹치면 서로의 스테이징 행을 지우거나 섞어 교체하게 됨
+_device_rebuild_locks: Dict[int, asyncio.Lock] = {}
+
+
+def _get_device_rebuild_lock(device_id: int) -> asyncio.Lock:
+    return _device_rebuild_locks.setdefault(device_id, asyncio.Lock())
+
+
 async def rebuild_policy_indices(
     db: AsyncSession,
     device_id: int,
-    policies: Iterable[models.Policy],
-) -> None:
+    policies: Optional[Iterable[models.Policy]] = None,
+    only_unindexed: bool = False,
+) -> int:
     """
-    메모리 내에서 최적화된 방식으로 정책 인덱스를 재구축합니다.
-    
+    정책 인덱스(주소/서비스 멤버, 이름 토큰)를 재구축하고 정책을 인덱싱 완료로 표시합니다.
+
     이 함수는 정책의 소스, 목적지, 서비스를 분석하여 검색 가능한 인덱스 테이블로 변환합니다.
-    객체 그룹 확장, IP 범위 병합, 대량 삽입(Bulk Insert) 과정을 거칩니다.
+    객체 그룹 확장, IP 범위 병합 후 정책 INDEX_CHUNK_SIZE건 단위로 새 행을 스테이징 테이블에
+    삽입(executemany)·커밋하므로, 멤버 행 전체를 메모리에 모으지 않고 쓰기 잠금도 청크 동안만
+    잡습니다. 마지막에 본 인덱스를 한 번에 교체하고 커밋합니다(`_swap_staged_indices`).
+    재구축 중 검색은 이전 인덱스 전체를 그대로 봅니다.
+
+    같은 장비의 재구축은 장비별 잠금으로 직렬화됩니다 (스테이징 정리부터 교체 커밋까지).
+    스테이징 단계에서 세션을 커밋하므로 호출 전 세션에 미커밋 변경이 없어야 하며,
+    중간에 실패하면 이미 커밋된 스테이징 행만 남고 본 인덱스는 바뀌지 않습니다
+    (남은 행은 다음 재구축 시작 시 정리).
+
+    Args:
+        policies: 재인덱싱할 정책. None이면 장비 정책을 DB에서 페이지 단위로 읽습니다.
+        only_unindexed: policies가 None일 때 인덱싱되지 않은 정책(is_indexed = False)만 대상으로 합니다.
+
+    Returns:
+        재인덱싱한 정책 수
     """
-    policy_list = list(policies)
-    if not policy_list:
-        return
+    async with _get_device_rebuild_lock(device_id):
+        return await _rebuild_policy_indices_locked(db, device_id, policies, only_unindexed)
+
+
+async def _rebuild_policy_indices_locked(
+    db: AsyncSession,
+    device_id: int,
+    policies: Optional[Iterable[models.Policy]],
+    only_unindexed: bool,
+) -> int:
+    chunks = _iter_policy_chunks(db, device_id, policies, only_unindexed)
+    first_chunk = await anext(chunks, None)
+    if not first_chunk:
+        return 0
+
+    started = time.perf_counter()
 
     # 1. DB에서 필요한 모든 데이터를 한 번에 로드 (N+1 문제 방지)
+    device = await crud.device.get_device(db, device_id=device_id)
     network_objs = await crud.network_object.get_network_objects_by_device(db, device_id=device_id)
     network_grps = await crud.network_group.get_network_groups_by_device(db, device_id=device_id)
     services = await crud.service.get_services_by_device(db, device_id=device_id)
     service_grps = await crud.service_group.get_service_groups_by_device(db, device_id=device_id)
 
-    # 2. 객체 리졸버를 사용하여 모든 그룹과 멤버 사전 분석
+    # 2. 저장된 그룹 폐포를 조회 (누락 그룹만 계산해 채움) 후 리졸버로 최종 값 맵 생성
+    net_group_closures = await load_group_closures(
+        db, device_id, "network", {g.name: parse_group_members(g.members) for g in network_grps}
+    )
+    svc_group_closures = await load_group_closures(
+        db, device_id, "service", {g.name: parse_group_members(g.members) for g in service_grps}
+    )
     resolver = Resolver()
     resolved_address_map, resolved_service_map = resolver.pre_resolve_objects(
-        network_objs, network_grps, services, service_grps
+        network_objs, network_grps, services, service_grps,
+        net_group_closures=net_group_closures, svc_group_closures=svc_group_closures,
+        predefined_services=predefined_service_values(device.vendor if device else None),
     )
 
-    # 3. 각 정책별 멤버 분석 및 DB 삽입용 데이터 준비
-    addr_rows, svc_rows = [], []
+    # 이전에 실패한 재구축이 남긴 스테이징 행 정리 (채워 넣은 폐포와 함께 커밋)
+    await _clear_staging(db, device_id)
+    await db.commit()
+
+    # 재구축 동안 유지되는 파싱 캐시 (같은 포트/IP 문자열은 한 번만 파싱)
     port_cache: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    ip_cache: Dict[str, Optional[Tuple[int, int, int]]] = {}
+    policy_count = row_count = 0
 
-    for policy in policy_list:
-        policy_addr_rows, policy_svc_rows = compute_policy_member_rows(
-            policy.source, policy.destination, policy.service,
-            resolved_address_map, resolved_service_map, port_cache,
-        )
-        for row in policy_addr_rows:
-            row["device_id"] = device_id
-            row["policy_id"] = policy.id
-            addr_rows.append(row)
-        for row in policy_svc_rows:
-            row["device_id"] = device_id
-            row["policy_id"] = policy.id
-            svc_rows.append(row)
-
-    # 4. 일괄 데이터베이스 작업 (Batch Operation)
-    async with db.begin_nested():
-        policy_ids_to_update = [p.id for p in policy_list]
-
-        # SQLite 변수 제한(SQLITE_MAX_VARIABLES)을 고려하여 청크 단위로 기존 인덱스 삭제
-        if policy_ids_to_update:
-            SQLITE_MAX_VARIABLES = 900
-            for i in range(0, len(policy_ids_to_update), SQLITE_MAX_VARIABLES):
-                chunk = policy_ids_to_update[i:i + SQLITE_MAX_VARIABLES]
-                await db.execute(delete(models.PolicyAddressMember).where(models.PolicyAddressMember.policy_id.in_(chunk)))
-                await db.execute(delete(models.PolicyServiceMember).where(models.PolicyServiceMember.policy_id.in_(chunk)))
-
-        # 대량 삽입(Bulk Insert)으로 성능 최적화
-        if addr_rows:
-            await db.run_sync(
-                lambda sync_session: sync_session.bulk_insert_mappings(models.PolicyAddressMember, addr_rows)
+    chunk = first_chunk
+    while chunk:
+        # 3. 청크 단위 멤버 분석
+        addr_rows, svc_rows, token_rows = [], [], []
+        for policy in chunk:
+            policy_addr_rows, policy_svc_rows = compute_policy_member_rows(
+                policy.source, policy.destination, policy.service,
+                resolved_address_map, resolved_service_map, port_cache, ip_cache,
             )
-        if svc_rows:
-            await db.run_sync(
-                lambda sync_session: sync_session.bulk_insert_mappings(models.PolicyServiceMember, svc_rows)
+            for row in policy_addr_rows:
+                row["device_id"] = device_id
+                row["policy_id"] = policy.id
+                addr_rows.append(row)
+            for row in policy_svc_rows:
+                row["device_id"] = device_id
+                row["policy_id"] = policy.id
+                svc_rows.append(row)
+            for row in compute_policy_token_rows(policy):
+                row["device_id"] = device_id
+                row["policy_id"] = policy.id
+                token_rows.append(row)
+
+        # 4. 스테이징 테이블에 삽입 후 커밋 (쓰기 잠금은 청크 삽입 동안만 유지)
+        for staging, rows in (
+            (models.policy_address_members_staging, addr_rows),
+            (models.policy_service_members_staging, svc_rows),
+            (models.policy_tokens_staging, token_rows),
+            (models.policy_index_staging_ids, [{"device_id": device_id, "policy_id": p.id} for p in chunk]),
+        ):
+            if rows:
+                await db.execute(insert(staging), rows)
+        await db.commit()
+
+        policy_count += len(chunk)
+        row_count += len(addr_rows) + len(svc_rows) + len(token_rows)
+        chunk = await anext(chunks, None)
+
+    # 5. 본 인덱스 교체 (짧은 단일 트랜잭션)
+    swap_started = time.perf_counter()
+    await _swap_staged_indices(db, device_id)
+    await db.commit()
+
+    elapsed = time.perf_counter() - started
+    logging.info(
+        f"Policy index rebuilt for device {device_id}: {policy_count} policies, {row_count} rows "
+        f"in {elapsed:.2f}s ({row_count / elapsed if elapsed else 0:.0f} rows/s, "
+        f"swap {time.perf_counter() - swap_started:.2f}s)"
+    )
+    return policy_count
+
+
+def compute_policy_token_rows(policy: models.Policy) -> List[Dict[str, object]]:
+    """정책의 쉼표 구분 이름 필드(POLICY_TOKEN_FIELDS)를 policy_tokens 삽입용 행으로 분해합니다."""
+    rows: List[Dict[str, object]] = []
+    for field in models.POLICY_TOKEN_FIELDS:
+        for position, token in enumerate(parse_group_members(getattr(policy, field))):
+            rows.append({"field": field, "token": token, "position": position})
+    return rows
+
+
+async def mark_dependent_policies_unindexed(
+    db: AsyncSession,
+    device_id: int,
+    kind: GroupKind,
+    changed_names: Set[str],
+) -> int:
+    """
+    값/멤버가 바뀐 객체·그룹을 직접 또는 그룹을 통해 간접 참조하는 정책을 재인덱싱 대상
+    (is_indexed = False)으로 표시합니다. 커밋은 호출자 책임입니다.
+
+    1. 현재 그룹 구성에서 변경된 이름을 포함하는 모든 상위 그룹을 찾고 (역방향 탐색)
+    2. policy_tokens의 (device_id, field, token) 인덱스로 정책 필드(주소: source/destination,
+       서비스: service)에서 해당 이름들을 참조하는 인덱싱 완료 정책만 골라냅니다.
+       인덱싱 완료 정책의 토큰은 현재 필드 값과 같으므로 정책 전체를 읽지 않아도 됩니다.
+
+    Returns:
+        새로 재인덱싱 대상으로 표시된 정책 수
+    """
+    if not changed_names:
+        return 0
+
+    group_model = models.NetworkGroup if kind == "network" else models.ServiceGroup
+    group_result = await db.execute(
+        select(group_model.name, group_model.members).where(group_model.device_id == device_id)
+    )
+    group_map = {name: parse_group_members(members) for name, members in group_result.all()}
+    affected_names = collect_affected_groups(changed_names, group_map)
+
+    fields = ("source", "destination") if kind == "network" else ("service",)
+    SQLITE_MAX_VARIABLES = 900
+    name_list = list(affected_names)
+    dependent_ids: Set[int] = set()
+    for i in range(0, len(name_list), SQLITE_MAX_VARIABLES):
+        chunk = name_list[i:i + SQLITE_MAX_VARIABLES]
+        token_result = await db.execute(
+            select(models.PolicyToken.policy_id, models.PolicyToken.token)
+            .join(models.Policy, models.Policy.id == models.PolicyToken.policy_id)
+            .where(
+                models.PolicyToken.device_id == device_id,
+                models.PolicyToken.field.in_(fields),
+                models.PolicyToken.token.collate("NOCASE").in_(chunk),
+                models.Policy.is_indexed == True,
             )
+        )
+        # NOCASE 인덱스로 찾은 뒤 객체 이름은 대소문자를 구분해 다시 비교
+        dependent_ids.update(policy_id for policy_id, token in token_result.all() if token in affected_names)
+    if not dependent_ids:
+        return 0
+
+    id_list = list(dependent_ids)
+    for i in range(0, len(id_list), SQLITE_MAX_VARIABLES):
+        chunk = id_list[i:i + SQLITE_MAX_VARIABLES]
+        await db.execute(update(models.Policy).where(models.Policy.id.in_(chunk)).values(is_indexed=False))
+
+    logging.info(
+        f"[indexer] device_id={device_id}: {len(changed_names)} changed {kind} names -> "
+        f"{len(dependent_ids)} dependent policies marked for reindex"
+    )
+    return len(dependent_ids)
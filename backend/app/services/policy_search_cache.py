@@ -0,0 +1,102 @@
+"""
+정책 검색 결과 캐시.
+
+`POST /firewall/policies/search` 응답(JSON 바이트)을 (정규화한 검색 조건, 장비별 데이터 버전)
+키로 보관합니다. 장비 데이터 버전(`devices.data_version`)은 동기화(`sync_data_task`)와
+정책 재인덱싱(`rebuild_policy_indices`)이 데이터와 같은 트랜잭션에서 올리므로, 동기화가
+커밋된 뒤에는 키가 달라져 이전 결과가 조회되지 않습니다. 옛 버전 항목은 LRU로 밀려납니다.
+
+- 용량 제한: 저장된 응답 바이트 합계가 `SEARCH_CACHE_MAX_BYTES`를 넘으면 오래 쓰이지 않은
+  항목부터 제거합니다. 0이면 캐시를 사용하지 않습니다.
+- 프로세스 메모리 캐시이므로 워커마다 따로 유지됩니다. 무효화는 DB 버전으로 판단하므로
+  다른 프로세스(스크립트, 다른 워커)가 동기화해도 오래된 결과가 반환되지 않습니다.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app import schemas
+from app.core.config import settings
+
+CacheKey = Tuple[str, Tuple[Tuple[int, Optional[int]], ...]]
+
+
+def make_search_cache_key(req: schemas.PolicySearchRequest, versions: Dict[int, int]) -> CacheKey:
+    """
+    검색 조건과 장비별 데이터 버전으로 캐시 키를 만듭니다.
+
+    값이 없는 필드는 제외하고 키 순서를 고정해 같은 조건이면 같은 키가 되도록 정규화합니다.
+    장비 순서는 결과(장비 ID 순 정렬)에 영향이 없으므로 정렬해 사용합니다.
+    """
+    filters = req.model_dump(mode="json", exclude_none=True, exclude={"device_ids"})
+    device_versions = tuple((d, versions.get(d)) for d in sorted(set(req.device_ids)))
+    return json.dumps(filters, sort_keys=True, ensure_ascii=False), device_versions
+
+
+class PolicySearchCache:
+    """바이트 용량 상한이 있는 LRU 검색 결과 캐시."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: CacheKey, body: bytes) -> None:
+        # 상한보다 큰 단일 응답은 다른 항목을 모두 밀어내므로 저장하지 않음
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate_device(self, device_id: int) -> None:
+        """장비가 포함된 항목을 모두 제거합니다 (장비 삭제 후 ID 재사용 대비)."""
+        with self._lock:
+            stale = [key for key in self._entries if any(d == device_id for d, _ in key[1])]
+            for key in stale:
+                self._size -= len(self._entries.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+policy_search_cache = PolicySearchCache(settings.SEARCH_CACHE_MAX_BYTES)
@@ -0,0 +1,49 @@
+"""
+벤더별 기본 제공(predefined) 서비스 카탈로그.
+
+정책의 service 필드에는 장비 설정에 서비스 객체로 존재하지 않는 이름이 올 수 있습니다.
+
+- 벤더가 기본 제공하는 서비스 (예: PAN-OS `service-http`, `service-https`)
+- 예약어: `any`(모든 서비스), `application-default`(PAN-OS, 애플리케이션 표준 포트 사용)
+
+정책 인덱서는 기본 제공 서비스를 서비스 객체와 같은 'proto/port' 값으로 펼치고, 예약어는
+센티넬 행(protocol 컬럼에 예약어 저장)으로 남겨 서비스 필터가 모두
+(device_id, protocol, port_start, port_end) 인덱스로 조회되도록 합니다.
+"""
+
+from typing import Dict, Optional, Set, Tuple
+
+ANY_SERVICE = "any"
+APPLICATION_DEFAULT = "application-default"
+
+# 벤더 → 기본 제공 서비스 이름 → 값 (서비스 객체 값과 같은 'proto/port' 형식)
+PREDEFINED_SERVICES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "paloalto": {
+        "service-http": ("tcp/80", "tcp/8080"),
+        "service-https": ("tcp/443",),
+    },
+}
+
+# 포트 없이 프로토콜 이름만으로 검색할 수 있는 값 (예: 'icmp' → protocol = 'icmp'인 모든 멤버)
+PROTOCOL_NAMES = frozenset({"tcp", "udp", "sctp", "icmp", "icmp6"})
+
+
+def predefined_service_values(vendor: Optional[str]) -> Dict[str, Set[str]]:
+    """장비 벤더의 기본 제공 서비스 이름 → 값 집합 (Resolver의 서비스 값 맵 형식). 카탈로그가 없으면 빈 dict."""
+    catalogue = PREDEFINED_SERVICES.get((vendor or "").lower(), {})
+    return {name: set(values) for name, values in catalogue.items()}
+
+
+def lookup_predefined_service(name: str) -> Optional[Set[str]]:
+    """
+    검색어로 쓰인 기본 제공 서비스 이름의 값 집합을 반환합니다 (대소문자 무시).
+
+    검색은 여러 벤더 장비를 함께 대상으로 할 수 있으므로 모든 벤더 카탈로그에서 찾아 합칩니다.
+    """
+    lowered = name.lower()
+    values: Set[str] = set()
+    for catalogue in PREDEFINED_SERVICES.values():
+        for predefined_name, predefined_values in catalogue.items():
+            if predefined_name.lower() == lowered:
+                values.update(predefined_values)
+    return values or None
@@ -14,7 +14,7 @@ from sqlalchemy.future import select
 from app import crud, models, schemas
 from app.core.executors import IO_EXECUTOR
 from app.db.session import SessionLocal
-from app.models.policy_members import PolicyAddressMember, PolicyServiceMember
+from app.models.policy_members import PolicyAddressMember, PolicyServiceMember, PolicyToken
 from app.models.analysis import RedundancyPolicySet
 from app.services.sync.transform import (
     dataframe_to_pydantic,
@@ -23,7 +23,9 @@ from app.services.sync.transform import (
     normalize_value,
 )
 from app.services.sync.collector import create_collector_from_device
-from app.services.policy_indexer import rebuild_policy_indices
+from app.services.policy_indexer import rebuild_policy_indices, mark_dependent_policies_unindexed
+from app.services.group_closure import parse_group_members, refresh_group_closures
+from app.services.object_usage import refresh_object_usage, refresh_usage_for_tokens
 from app.services.audit_log import log_activity
 
 # 동적 세마포어를 위한 전역 변수
@@ -122,6 +124,16 @@ async def sync_data_task(
     model = model_map[data_type]
     key_attribute = get_key_attribute(data_type)
 
+    # 정책 인덱스(주소/서비스 멤버 행)에 영향을 주는 필드.
+    # 이 필드가 바뀌거나 생성/삭제된 객체·그룹을 참조하는 정책만 재인덱싱 대상이 됩니다.
+    index_fields_map = {
+        "network_objects": {"ip_address"},
+        "network_groups": {"members"},
+        "services": {"protocol", "port"},
+        "service_groups": {"members"},
+    }
+    index_fields = index_fields_map.get(data_type, set())
+
     def _make_key(obj: Any) -> Tuple:
         """
         데이터 비교를 위한 고유 키를 생성합니다.
@@ -145,6 +157,8 @@ async def sync_data_task(
             # 변경 사항 저장을 위한 리스트 초기화
             items_to_create, items_to_update, ids_to_delete = [], [], []
             change_logs_to_create = []
+            index_changed_names = set()  # 인덱스 관련 필드가 바뀐 객체/그룹명
+            order_or_hit_changed = False  # 정책 순서·히트 정보만 바뀐 경우 (주요 변경·히트 일시 로그 대상 외)
 
             # 2단계: 신규/수정 데이터 분류
             for key, new_item in items_to_sync_map.items():
@@ -152,6 +166,8 @@ async def sync_data_task(
                 if not existing_item:
                     # --- 신규 데이터 생성 ---
                     items_to_create.append(new_item.model_dump())
+                    if index_fields:
+                        index_changed_names.add(key[-1])
                     change_logs_to_create.append(schemas.ChangeLogCreate(
                         device_id=device_id, data_type=data_type, object_name=key[-1], action="created",
                         details=json.dumps(new_item.model_dump(), default=str)
@@ -225,7 +241,18 @@ async def sync_data_task(
                     # 주요 필드가 바뀌었거나, 정책의 경우 히트 일시가 바뀌었을 때 업데이트 실행
                     needs_update = is_dirty or (data_type == "policies" and 'last_hit_date' in update_data)
 
+                    if is_dirty and any(
+                        normalize_value(update_data.get(k)) != normalize_value(getattr(existing_item, k))
+                        for k in index_fields & fields_to_compare
+                    ):
+                        index_changed_names.add(key[-1])
+
                     if needs_update:
+                        if not (is_dirty or is_hit_date_changed) and any(
+                            normalize_value(update_data.get(k)) != normalize_value(getattr(existing_item, k))
+                            for k in update_data.keys() & {'seq', 'hit_count'}
+                        ):
+                            order_or_hit_changed = True
                         update_data["id"] = existing_item.id
                         if data_type == "policies" and is_dirty:
                             # 주요 정보(Source, Dest 등)가 바뀌면 분석을 위해 인덱싱 필요 표시
@@ -249,6 +276,8 @@ async def sync_data_task(
             for key, existing_item in existing_items_map.items():
                 if key not in items_to_sync_map:
                     ids_to_delete.append(existing_item.id)
+                    if index_fields:
+                        index_changed_names.add(key[-1])
                     # 삭제 시 before 스냅샷 저장 (핵심 필드만)
                     try:
                         before_data = {
@@ -269,11 +298,20 @@ async def sync_data_task(
                 if data_type == "policies":
                     await db.execute(delete(PolicyAddressMember).where(PolicyAddressMember.policy_id.in_(ids_to_delete)))
                     await db.execute(delete(PolicyServiceMember).where(PolicyServiceMember.policy_id.in_(ids_to_delete)))
+                    deleted_tokens = await db.execute(
+                        delete(PolicyToken)
+                        .where(PolicyToken.policy_id.in_(ids_to_delete))
+                        .returning(PolicyToken.field, PolicyToken.token)
+                    )
+                    deleted_tokens = deleted_tokens.all()
                     # SQLite는 PRAGMA foreign_keys=ON이 아니라서 ondelete="CASCADE"가 실제로
                     # 동작하지 않는다. 명시적으로 지우지 않으면 중복분석 결과가 삭제된
                     # policy_id를 참조하는 고아 행으로 남아 이후 export에서 조용히 누락된다.
                     await db.execute(delete(RedundancyPolicySet).where(RedundancyPolicySet.policy_id.in_(ids_to_delete)))
                 await db.execute(delete(model).where(model.id.in_(ids_to_delete)))
+                if data_type == "policies":
+                    # 삭제된 정책이 참조하던 이름의 사용 횟수 갱신
+                    await refresh_usage_for_tokens(db, device_id, deleted_tokens)
 
             # 4-2. 대량 생성 (Bulk Insert)
             if items_to_create:
@@ -287,6 +325,29 @@ async def sync_data_task(
             if change_logs_to_create:
                 await crud.change_log.create_change_logs(db, change_logs=change_logs_to_create)
 
+            # 4-5. 그룹 폐포 갱신 — 멤버 구성이 바뀐 그룹과 그 상위 그룹만 다시 계산 (같은 트랜잭션)
+            if data_type in ("network_groups", "service_groups"):
+                group_kind = "network" if data_type == "network_groups" else "service"
+                old_group_map = {item.name: parse_group_members(item.members) for item in existing_items}
+                refreshed_groups = await refresh_group_closures(
+                    db, device_id, group_kind,
+                    new_group_map={item.name: parse_group_members(item.members) for item in items_to_sync},
+                    old_group_map=old_group_map,
+                )
+                # 바뀐 그룹의 하위 멤버(이전 구성 포함)는 그룹 경유 사용 횟수가 달라질 수 있음
+                if refreshed_groups:
+                    await refresh_object_usage(db, device_id, group_kind, refreshed_groups, old_group_map=old_group_map)
+
+            # 4-6. 바뀐 객체/그룹을 직접 또는 그룹 경유로 참조하는 정책만 재인덱싱 대상으로 표시
+            if index_changed_names:
+                kind = "network" if data_type in ("network_objects", "network_groups") else "service"
+                await mark_dependent_policies_unindexed(db, device_id, kind, index_changed_names)
+
+            # 검색 결과 캐시 무효화 — 실제로 생성·수정·삭제된 데이터가 있을 때만 같은 트랜잭션에서 장비 데이터 버전 증가
+            # (변경 로그는 생성·삭제·주요 필드 수정·히트 일시 변경마다 남음. 재인덱싱은 인덱스 교체 시 별도로 증가)
+            if change_logs_to_create or order_or_hit_changed:
+                await crud.device.bump_data_version(db, device_id)
+
             # 5단계: 최종 커밋 - 모든 작업이 성공해야만 DB에 반영됨
             await db.commit()
 
@@ -455,6 +516,133 @@ async def _update_status(device_id: int, step: str, status: str = "in_progress")
         return device
 
 
+async def _get_collection_fan_out(collector) -> int:
+    """
+    장비 1대의 수집 단계에서 동시에 실행할 export 수를 반환합니다.
+
+    settings 테이블의 sync_collection_concurrency 값(기본 3)을 사용하되, 같은 Collector
+    인스턴스에서 export_*를 동시에 호출할 수 없는 벤더(supports_concurrent_export=False)는 1로 고정합니다.
+    """
+    if not getattr(collector, 'supports_concurrent_export', False):
+        return 1
+    async with SessionLocal() as db:
+        setting = await crud.settings.get_setting(db, key="sync_collection_concurrency")
+    try:
+        return max(1, int(setting.value)) if setting else 3
+    except (TypeError, ValueError):
+        logging.warning(f"[orchestrator] Invalid sync_collection_concurrency value: {setting.value!r}. Using 3.")
+        return 3
+
+
+async def _run_collection_jobs(jobs: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """
+    수집 작업(코루틴 팩토리)들을 최대 limit개씩 동시에 실행하고 이름별 결과를 반환합니다.
+
+    limit이 1이면 jobs 순서대로 하나씩 실행됩니다. 하나라도 실패하면 아직 시작하지 않은
+    작업은 취소하고 첫 예외를 그대로 전파합니다 (이미 executor 스레드에서 실행 중인 export는
+    끝까지 실행되지만 결과는 버려집니다).
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _guarded(job):
+        async with semaphore:
+            return await job()
+
+    tasks = {name: asyncio.create_task(_guarded(job)) for name, job in jobs.items()}
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return {name: task.result() for name, task in tasks.items()}
+
+
+async def _collect_and_merge_hit_dates(
+    collector,
+    device: models.Device,
+    policies_df: pd.DataFrame,
+    loop: asyncio.AbstractEventLoop,
+) -> pd.DataFrame:
+    """
+    (Palo Alto 전용) 정책 히트(사용 이력) 정보를 수집해 정책 DataFrame에 병합합니다.
+
+    수집 실패나 이상(이전엔 있던 이력이 전부 비어 있음)은 경고 로그/활동 로그만 남기고
+    동기화는 계속 진행하며, 이때는 입력 DataFrame을 그대로 반환합니다.
+    """
+    device_id = device.id
+    logging.info(f"[orchestrator] Palo Alto device detected. Starting last_hit_date collection for device_id={device_id}")
+    await _update_status(device_id, "Collecting usage history...")
+    # 수집 실패/이상 여부를 판단하기 위해 기존에 저장돼 있던 사용이력 건수를 먼저 확인
+    previous_hit_date_count = await _get_existing_hit_date_count(device_id)
+    try:
+        vsys_list = policies_df["vsys"].unique().tolist() if "vsys" in policies_df.columns and not policies_df["vsys"].isnull().all() else None
+
+        # 메인과 HA Peer로부터 병렬 수집
+        hit_date_df = await _collect_last_hit_date_parallel(
+            collector=collector,
+            device=device,
+            vsys_list=vsys_list,
+            loop=loop
+        )
+
+        if hit_date_df is not None and not hit_date_df.empty:
+            # 수집된 히트 정보와 정책 목록 병합 처리
+            policies_df = _merge_hit_dates(policies_df, hit_date_df)
+            new_hit_date_count = int(policies_df["last_hit_date"].notna().sum())
+
+            # 히트 정보 수집 완료 상태 업데이트
+            await _update_status(device_id, "Usage history collected")
+
+            # 이전에는 이력이 있었는데 이번 수집 결과가 전부 비어있다면(파싱 실패 등)
+            # 조용히 기존 값을 지우지 말고 경고를 남긴다.
+            if previous_hit_date_count > 0 and new_hit_date_count == 0:
+                logging.warning(
+                    f"[orchestrator] Usage history collected but all last_hit_date values are empty "
+                    f"for device {device_id} (previously {previous_hit_date_count} populated)."
+                )
+                async with SessionLocal() as db:
+                    await log_activity(
+                        db,
+                        title="사용이력 수집 이상 감지",
+                        message=f"'{device.name}' 사용이력 수집 결과가 모두 비어 있습니다 (이전 {previous_hit_date_count}건 보유). 장비 연결/자격 증명을 확인하세요.",
+                        type="warning",
+                        category="sync",
+                        device_id=device_id,
+                        device_name=device.name,
+                    )
+        elif previous_hit_date_count > 0:
+            # 수집 자체가 완전히 비어 반환된 경우 (예외는 아니지만 사실상 실패)
+            logging.warning(
+                f"[orchestrator] No usage history collected for device {device_id}, "
+                f"but device previously had {previous_hit_date_count} populated records."
+            )
+            async with SessionLocal() as db:
+                await log_activity(
+                    db,
+                    title="사용이력 수집 실패",
+                    message=f"'{device.name}' 사용이력을 수집하지 못했습니다 (이전 {previous_hit_date_count}건 보유). 장비 연결/자격 증명을 확인하세요.",
+                    type="warning",
+                    category="sync",
+                    device_id=device_id,
+                    device_name=device.name,
+                )
+    except Exception as e:
+        logging.warning(f"Failed to collect hit dates for device {device_id}: {e}. Continuing sync...", exc_info=True)
+        async with SessionLocal() as db:
+            await log_activity(
+                db,
+                title="사용이력 수집 실패",
+                message=f"'{device.name}' 사용이력 수집 중 오류가 발생했습니다: {str(e)[:200]}",
+                type="warning",
+                category="sync",
+                device_id=device_id,
+                device_name=device.name,
+            )
+    return policies_df
+
+
 def _merge_hit_dates(policies_df: pd.DataFrame, hit_date_df: pd.DataFrame) -> pd.DataFrame:
     """수집된 히트 정보(last_hit_date/hit_count)를 정책 DataFrame에 병합합니다 (순수 pandas 연산)."""
     def normalize_rule_name(name):
@@ -513,14 +701,8 @@ async def _index_and_finalize(device_id: int) -> None:
         await crud.device.update_sync_status(db, device=device, status="in_progress", step="Indexing policies...")
         await db.commit()
 
-        # 변경되었거나 인덱싱되지 않은 정책들 재인덱싱 (Full-text search용)
-        result = await db.execute(select(models.Policy).where(models.Policy.device_id == device_id, models.Policy.is_indexed == False))
-        policies_to_index = result.scalars().all()
-        if policies_to_index:
-            await rebuild_policy_indices(db=db, device_id=device_id, policies=policies_to_index)
-            for p in policies_to_index: p.is_indexed = True
-            db.add_all(policies_to_index)
-            await db.commit()
+        # 변경되었거나 인덱싱되지 않은 정책들 재인덱싱 (Full-text search용, 청크 단위 스트리밍)
+        await rebuild_policy_indices(db=db, device_id=device_id, only_unindexed=True)
 
         # 최종 상태 업데이트: 성공
         device_to_update = await crud.device.get_device(db=db, device_id=device_id)
@@ -581,9 +763,10 @@ async def run_sync_all_orchestrator(device_id: int) -> None:
     프로세스 순서:
     1. 병렬 처리 제한을 위한 세마포어 획득
     2. 장비 연결 및 상태 업데이트 (Connecting...)
-    3. 데이터 수집 시퀀스 실행 (객체 -> 서비스 -> 정책)
-    4. (Palo Alto 한정) 정책 히트 정보 수집 및 병합
-    5. 데이터베이스 동기화 (sync_data_task 호출)
+    3. 데이터 수집 단계: 객체/그룹/서비스/정책 export(Palo Alto는 리소스 한도·시스템 정보 포함)를
+       sync_collection_concurrency 한도 내에서 동시에 실행 (Collector가 동시 호출을 지원하는 경우)
+    4. (Palo Alto 한정) 정책 수집 직후 히트 정보 수집 및 병합
+    5. 데이터베이스 동기화 (sync_data_task 호출, 객체 -> 그룹 -> 서비스 -> 정책 순서)
     6. 정책 전문 검색 인덱스 재구성 (Indexing...)
     7. 최종 상태 업데이트 (Success/Failure)
     
@@ -625,41 +808,14 @@ async def run_sync_all_orchestrator(device_id: int) -> None:
             # 연결 성공 후 상태 업데이트
             device = await _update_status(device_id, "Connected")
 
-            # 3-1. 리소스 한도(임계치) 자동 수집 (Palo Alto 전용, manual 플래그가 False인 항목만 갱신)
-            if device.vendor == 'paloalto':
-                device = await _update_status(device_id, "Collecting resource limits...")
-                try:
-                    limits = await loop.run_in_executor(IO_EXECUTOR, collector.export_resource_limits)
-                    if limits:
-                        async with SessionLocal() as db:
-                            device_row = await crud.device.get_device(db, device_id)
-                            if device_row:
-                                await crud.device.update_collected_thresholds(db, device_row, limits)
-                                await db.commit()
-                except Exception as e:
-                    logging.warning(f"Failed to collect resource limits for device {device_id}: {e}. Continuing sync...", exc_info=True)
-
-                # 3-2. 시스템 기본 정보(hostname/uptime/model/serial/sw-version/multi-vsys) 자동 수집
-                # (Palo Alto 전용, manual 플래그가 False인 항목만 갱신, uptime은 항상 갱신)
-                device = await _update_status(device_id, "Collecting system info...")
-                try:
-                    info = await loop.run_in_executor(IO_EXECUTOR, collector.export_system_info)
-                    if info:
-                        async with SessionLocal() as db:
-                            device_row = await crud.device.get_device(db, device_id)
-                            if device_row:
-                                await crud.device.update_collected_system_info(db, device_row, info)
-                                await db.commit()
-                except Exception as e:
-                    logging.warning(f"Failed to collect system info for device {device_id}: {e}. Continuing sync...", exc_info=True)
-
-            # 4. 데이터 수집 시퀀스 정의 (종속성 관계에 따라 순차 진행)
+            # 4. 수집 단계: 서로 독립적인 export를 장비별 fan-out 한도 내에서 동시에 실행
+            #    (DB 반영은 수집이 모두 끝난 뒤 6단계에서 종속성 순서대로 수행)
             collection_sequence = [
-                ("network_objects", "Collecting network objects...", collector.export_network_objects, schemas.NetworkObjectCreate),
-                ("network_groups", "Collecting network groups...", collector.export_network_group_objects, schemas.NetworkGroupCreate),
-                ("services", "Collecting services...", collector.export_service_objects, schemas.ServiceCreate),
-                ("service_groups", "Collecting service groups...", collector.export_service_group_objects, schemas.ServiceGroupCreate),
-                ("policies", "Collecting policies...", collector.export_security_rules, schemas.PolicyCreate),
+                ("network_objects", collector.export_network_objects, schemas.NetworkObjectCreate),
+                ("network_groups", collector.export_network_group_objects, schemas.NetworkGroupCreate),
+                ("services", collector.export_service_objects, schemas.ServiceCreate),
+                ("service_groups", collector.export_service_group_objects, schemas.ServiceGroupCreate),
+                ("policies", collector.export_security_rules, schemas.PolicyCreate),
             ]
 
             completed_msg_map = {
@@ -670,96 +826,76 @@ async def run_sync_all_orchestrator(device_id: int) -> None:
                 "policies": "Policies collected",
             }
 
-            collected_dfs = {}
-            for data_type, step_msg, export_func, schema_create in collection_sequence:
-                # 상태 업데이트: 각 단계 시작
-                device = await _update_status(device_id, step_msg)
+            is_paloalto = device.vendor == 'paloalto'
+            collect_hit_date = getattr(device, 'collect_last_hit_date', True)
+            fan_out = await _get_collection_fan_out(collector)
+            total_steps = len(collection_sequence)
+            completed_steps = 0
 
-                # 실제 데이터 수집 수행 (Network I/O가 발생하는 부분)
+            async def _collect(data_type: str, export_func) -> pd.DataFrame:
+                nonlocal completed_steps
                 logging.info(f"[orchestrator] Starting export for {data_type}")
                 df = await loop.run_in_executor(IO_EXECUTOR, export_func)
-                collected_dfs[data_type] = pd.DataFrame() if df is None else df
-                logging.info(f"[orchestrator] Export completed for {data_type}, rows: {len(collected_dfs[data_type])}")
+                df = pd.DataFrame() if df is None else df
+                logging.info(f"[orchestrator] Export completed for {data_type}, rows: {len(df)}")
 
-                # 상태 업데이트: 각 단계 완료
-                device = await _update_status(device_id, completed_msg_map.get(data_type, f"{data_type} collected"))
+                # 4-1. (Palo Alto 한정) 정책 수집 직후 히트(사용 이력) 정보를 이어서 수집·병합
+                if data_type == "policies" and is_paloalto and collect_hit_date:
+                    df = await _collect_and_merge_hit_dates(collector, device, df, loop)
 
-            # 5. 후처리: 정책 히트(사용 이력) 정보 수집 (Palo Alto 전용)
-            collect_hit_date = getattr(device, 'collect_last_hit_date', True) if device else True
-            
-            if device.vendor == 'paloalto' and collect_hit_date:
-                logging.info(f"[orchestrator] Palo Alto device detected. Starting last_hit_date collection for device_id={device_id}")
-                device = await _update_status(device_id, "Collecting usage history...")
-                # 수집 실패/이상 여부를 판단하기 위해 기존에 저장돼 있던 사용이력 건수를 먼저 확인
-                previous_hit_date_count = await _get_existing_hit_date_count(device_id)
+                completed_steps += 1
+                await _update_status(device_id, f"{completed_msg_map.get(data_type, f'{data_type} collected')} ({completed_steps}/{total_steps})")
+                return df
+
+            async def _collect_optional(label: str, export_func):
+                """실패해도 동기화를 계속하는 부가 수집 (리소스 한도, 시스템 정보)"""
                 try:
-                    policies_df = collected_dfs["policies"]
-                    vsys_list = policies_df["vsys"].unique().tolist() if "vsys" in policies_df.columns and not policies_df["vsys"].isnull().all() else None
-
-                    # 메인과 HA Peer로부터 병렬 수집
-                    hit_date_df = await _collect_last_hit_date_parallel(
-                        collector=collector,
-                        device=device,
-                        vsys_list=vsys_list,
-                        loop=loop
-                    )
+                    return await loop.run_in_executor(IO_EXECUTOR, export_func)
+                except Exception as e:
+                    logging.warning(f"Failed to collect {label} for device {device_id}: {e}. Continuing sync...", exc_info=True)
+                    return None
 
-                    if hit_date_df is not None and not hit_date_df.empty:
-                        # 수집된 히트 정보와 정책 목록 병합 처리
-                        collected_dfs["policies"] = _merge_hit_dates(policies_df, hit_date_df)
-                        new_hit_date_count = int(collected_dfs["policies"]["last_hit_date"].notna().sum())
-
-                        # 히트 정보 수집 완료 상태 업데이트
-                        device = await _update_status(device_id, "Usage history collected")
-
-                        # 이전에는 이력이 있었는데 이번 수집 결과가 전부 비어있다면(파싱 실패 등)
-                        # 조용히 기존 값을 지우지 말고 경고를 남긴다.
-                        if previous_hit_date_count > 0 and new_hit_date_count == 0:
-                            logging.warning(
-                                f"[orchestrator] Usage history collected but all last_hit_date values are empty "
-                                f"for device {device_id} (previously {previous_hit_date_count} populated)."
-                            )
-                            async with SessionLocal() as db:
-                                await log_activity(
-                                    db,
-                                    title="사용이력 수집 이상 감지",
-                                    message=f"'{device.name}' 사용이력 수집 결과가 모두 비어 있습니다 (이전 {previous_hit_date_count}건 보유). 장비 연결/자격 증명을 확인하세요.",
-                                    type="warning",
-                                    category="sync",
-                                    device_id=device_id,
-                                    device_name=device.name,
-                                )
-                    elif previous_hit_date_count > 0:
-                        # 수집 자체가 완전히 비어 반환된 경우 (예외는 아니지만 사실상 실패)
-                        logging.warning(
-                            f"[orchestrator] No usage history collected for device {device_id}, "
-                            f"but device previously had {previous_hit_date_count} populated records."
-                        )
+            # 가장 오래 걸리는 정책(+사용이력) 수집을 먼저 시작한다
+            jobs = {
+                data_type: (lambda data_type=data_type, export_func=export_func: _collect(data_type, export_func))
+                for data_type, export_func, _ in reversed(collection_sequence)
+            }
+            if is_paloalto:
+                jobs["resource_limits"] = lambda: _collect_optional("resource limits", collector.export_resource_limits)
+                jobs["system_info"] = lambda: _collect_optional("system info", collector.export_system_info)
+
+            step_msg = "Collecting data..." if fan_out <= 1 else f"Collecting data (parallel x{fan_out})..."
+            device = await _update_status(device_id, step_msg)
+            results = await _run_collection_jobs(jobs, fan_out)
+            collected_dfs: Dict[str, pd.DataFrame] = {data_type: results[data_type] for data_type, *_ in collection_sequence}
+
+            # 5. (Palo Alto 한정) 리소스 한도(임계치)·시스템 기본 정보 반영
+            #    (manual 플래그가 False인 항목만 갱신, uptime은 항상 갱신)
+            if is_paloalto:
+                limits = results.get("resource_limits")
+                if limits:
+                    try:
                         async with SessionLocal() as db:
-                            await log_activity(
-                                db,
-                                title="사용이력 수집 실패",
-                                message=f"'{device.name}' 사용이력을 수집하지 못했습니다 (이전 {previous_hit_date_count}건 보유). 장비 연결/자격 증명을 확인하세요.",
-                                type="warning",
-                                category="sync",
-                                device_id=device_id,
-                                device_name=device.name,
-                            )
-                except Exception as e:
-                    logging.warning(f"Failed to collect hit dates for device {device_id}: {e}. Continuing sync...", exc_info=True)
-                    async with SessionLocal() as db:
-                        await log_activity(
-                            db,
-                            title="사용이력 수집 실패",
-                            message=f"'{device.name}' 사용이력 수집 중 오류가 발생했습니다: {str(e)[:200]}",
-                            type="warning",
-                            category="sync",
-                            device_id=device_id,
-                            device_name=device.name,
-                        )
+                            device_row = await crud.device.get_device(db, device_id)
+                            if device_row:
+                                await crud.device.update_collected_thresholds(db, device_row, limits)
+                                await db.commit()
+                    except Exception as e:
+                        logging.warning(f"Failed to save resource limits for device {device_id}: {e}. Continuing sync...", exc_info=True)
+
+                info = results.get("system_info")
+                if info:
+                    try:
+                        async with SessionLocal() as db:
+                            device_row = await crud.device.get_device(db, device_id)
+                            if device_row:
+                                await crud.device.update_collected_system_info(db, device_row, info)
+                                await db.commit()
+                    except Exception as e:
+                        logging.warning(f"Failed to save system info for device {device_id}: {e}. Continuing sync...", exc_info=True)
 
             # 6. DB 동기화 실행 (수집된 데이터를 DB에 반영)
-            for data_type, _, _, schema_create in collection_sequence:
+            for data_type, _, schema_create in collection_sequence:
                 device = await _update_status(device_id, f"Synchronizing {data_type}...")
 
                 df = collected_dfs[data_type]
@@ -29,17 +29,13 @@ async def reindex_device(device_id: int):
 
         print(f"Found device: {device.name} ({device.vendor})")
 
-        policies = await crud.policy.get_policies_by_device(db, device_id=device_id)
+        # Policies are streamed from the database in chunks by the indexer
+        policy_count = await rebuild_policy_indices(db, device_id=device_id)
 
-        if not policies:
+        if not policy_count:
             print("No policies found for this device. Nothing to index.")
             return
 
-        policy_count = len(policies)
-        print(f"Found {policy_count} policies to re-index.")
-
-        await rebuild_policy_indices(db, device_id=device_id, policies=policies)
-
         # Manually commit the session as this is a standalone script
         await db.commit()
 
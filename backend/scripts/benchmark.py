@@ -0,0 +1,430 @@
+"""
+합성 데이터셋 벤치마크: MockFirewall(MockDatasetSpec)로 재현 가능한 규모의 데이터를 만들어
+임시 SQLite DB에서 주요 경로의 실행 시간을 측정하고 JSON으로 출력한다.
+
+측정 대상:
+- sync_data_task (데이터 타입별 최초 적재 / 변경 없는 재동기화)
+- rebuild_policy_indices (전체 정책)
+- crud.policy.search_policies (IP/포트/정책명 조건 몇 가지), 흐름 일괄 조회(flow lookup)
+- services/analysis 의 각 분석기 (중복/논리중복/미사용/미참조 객체/위험 포트/과허용/영향도)
+- run_export_task (source='db', 정책/객체)
+
+DB 파일은 실행마다 임시 디렉터리에 새로 만들며(alembic upgrade head), --keep-db 를 주지 않으면 종료 시 삭제한다.
+--db-path 로 경로를 지정하면 파일을 남겨 두며, 이미 있는 파일은 --overwrite 를 줄 때만 지우고 새로 만든다.
+최적화 전후를 비교할 때는 같은 파라미터(--seed 포함)로 두 번 실행해 JSON을 비교하면 된다.
+
+실행 (프로젝트 루트에서):
+    python backend/scripts/benchmark.py [--rules 5000] [--network-objects 2000] [--group-depth 3]
+        [--group-fanout 5] [--vsys-count 2] [--repeat 3] [--output bench.json] [--only search,analysis]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, fields
+from datetime import datetime
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BACKEND_DIR)
+
+logger = logging.getLogger("benchmark")
+
+# 측정 그룹 이름 (--only 로 일부만 실행)
+GROUPS = ["sync", "index", "search", "analysis", "export"]
+
+# search_policies 측정에 사용할 요청들 (이름, PolicySearchRequest 필드)
+SEARCH_CASES = [
+    ("search.src_ip_host", {"src_ips": ["10.0.0.1"]}),
+    ("search.dst_ip_cidr", {"dst_ips": ["10.0.0.0/8"]}),
+    ("search.dst_ip_only_within", {"dst_ips_only_within": ["100.0.0.0/8"]}),
+    ("search.service_tcp_443", {"services": ["tcp/443"]}),
+    ("search.rule_name_like", {"rule_name": "Rule_1"}),
+    ("search.combined", {"src_ips": ["100.0.0.0/8"], "services": ["tcp/1-1024"], "action": "allow"}),
+]
+
+# 흐름 일괄 조회 측정에 쓰는 흐름 수 (고정 시드로 생성)
+FLOW_LOOKUP_COUNT = 2000
+
+# sync_data_task 는 객체 → 그룹 → 정책 순서로 적재해야 인덱싱/폐포 계산이 성립한다
+SYNC_ORDER = ["network_objects", "network_groups", "services", "service_groups", "policies"]
+
+
+def _base_parser(add_help: bool = True) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="MockFirewall 합성 데이터셋 벤치마크", add_help=add_help)
+    parser.add_argument("--db-path", default=None, help="사용할 SQLite 파일 경로 (미지정 시 임시 파일, 지정한 파일은 종료 후에도 남김)")
+    parser.add_argument("--overwrite", action="store_true", help="--db-path 파일이 이미 있으면 지우고 새로 만듦")
+    parser.add_argument("--keep-db", action="store_true", help="종료 후 임시 DB 파일을 삭제하지 않음")
+    return parser
+
+
+def parse_args():
+    # app 모듈을 import 하면 DB 엔진이 만들어지므로 스펙 인자 정의는 DATABASE_URL 지정 후에 한다
+    from app.services.firewall.vendors.mock import MockDatasetSpec
+
+    parser = _base_parser()
+    for f in fields(MockDatasetSpec):
+        if f.type not in (int, float, 'int', 'float'):
+            continue
+        default = getattr(MockDatasetSpec(), f.name)
+        parser.add_argument(f"--{f.name.replace('_', '-')}", type=type(default), default=default)
+    parser.add_argument("--repeat", type=int, default=3, help="멱등 측정 항목 반복 횟수")
+    parser.add_argument("--unused-days", type=int, default=90)
+    parser.add_argument("--only", default=",".join(GROUPS), help=f"실행할 측정 그룹 (콤마 구분: {','.join(GROUPS)})")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (미지정 시 stdout)")
+    return parser.parse_args()
+
+
+def build_spec(args):
+    from app.services.firewall.vendors.mock import MockDatasetSpec
+
+    values = {f.name: getattr(args, f.name) for f in fields(MockDatasetSpec) if hasattr(args, f.name)}
+    return MockDatasetSpec(**values)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+class Recorder:
+    """측정 결과를 이름별로 모아 요약 통계와 함께 JSON 직렬화 가능한 형태로 만든다."""
+
+    def __init__(self):
+        self.results = []
+
+    async def measure(self, name: str, func, repeat: int = 1, **extra):
+        seconds = []
+        outcome = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            try:
+                outcome = await func()
+            except Exception as e:
+                # 한 시나리오 실패로 전체 측정이 중단되지 않도록 오류를 결과에 기록하고 다음으로 진행
+                entry = {"name": name, "runs": len(seconds), "error": f"{type(e).__name__}: {e}"}
+                entry.update(extra)
+                self.results.append(entry)
+                logger.exception(f"[bench] {name}: 측정 실패")
+                return None
+            seconds.append(time.perf_counter() - started)
+        entry = {
+            "name": name,
+            "runs": len(seconds),
+            "seconds": [round(s, 6) for s in seconds],
+            "min": round(min(seconds), 6),
+            "median": round(statistics.median(seconds), 6),
+            "mean": round(statistics.fmean(seconds), 6),
+        }
+        if isinstance(outcome, int):
+            entry["result_count"] = outcome
+        entry.update(extra)
+        self.results.append(entry)
+        logger.info(f"[bench] {name}: median {entry['median']:.4f}s ({entry['runs']} runs)")
+        return outcome
+
+
+async def create_device() -> int:
+    from app import crud, schemas
+    from app.db.session import SessionLocal
+
+    async with SessionLocal() as db:
+        device = await crud.device.create_device(db, schemas.DeviceCreate(
+            name="bench-mock", ip_address="192.0.2.1", vendor="mock",
+            username="bench", password="bench", password_confirm="bench",
+        ))
+        return device.id
+
+
+def collect_frames(firewall) -> dict:
+    return {
+        "network_objects": firewall.export_network_objects(),
+        "network_groups": firewall.export_network_group_objects(),
+        "services": firewall.export_service_objects(),
+        "service_groups": firewall.export_service_group_objects(),
+        "policies": firewall.export_security_rules(),
+    }
+
+
+def to_items(frames: dict, device_id: int, data_type: str):
+    from app import schemas
+    from app.services.sync.transform import dataframe_to_pydantic
+
+    schema_map = {
+        "network_objects": schemas.NetworkObjectCreate,
+        "network_groups": schemas.NetworkGroupCreate,
+        "services": schemas.ServiceCreate,
+        "service_groups": schemas.ServiceGroupCreate,
+        "policies": schemas.PolicyCreate,
+    }
+    df = frames[data_type].copy()
+    df["device_id"] = device_id
+    return dataframe_to_pydantic(df, schema_map[data_type])
+
+
+async def bench_sync(rec: Recorder, frames: dict, device_id: int):
+    from app.services.sync.tasks import sync_data_task
+
+    for label in ("initial", "unchanged"):
+        for data_type in SYNC_ORDER:
+            items = to_items(frames, device_id, data_type)
+            await rec.measure(
+                f"sync.{label}.{data_type}",
+                lambda: sync_data_task(device_id, data_type, items),
+                rows=len(items),
+            )
+
+
+async def bench_index(rec: Recorder, device_id: int, repeat: int):
+    from app.db.session import SessionLocal
+    from app.services.policy_indexer import rebuild_policy_indices
+
+    async def _run():
+        async with SessionLocal() as db:
+            return await rebuild_policy_indices(db=db, device_id=device_id)
+
+    await rec.measure("index.rebuild_all", _run, repeat=repeat)
+
+
+async def bench_search(rec: Recorder, device_id: int, repeat: int):
+    from app import crud, schemas
+    from app.db.session import SessionLocal
+
+    for name, params in SEARCH_CASES:
+        req = schemas.PolicySearchRequest(device_ids=[device_id], **params)
+
+        async def _run(req=req):
+            async with SessionLocal() as db:
+                return len(await crud.policy.search_policies(db, req))
+
+        await rec.measure(name, _run, repeat=repeat)
+
+    # 첫 실행은 장비별 구간 구조 생성 포함, 이후는 데이터 버전 캐시 재사용
+    from app.services import flow_lookup
+
+    rng = random.Random(0)
+    flows = [
+        schemas.FlowTuple(
+            src_ip=f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            dst_ip=f"100.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            protocol=rng.choice(["tcp", "udp"]),
+            port=rng.choice([22, 53, 80, 443, 3389, rng.randint(1, 65535)]),
+        )
+        for _ in range(FLOW_LOOKUP_COUNT)
+    ]
+    flow_lookup._cache.clear()
+
+    async def _run_flows():
+        async with SessionLocal() as db:
+            index = await flow_lookup.get_device_flow_index(db, device_id)
+            return sum(m.matched for m in flow_lookup.lookup_flows(index, flows))
+
+    await rec.measure("search.flow_lookup", _run_flows, repeat=repeat, flows=FLOW_LOOKUP_COUNT)
+
+
+async def bench_analysis(rec: Recorder, device_id: int, repeat: int, unused_days: int):
+    from sqlalchemy import select
+    from app import models
+    from app.db.session import SessionLocal
+    from app.models.analysis import AnalysisTaskType
+    from app.services.analysis.impact import ImpactAnalyzer
+    from app.services.analysis.over_permissive import OverPermissiveAnalyzer
+    from app.services.analysis.redundancy import RedundancyAnalyzer
+    from app.services.analysis.risky_ports import RiskyPortsAnalyzer
+    from app.services.analysis.unreferenced_objects import UnreferencedObjectsAnalyzer
+    from app.services.analysis.unused import UnusedPolicyAnalyzer
+
+    async with SessionLocal() as db:
+        policy_ids = (await db.execute(
+            select(models.Policy.id)
+            .where(models.Policy.device_id == device_id, models.Policy.enable.is_(True))
+            .order_by(models.Policy.seq)
+        )).scalars().all()
+    if not policy_ids:
+        return
+    # 영향도 분석: 중간 위치 정책을 맨 위로 옮기는 시나리오 (분석기는 활성 정책만 로드하므로 활성 정책 중에서 선택)
+    impact_target = policy_ids[len(policy_ids) // 2]
+    impact_reference = policy_ids[0]
+
+    cases = [
+        ("analysis.redundancy", AnalysisTaskType.REDUNDANCY, lambda db, t: RedundancyAnalyzer(db, t).analyze()),
+        ("analysis.redundancy_logical", AnalysisTaskType.REDUNDANCY, lambda db, t: RedundancyAnalyzer(db, t).analyze_logical()),
+        ("analysis.unused", AnalysisTaskType.UNUSED, lambda db, t: UnusedPolicyAnalyzer(db, t, days=unused_days).analyze()),
+        ("analysis.unreferenced_objects", AnalysisTaskType.UNREFERENCED_OBJECTS, lambda db, t: UnreferencedObjectsAnalyzer(db, t).analyze()),
+        ("analysis.risky_ports", AnalysisTaskType.RISKY_PORTS, lambda db, t: RiskyPortsAnalyzer(db, t).analyze()),
+        ("analysis.over_permissive", AnalysisTaskType.OVER_PERMISSIVE, lambda db, t: OverPermissiveAnalyzer(db, t).analyze()),
+        ("analysis.impact", AnalysisTaskType.IMPACT, lambda db, t: ImpactAnalyzer(
+            db, t, target_policy_ids=[impact_target], reference_policy_id=impact_reference, move_direction="above",
+        ).analyze()),
+    ]
+
+    for name, task_type, run_analyzer in cases:
+        async def _run(task_type=task_type, run_analyzer=run_analyzer):
+            async with SessionLocal() as db:
+                task = models.AnalysisTask(device_id=device_id, task_type=task_type, created_at=datetime.now())
+                db.add(task)
+                await db.flush()
+                results = await run_analyzer(db, task)
+                await db.rollback()
+                return len(results or [])
+
+        await rec.measure(name, _run, repeat=repeat)
+
+
+async def bench_export(rec: Recorder, device_id: int, repeat: int):
+    from app import models
+    from app.db.session import SessionLocal
+    from app.services.export.tasks import run_export_task
+
+    for export_type in ("policies", "objects"):
+        async def _run(export_type=export_type):
+            async with SessionLocal() as db:
+                task = models.ExportTask(
+                    device_ids=[device_id], export_type=export_type, source="db",
+                    merge=False, use_ssh=False, timeout_seconds=600, status="pending",
+                    created_at=datetime.now(),
+                )
+                db.add(task)
+                await db.commit()
+                task_id = task.id
+            await run_export_task(task_id)
+            async with SessionLocal() as db:
+                task = await db.get(models.ExportTask, task_id)
+                status, path = task.status, task.result_file_path
+            # 측정 산출물은 남기지 않는다
+            if path and os.path.exists(path):
+                os.remove(path)
+            if status != "success":
+                raise RuntimeError(f"export {export_type} 실패: {status}")
+
+        await rec.measure(f"export.{export_type}", _run, repeat=repeat)
+
+
+async def dataset_counts(device_id: int) -> dict:
+    from sqlalchemy import func, select
+    from app import models
+    from app.db.session import SessionLocal
+
+    counted = {
+        "policies": models.Policy,
+        "network_objects": models.NetworkObject,
+        "network_groups": models.NetworkGroup,
+        "services": models.Service,
+        "service_groups": models.ServiceGroup,
+        "policy_address_members": models.PolicyAddressMember,
+        "policy_service_members": models.PolicyServiceMember,
+    }
+    counts = {}
+    async with SessionLocal() as db:
+        for key, model in counted.items():
+            counts[key] = (await db.execute(
+                select(func.count()).select_from(model).where(model.device_id == device_id)
+            )).scalar_one()
+    return counts
+
+
+async def run(args, spec) -> dict:
+    from app.services.firewall.vendors.mock import MockFirewall
+
+    selected = {g.strip() for g in args.only.split(",") if g.strip()}
+    rec = Recorder()
+    device_id = await create_device()
+
+    started = time.perf_counter()
+    frames = collect_frames(MockFirewall("bench-mock", "bench", "bench", spec=spec))
+    generate_seconds = time.perf_counter() - started
+
+    # 이후 단계는 적재된 데이터가 필요하므로 sync 측정을 빼더라도 적재는 수행한다
+    if "sync" in selected:
+        await bench_sync(rec, frames, device_id)
+    else:
+        from app.services.sync.tasks import sync_data_task
+        for data_type in SYNC_ORDER:
+            await sync_data_task(device_id, data_type, to_items(frames, device_id, data_type))
+
+    # 검색/분석은 인덱스가 있어야 의미가 있으므로 index 측정을 빼더라도 1회는 수행한다
+    if "index" in selected:
+        await bench_index(rec, device_id, args.repeat)
+    else:
+        await bench_index(Recorder(), device_id, 1)
+
+    if "search" in selected:
+        await bench_search(rec, device_id, args.repeat)
+    if "analysis" in selected:
+        await bench_analysis(rec, device_id, args.repeat, args.unused_days)
+    if "export" in selected:
+        await bench_export(rec, device_id, args.repeat)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spec": asdict(spec),
+            "repeat": args.repeat,
+            "generate_seconds": round(generate_seconds, 6),
+            "dataset": await dataset_counts(device_id),
+        },
+        "results": rec.results,
+    }
+
+
+def main():
+    # 분석기 등 앱 내부 로그는 측정 출력을 가리지 않도록 WARNING 이상만 표시
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stderr)
+    logger.setLevel(logging.INFO)
+    pre_parser = _base_parser(add_help=False)
+    pre_args, _ = pre_parser.parse_known_args()
+
+    # 직접 만든 임시 디렉터리만 종료 시 지운다 (사용자가 지정한 경로는 운영 DB일 수 있음)
+    temp_dir = None
+    if pre_args.db_path:
+        db_path = os.path.abspath(pre_args.db_path)
+        existing = [db_path + suffix for suffix in ("", "-wal", "-shm") if os.path.exists(db_path + suffix)]
+        if existing:
+            if not pre_args.overwrite:
+                pre_parser.error(f"--db-path 파일이 이미 있습니다: {db_path} (덮어쓰려면 --overwrite)")
+            for path in existing:
+                os.remove(path)
+    else:
+        temp_dir = tempfile.mkdtemp(prefix="fat-bench-")
+        db_path = os.path.join(temp_dir, "bench.db")
+    # app 모듈(세션/엔진)이 로드되기 전에 DB 경로를 지정해야 한다
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+
+    args = parse_args()
+    spec = build_spec(args)
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, check=True, capture_output=True)
+
+    try:
+        report = asyncio.run(run(args, spec))
+    finally:
+        if temp_dir and not args.keep_db:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    report["meta"]["db_path"] = None if temp_dir and not args.keep_db else db_path
+    payload = json.dumps(report, ensure_ascii=False, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+        logger.info(f"[bench] 결과 저장: {args.output}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -97,7 +97,7 @@ export const getPolicyHistory = async (deviceId: number, ruleName: string): Prom
   return res.data
 }
 
-export interface ObjectUsageCount { device_id: number; name: string; member_type: 'address' | 'service'; policy_count: number }
+export interface ObjectUsageCount { device_id: number; name: string; member_type: 'address' | 'service'; policy_count: number; group_policy_count: number }
 
 export const getObjectUsageCounts = async (deviceIds: number[]): Promise<ObjectUsageCount[]> => {
   const q = deviceIds.map(id => `device_ids=${id}`).join('&')
@@ -11,7 +11,7 @@ import { listDevices } from '@/api/devices'
 import { useDeviceStore } from '@/store/deviceStore'
 import {
   getNetworkObjects, getNetworkGroups, getServices, getServiceGroups, exportToExcel,
-  getObjectUsageCounts,
+  getObjectUsageCounts, type ObjectUsageCount,
   type NetworkObject, type NetworkGroup, type Service, type ServiceGroup,
 } from '@/api/firewall'
 import { queryKeys } from '@/api/queryKeys'
@@ -82,19 +82,19 @@ export function ObjectsPage() {
     staleTime: 60_000,
   })
 
-  // key: "{device_id}_{name}" → policy_count (address용, service용 분리)
+  // key: "{device_id}_{name}" → 사용 횟수 (address용, service용 분리)
   const addrUsageMap = useMemo(() => {
-    const m = new Map<string, number>()
+    const m = new Map<string, ObjectUsageCount>()
     for (const u of usageCounts) {
-      if (u.member_type === 'address') m.set(`${u.device_id}_${u.name}`, u.policy_count)
+      if (u.member_type === 'address') m.set(`${u.device_id}_${u.name}`, u)
     }
     return m
   }, [usageCounts])
 
   const svcUsageMap = useMemo(() => {
-    const m = new Map<string, number>()
+    const m = new Map<string, ObjectUsageCount>()
     for (const u of usageCounts) {
-      if (u.member_type === 'service') m.set(`${u.device_id}_${u.name}`, u.policy_count)
+      if (u.member_type === 'service') m.set(`${u.device_id}_${u.name}`, u)
     }
     return m
   }, [usageCounts])
@@ -160,17 +160,24 @@ export function ObjectsPage() {
     ),
   })
 
-  const usageCol = <T extends { device_id: number; name: string }>(usageMap: Map<string, number>): ColDef<T> => ({
+  // 값은 직접 참조 횟수, 그룹을 통해서만 쓰이는 객체는 그룹 경유 정책 수를 함께 표시
+  const usageCol = <T extends { device_id: number; name: string }>(usageMap: Map<string, ObjectUsageCount>): ColDef<T> => ({
     headerName: '사용 정책',
     filter: 'agNumberColumnFilter',
-    width: 100,
+    width: 120,
     sort: 'asc' as const,
-    valueGetter: (p) => usageMap.get(`${(p.data as T)?.device_id}_${(p.data as T)?.name}`) ?? 0,
-    cellRenderer: (p: { value: number }) => {
-      if (p.value === 0) {
+    valueGetter: (p) => usageMap.get(`${(p.data as T)?.device_id}_${(p.data as T)?.name}`)?.policy_count ?? 0,
+    cellRenderer: (p: { value: number; data?: T }) => {
+      const viaGroup = usageMap.get(`${p.data?.device_id}_${p.data?.name}`)?.group_policy_count ?? 0
+      if (p.value === 0 && viaGroup === 0) {
         return <span className="inline-flex items-center px-2 py-0.5 rounded text-[10px] font-bold bg-red-100 text-red-600">미사용</span>
       }
-      return <span className="text-[12px] font-semibold tabular-nums text-ds-on-surface">{p.value}</span>
+      return (
+        <span className="text-[12px] font-semibold tabular-nums text-ds-on-surface">
+          {p.value}
+          {viaGroup > 0 && <span className="ml-1 text-[10px] font-normal text-ds-on-surface-variant" title="그룹을 통해 참조하는 정책 수">(그룹 {viaGroup})</span>}
+        </span>
+      )
     },
   })
 
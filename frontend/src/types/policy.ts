@@ -76,6 +76,7 @@ export interface PolicySearchRequest {
   service_names_exclude?: string[]
   skip?: number
   limit?: number
+  cursor?: string
   filter_expression?: FilterExprNode
 }
 
@@ -94,4 +95,5 @@ export interface PolicyHistoryEntry extends ChangeLogEntry {
 export interface PolicySearchResponse {
   policies: Policy[]
   valid_object_names: string[]
+  next_cursor?: string | null
 }